@@ -36,6 +36,7 @@ from .client import (
     MemoryGraphClient,
     create_client,
     quick_store_memory,
+    bulk_store_memories,
 )
 
 __all__ = [
@@ -43,6 +44,7 @@ __all__ = [
     "MemoryGraphClient",
     "create_client",
     "quick_store_memory",
+    "bulk_store_memories",
     # Enums
     "EntityType",
     "SourceType",
@@ -0,0 +1,268 @@
+"""Scalar plasticity math on primitive floats and integer curve codes.
+
+These functions hold the arithmetic behind PlasticityConfig's curve and decay
+methods. They take no enums, configs or callbacks, so the config methods stay
+thin wrappers and the same math can be reused by batch code paths.
+
+The batch kernels also accept NumPy arrays and then return arrays computed
+in vectorized form. NumPy is never imported here: an array can only be
+passed in if the caller already imported it.
+"""
+
+import math
+import sys
+from operator import mul
+from typing import Callable, List, Sequence
+
+# Bound once at import. math.exp2 is Python 3.11+; 2.0 ** x is the 3.10 fallback.
+_exp2 = getattr(math, "exp2", lambda x: 2.0 ** x)
+_log1p = math.log1p
+
+# Integer codes for Curve members (see plasticity._CURVE_CODES)
+CURVE_LINEAR = 0
+CURVE_EXPONENTIAL = 1
+CURVE_LOGARITHMIC = 2
+
+
+def _ndarray_module(values):
+    """The numpy module if values is a NumPy array, else None."""
+    np = sys.modules.get("numpy")
+    return np if np is not None and isinstance(values, np.ndarray) else None
+
+
+def clamp_steepness(steepness: float) -> float:
+    """Clamp raw curve steepness to the usable 0.1-0.9 range."""
+    return max(0.1, min(0.9, steepness))
+
+
+def half_life_cycles(half_life: float) -> int:
+    """Convert 0-1 half_life to effective cycles (0.1 = 10 cycles, 0.5 = 50 cycles)."""
+    return max(1, int(half_life * 100))
+
+
+def boost_and_clamp(base: float, max_strength: float, min_strength: float,
+                    similarity: float) -> float:
+    """Raise base toward max_strength by similarity (0-1), then clamp to [min, max].
+
+    e.g. base=0.5, max=1.0, similarity=0.8 -> 0.5 + (0.5 * 0.8) = 0.9
+    """
+    boosted = base + (max_strength - base) * similarity
+    # Same result as min(max_strength, max(min_strength, boosted)), without the builtin calls
+    boosted = boosted if boosted > min_strength else min_strength
+    return boosted if boosted < max_strength else max_strength
+
+
+def boost_and_clamp_batch(bases: Sequence[float], max_strength: float, min_strength: float,
+                          similarities: Sequence[float]) -> List[float]:
+    """boost_and_clamp over parallel sequences of bases and similarities."""
+    np = _ndarray_module(bases)
+    if np is not None:
+        boosted = bases + (max_strength - bases) * np.asarray(similarities, dtype=float)
+        return np.clip(boosted, min_strength, max_strength, out=boosted)
+    return [min(max_strength, max(min_strength, b + (max_strength - b) * sim))
+            for b, sim in zip(bases, similarities)]
+
+
+def initial_bases(explicit: Sequence[bool], explicit_base: float,
+                  implicit_base: float) -> List[float]:
+    """Base strength per connection: explicit_base where explicit, else implicit_base."""
+    np = _ndarray_module(explicit)
+    if np is not None:
+        return np.where(explicit, explicit_base, implicit_base).astype(float)
+    return [explicit_base if e else implicit_base for e in explicit]
+
+
+def apply_curve(curve_code: int, steepness: float, exponent: float, amount: float,
+                strength: float, for_increase: bool) -> float:
+    """Scale a plasticity amount by the curve at the given strength.
+
+    Args:
+        curve_code: One of CURVE_LINEAR, CURVE_EXPONENTIAL, CURVE_LOGARITHMIC
+        steepness: Steepness already passed through clamp_steepness
+        exponent: 1.0 / steepness (0.1 -> 10, 0.5 -> 2, 0.9 -> 1.1)
+        amount: Base amount before curve adjustment
+        strength: Current connection strength (0-1)
+        for_increase: True if strengthening, False if weakening
+    """
+    if curve_code == CURVE_LINEAR:
+        return amount
+
+    if curve_code == CURVE_EXPONENTIAL:
+        # Exponential: faster changes near the starting point
+        s_pow = strength ** exponent
+        # Harder to strengthen strong connections / weaken weak ones (symmetrical)
+        factor = 1.0 - s_pow if for_increase else s_pow
+        return amount * max(0.1, factor)
+
+    # CURVE_LOGARITHMIC: slower changes near the starting point, faster near limits
+    if for_increase:
+        factor = (1.0 - steepness) + (strength * steepness)
+    else:
+        factor = steepness + ((1.0 - strength) * (1.0 - steepness))
+    return amount * factor
+
+
+def effective_decay(curve_code: int, base: float, effective_half_life: int,
+                    strength: float, cycles: int) -> float:
+    """Amount to subtract from a strength after the given number of decay cycles.
+
+    Args:
+        curve_code: Decay curve code
+        base: decay_amount * learning_rate
+        effective_half_life: Half-life in cycles (see half_life_cycles)
+        strength: Current connection strength
+        cycles: Number of decay cycles elapsed
+    """
+    if curve_code == CURVE_LINEAR:
+        return min(1.0, base * cycles)
+    if curve_code == CURVE_EXPONENTIAL:
+        return strength * (1.0 - _exp2(-cycles / effective_half_life))
+    return min(1.0, base * _log1p(cycles))
+
+
+def curve_fn(curve_code: int, steepness: float, exponent: float,
+             for_increase: bool) -> Callable[[float, float], float]:
+    """apply_curve specialized to one curve and direction, as fn(amount, strength).
+
+    The curve branch and direction are resolved here, once, so each call of
+    the returned function is only the arithmetic. The constants are closure
+    cells, and floors/caps use conditional expressions rather than the
+    min/max builtins, which cost more than the arithmetic they guard.
+    """
+    if curve_code == CURVE_LINEAR:
+        return lambda amount, strength: amount
+
+    if curve_code == CURVE_EXPONENTIAL:
+        if for_increase:
+            def increase(amount, strength):
+                factor = 1.0 - strength ** exponent
+                return amount * (factor if factor > 0.1 else 0.1)
+            return increase
+
+        def decrease(amount, strength):
+            factor = strength ** exponent
+            return amount * (factor if factor > 0.1 else 0.1)
+        return decrease
+
+    if for_increase:
+        offset, slope = 1.0 - steepness, steepness
+        return lambda amount, strength: amount * (offset + strength * slope)
+    slope = 1.0 - steepness
+    return lambda amount, strength: amount * (steepness + (1.0 - strength) * slope)
+
+
+def decay_fn(curve_code: int, effective_half_life: int) -> Callable[[float, float, int], float]:
+    """effective_decay specialized to one decay curve, as fn(base, strength, cycles)."""
+    if curve_code == CURVE_LINEAR:
+        def linear(base, strength, cycles):
+            amount = base * cycles
+            return amount if amount < 1.0 else 1.0
+        return linear
+    if curve_code == CURVE_EXPONENTIAL:
+        return lambda base, strength, cycles: strength * (1.0 - _exp2(-cycles / effective_half_life))
+
+    def logarithmic(base, strength, cycles):
+        amount = base * _log1p(cycles)
+        return amount if amount < 1.0 else 1.0
+    return logarithmic
+
+
+def apply_curve_batch(curve_code: int, steepness: float, exponent: float, amount: float,
+                      strengths: Sequence[float], for_increase: bool) -> List[float]:
+    """apply_curve over many strengths, with curve invariants computed once."""
+    np = _ndarray_module(strengths)
+    if np is not None:
+        return _apply_curve_array(np, curve_code, steepness, exponent, amount, strengths, for_increase)
+
+    if curve_code == CURVE_LINEAR:
+        return [amount] * len(strengths)
+
+    if curve_code == CURVE_EXPONENTIAL:
+        if for_increase:
+            return [amount * max(0.1, 1.0 - s ** exponent) for s in strengths]
+        return [amount * max(0.1, s ** exponent) for s in strengths]
+
+    if for_increase:
+        offset, slope = 1.0 - steepness, steepness
+        return [amount * (offset + s * slope) for s in strengths]
+    slope = 1.0 - steepness
+    return [amount * (steepness + (1.0 - s) * slope) for s in strengths]
+
+
+def _apply_curve_array(np, curve_code, steepness, exponent, amount, strengths, for_increase):
+    """apply_curve_batch for a NumPy array of strengths."""
+    if curve_code == CURVE_LINEAR:
+        return np.full(strengths.shape, amount, dtype=float)
+
+    if curve_code == CURVE_EXPONENTIAL:
+        s_pow = np.power(strengths, exponent)
+        factor = 1.0 - s_pow if for_increase else s_pow
+        return amount * np.maximum(0.1, factor)
+
+    if for_increase:
+        return amount * ((1.0 - steepness) + strengths * steepness)
+    return amount * (steepness + (1.0 - strengths) * (1.0 - steepness))
+
+
+def decay_factor(curve_code: int, base: float, effective_half_life: int, cycles: int) -> float:
+    """Per-tick decay constant shared by every strength decayed for `cycles` cycles.
+
+    For exponential decay this is the fraction of strength removed; for linear
+    and logarithmic decay it is the absolute amount removed.
+    """
+    if curve_code == CURVE_EXPONENTIAL:
+        return 1.0 - _exp2(-cycles / effective_half_life)
+    if curve_code == CURVE_LINEAR:
+        return min(1.0, base * cycles)
+    return min(1.0, base * _log1p(cycles))
+
+
+def apply_decay_factor_batch(curve_code: int, factor: float, strengths: Sequence[float],
+                             threshold: float, decay_all: bool) -> List[float]:
+    """Decay amounts for many strengths from a precomputed decay_factor.
+
+    Strengths above threshold get 0.0 unless decay_all is set.
+    """
+    np = _ndarray_module(strengths)
+    if np is not None:
+        if curve_code == CURVE_EXPONENTIAL:
+            amounts = strengths * factor
+        else:
+            amounts = np.full(strengths.shape, factor, dtype=float)
+        return amounts if decay_all else np.where(strengths <= threshold, amounts, 0.0)
+
+    if curve_code == CURVE_EXPONENTIAL:
+        if decay_all:
+            return [s * factor for s in strengths]
+        return [s * factor if s <= threshold else 0.0 for s in strengths]
+
+    # Linear and logarithmic decay do not depend on the strength itself
+    if decay_all:
+        return [factor] * len(strengths)
+    return [factor if s <= threshold else 0.0 for s in strengths]
+
+
+def unit_vector(vector):
+    """Scale an embedding to length 1 so dot products are cosine similarities.
+
+    NumPy arrays stay arrays; anything else becomes a list of floats. Zero
+    vectors are returned unscaled.
+    """
+    np = _ndarray_module(vector)
+    if np is not None:
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm else vector
+    vector = [float(x) for x in vector]
+    norm = math.sqrt(sum(x * x for x in vector))
+    return [x / norm for x in vector] if norm else vector
+
+
+def cosine_batch(left: Sequence, right: Sequence) -> List[float]:
+    """Similarity of each pair of unit vectors, floored at 0 (no negative boost)."""
+    if not left:
+        return []
+    np = _ndarray_module(left[0])
+    if np is not None:
+        dots = np.einsum('ij,ij->i', np.stack(left), np.stack(right))
+        return np.maximum(dots, 0.0).tolist()
+    return [max(0.0, sum(map(mul, a, b))) for a, b in zip(left, right)]
@@ -1,9 +1,18 @@
 """MemoryGraphClient — core graph database client for Axons memory system."""
 
+import importlib.util
+import inspect
 import json
 import os
+import re
+import warnings
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import wraps
+from itertools import islice
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Tuple
 from pathlib import Path
 
 import real_ladybug
@@ -20,6 +29,712 @@ from .models import (
 from .plasticity import PlasticityConfig
 from .permeability import PermeabilityMixin
 
+# Bump whenever initialize_schema's tables, columns or migrations change, so
+# databases stamped with an older version run the full initialization again
+_SCHEMA_VERSION = 1
+
+# Maximum number of prepared statements kept per client (LRU)
+_STATEMENT_CACHE_SIZE = 256
+
+# Maximum number of find-or-create lookups (e.g. concept name -> ID) kept per client (LRU)
+_LOOKUP_CACHE_SIZE = 10_000
+
+# pyarrow is optional (pip install axons[arrow]); bulk reads use it when present
+_HAVE_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+# Table name in a "CREATE ... TABLE IF NOT EXISTS <name>" statement
+_DDL_TABLE_NAME = re.compile(r"TABLE IF NOT EXISTS (\w+)")
+
+# Clauses that modify the graph; a statement containing one invalidates cached reads
+_WRITE_CLAUSE = re.compile(r"\b(?:CREATE|MERGE|SET|DELETE|REMOVE|DROP|ALTER|COPY)\b", re.IGNORECASE)
+
+# Node tables, in creation order
+_NODE_TABLES = [
+    """CREATE NODE TABLE IF NOT EXISTS Memory (
+        id STRING PRIMARY KEY,
+        content STRING,
+        summary STRING,
+        created STRING,
+        lastAccessed STRING,
+        accessCount INT64,
+        confidence DOUBLE,
+        permeability STRING,
+        permBits INT8
+    )""",
+    """CREATE NODE TABLE IF NOT EXISTS Concept (
+        id STRING PRIMARY KEY,
+        name STRING,
+        description STRING,
+        created STRING
+    )""",
+    """CREATE NODE TABLE IF NOT EXISTS Keyword (
+        id STRING PRIMARY KEY,
+        term STRING,
+        created STRING
+    )""",
+    """CREATE NODE TABLE IF NOT EXISTS Topic (
+        id STRING PRIMARY KEY,
+        name STRING,
+        description STRING,
+        created STRING
+    )""",
+    """CREATE NODE TABLE IF NOT EXISTS Entity (
+        id STRING PRIMARY KEY,
+        name STRING,
+        type STRING,
+        description STRING,
+        aliases STRING[],
+        created STRING
+    )""",
+    """CREATE NODE TABLE IF NOT EXISTS Source (
+        id STRING PRIMARY KEY,
+        type STRING,
+        reference STRING,
+        title STRING,
+        reliability DOUBLE,
+        created STRING
+    )""",
+    """CREATE NODE TABLE IF NOT EXISTS Decision (
+        id STRING PRIMARY KEY,
+        description STRING,
+        rationale STRING,
+        date STRING,
+        outcome STRING,
+        reversible BOOLEAN
+    )""",
+    """CREATE NODE TABLE IF NOT EXISTS Goal (
+        id STRING PRIMARY KEY,
+        description STRING,
+        status STRING,
+        priority INT64,
+        targetDate STRING,
+        created STRING
+    )""",
+    """CREATE NODE TABLE IF NOT EXISTS Question (
+        id STRING PRIMARY KEY,
+        text STRING,
+        status STRING,
+        answeredDate STRING,
+        created STRING
+    )""",
+    """CREATE NODE TABLE IF NOT EXISTS Context (
+        id STRING PRIMARY KEY,
+        name STRING,
+        type STRING,
+        description STRING,
+        status STRING,
+        created STRING
+    )""",
+    """CREATE NODE TABLE IF NOT EXISTS Preference (
+        id STRING PRIMARY KEY,
+        category STRING,
+        preference STRING,
+        strength DOUBLE,
+        observations INT64,
+        created STRING
+    )""",
+    """CREATE NODE TABLE IF NOT EXISTS TemporalMarker (
+        id STRING PRIMARY KEY,
+        type STRING,
+        description STRING,
+        startDate STRING,
+        endDate STRING,
+        created STRING
+    )""",
+    """CREATE NODE TABLE IF NOT EXISTS Contradiction (
+        id STRING PRIMARY KEY,
+        description STRING,
+        resolution STRING,
+        status STRING,
+        created STRING
+    )""",
+    """CREATE NODE TABLE IF NOT EXISTS Compartment (
+        id STRING PRIMARY KEY,
+        name STRING,
+        permeability STRING,
+        allowExternalConnections BOOLEAN,
+        description STRING,
+        created STRING
+    )""",
+    # Internal: records the schema version this database was initialized with
+    """CREATE NODE TABLE IF NOT EXISTS AxonsSchema (
+        key STRING PRIMARY KEY,
+        version INT64,
+        searchIndex BOOLEAN
+    )"""
+]
+
+# Relationship tables with properties for brain-like plasticity
+# Edge weights enable Hebbian learning, decay, and relevance-based retrieval
+_REL_TABLES = [
+    # Memory associations with strength/relevance weights
+    "CREATE REL TABLE IF NOT EXISTS HAS_CONCEPT (FROM Memory TO Concept, relevance DOUBLE)",
+    "CREATE REL TABLE IF NOT EXISTS HAS_KEYWORD (FROM Memory TO Keyword)",
+    "CREATE REL TABLE IF NOT EXISTS BELONGS_TO (FROM Memory TO Topic, isPrimary BOOLEAN)",
+    "CREATE REL TABLE IF NOT EXISTS MENTIONS (FROM Memory TO Entity, role STRING)",
+    "CREATE REL TABLE IF NOT EXISTS FROM_SOURCE (FROM Memory TO Source, excerpt STRING)",
+    "CREATE REL TABLE IF NOT EXISTS IN_CONTEXT (FROM Memory TO Context)",
+    "CREATE REL TABLE IF NOT EXISTS INFORMED (FROM Memory TO Decision)",
+    "CREATE REL TABLE IF NOT EXISTS PARTIALLY_ANSWERS (FROM Memory TO Question, completeness DOUBLE)",
+    "CREATE REL TABLE IF NOT EXISTS SUPPORTS (FROM Memory TO Goal, strength DOUBLE)",
+    "CREATE REL TABLE IF NOT EXISTS REVEALS (FROM Memory TO Preference)",
+    "CREATE REL TABLE IF NOT EXISTS OCCURRED_DURING (FROM Memory TO TemporalMarker)",
+    # Memory-to-memory with synaptic-like strength and permeability for data flow control
+    "CREATE REL TABLE IF NOT EXISTS RELATES_TO (FROM Memory TO Memory, strength DOUBLE, relType STRING, permeability STRING)",
+    # Compartmentalization - memory isolation and data flow control
+    "CREATE REL TABLE IF NOT EXISTS IN_COMPARTMENT (FROM Memory TO Compartment)",
+    # Concept relationships
+    "CREATE REL TABLE IF NOT EXISTS CONCEPT_RELATED_TO (FROM Concept TO Concept, relType STRING)",
+    # Goal/Decision/Context hierarchies
+    "CREATE REL TABLE IF NOT EXISTS DEPENDS_ON (FROM Goal TO Goal)",
+    "CREATE REL TABLE IF NOT EXISTS LED_TO (FROM Decision TO Decision)",
+    "CREATE REL TABLE IF NOT EXISTS PART_OF (FROM Context TO Context)",
+    # Contradiction tracking
+    "CREATE REL TABLE IF NOT EXISTS CONFLICTS_WITH (FROM Contradiction TO Memory)",
+    "CREATE REL TABLE IF NOT EXISTS SUPERSEDES (FROM Contradiction TO Memory)"
+]
+
+# Table name -> DDL, and the full script for an empty database, built once at import
+_SCHEMA_TABLES: Dict[str, str] = {
+    _DDL_TABLE_NAME.search(stmt).group(1): stmt for stmt in _NODE_TABLES + _REL_TABLES
+}
+_SCHEMA_DDL = ";\n".join(_SCHEMA_TABLES.values())
+
+
+# Static Cypher templates for the create, compartment and link methods, keyed
+# by operation. Built once at import so each call passes the same string to
+# the prepared-statement cache instead of a fresh literal.
+_Q: Dict[str, str] = {
+    "create_memory": """
+    CREATE (m:Memory {
+        id: $id,
+        content: $content,
+        summary: $summary,
+        created: $created,
+        lastAccessed: $last_accessed,
+        accessCount: $access_count,
+        confidence: $confidence,
+        permeability: $permeability,
+        permBits: $perm_bits
+    })
+    """,
+    "create_memories": """
+    UNWIND $rows AS r
+    CREATE (m:Memory {
+        id: r.id,
+        content: r.content,
+        summary: r.summary,
+        created: r.created,
+        lastAccessed: r.last_accessed,
+        accessCount: r.access_count,
+        confidence: r.confidence,
+        permeability: r.permeability,
+        permBits: r.perm_bits
+    })
+    """,
+    # Lookup nodes (see _LOOKUP_LABELS) are inserted directly only when the
+    # lookup cache proves they are new; otherwise create_* runs the
+    # find-or-create form built from these below
+    "insert_concept": """
+    CREATE (n:Concept {
+        id: $id,
+        name: $name,
+        description: $description,
+        created: $created
+    })
+    """,
+    "insert_keyword": """
+    CREATE (n:Keyword {
+        id: $id,
+        term: $term,
+        created: $created
+    })
+    """,
+    "insert_topic": """
+    CREATE (n:Topic {
+        id: $id,
+        name: $name,
+        description: $description,
+        created: $created
+    })
+    """,
+    "insert_entity": """
+    CREATE (n:Entity {
+        id: $id,
+        name: $name,
+        type: $type,
+        description: $description,
+        aliases: $aliases,
+        created: $created
+    })
+    """,
+    "insert_source": """
+    CREATE (n:Source {
+        id: $id,
+        type: $type,
+        reference: $reference,
+        title: $title,
+        reliability: $reliability,
+        created: $created
+    })
+    """,
+    "create_decision": """
+    CREATE (d:Decision {
+        id: $id,
+        description: $description,
+        rationale: $rationale,
+        date: $date,
+        outcome: $outcome,
+        reversible: $reversible
+    })
+    """,
+    "create_goal": """
+    CREATE (g:Goal {
+        id: $id,
+        description: $description,
+        status: $status,
+        priority: $priority,
+        targetDate: $target_date,
+        created: $created
+    })
+    """,
+    "create_question": """
+    CREATE (q:Question {
+        id: $id,
+        text: $text,
+        status: $status,
+        answeredDate: $answered_date,
+        created: $created
+    })
+    """,
+    "insert_context": """
+    CREATE (n:Context {
+        id: $id,
+        name: $name,
+        type: $type,
+        description: $description,
+        status: $status,
+        created: $created
+    })
+    """,
+    "create_preference_check": """
+    MATCH (p:Preference)
+    WHERE p.category = $category AND p.preference = $preference
+    RETURN p.id AS id, p.strength AS strength, p.observations AS observations
+    """,
+    "create_preference_update": """
+    MATCH (p:Preference {id: $id})
+    SET p.observations = $observations, p.strength = $strength
+    """,
+    "create_preference": """
+    CREATE (p:Preference {
+        id: $id,
+        category: $category,
+        preference: $preference,
+        strength: $strength,
+        observations: $observations,
+        created: $created
+    })
+    """,
+    "create_temporal_marker": """
+    CREATE (t:TemporalMarker {
+        id: $id,
+        type: $type,
+        description: $description,
+        startDate: $start_date,
+        endDate: $end_date,
+        created: $created
+    })
+    """,
+    "create_contradiction": """
+    CREATE (c:Contradiction {
+        id: $id,
+        description: $description,
+        resolution: $resolution,
+        status: $status,
+        created: $created
+    })
+    """,
+    # Compartments are lookup nodes keyed by name (see _LOOKUP_LABELS)
+    "insert_compartment": """
+    CREATE (n:Compartment {
+        id: $id,
+        name: $name,
+        permeability: $permeability,
+        allowExternalConnections: $allow_external,
+        description: $description,
+        created: $created
+    })
+    """,
+    "get_compartment": """
+    MATCH (c:Compartment {id: $id})
+    RETURN c.id AS id, c.name AS name, c.permeability AS permeability,
+           c.allowExternalConnections AS allowExternalConnections,
+           c.description AS description, c.created AS created
+    """,
+    "delete_compartment_check": """
+    MATCH (m:Memory)-[:IN_COMPARTMENT]->(c:Compartment {id: $id})
+    RETURN COUNT(m) AS count
+    """,
+    # IN_COMPARTMENT is the only relationship touching Compartment, so DETACH
+    # removes the memberships and the node in one statement
+    "delete_compartment": "MATCH (c:Compartment {id: $id}) DETACH DELETE c",
+    "remove_memory_from_compartment": """
+    UNWIND $mids AS mid
+    MATCH (m:Memory {id: mid})-[r:IN_COMPARTMENT]->(c:Compartment {id: $cid})
+    DELETE r
+    """,
+    "remove_memory_from_all_compartments": """
+    UNWIND $mids AS mid
+    MATCH (m:Memory {id: mid})-[r:IN_COMPARTMENT]->()
+    DELETE r
+    """,
+    "add_memory_to_compartment": """
+    UNWIND $mids AS mid
+    MATCH (m:Memory {id: mid}), (c:Compartment {id: $cid})
+    MERGE (m)-[:IN_COMPARTMENT]->(c)
+    """,
+    "get_memory_compartments": """
+    MATCH (m:Memory {id: $mid})-[:IN_COMPARTMENT]->(c:Compartment)
+    RETURN c.id AS id, c.name AS name, c.permeability AS permeability,
+           c.allowExternalConnections AS allowExternalConnections
+    """,
+    "get_memories_in_compartment": """
+    MATCH (m:Memory)-[:IN_COMPARTMENT]->(c:Compartment {id: $cid})
+    RETURN m.id AS id, m.summary AS summary, m.content AS content,
+           m.created AS created, m.confidence AS confidence
+    LIMIT $limit
+    """,
+    "link_memory_to_concept": """
+    MATCH (m:Memory), (c:Concept)
+    WHERE m.id = $memory_id AND c.id = $concept_id
+    MERGE (m)-[r:HAS_CONCEPT]->(c)
+    ON CREATE SET r.relevance = $relevance
+    """,
+    "link_memory_to_keyword": """
+    MATCH (m:Memory), (k:Keyword)
+    WHERE m.id = $memory_id AND k.id = $keyword_id
+    MERGE (m)-[:HAS_KEYWORD]->(k)
+    """,
+    "link_memory_to_topic": """
+    MATCH (m:Memory), (t:Topic)
+    WHERE m.id = $memory_id AND t.id = $topic_id
+    MERGE (m)-[r:BELONGS_TO]->(t)
+    ON CREATE SET r.isPrimary = $is_primary
+    """,
+    "link_memory_to_entity": """
+    MATCH (m:Memory), (e:Entity)
+    WHERE m.id = $memory_id AND e.id = $entity_id
+    MERGE (m)-[r:MENTIONS]->(e)
+    ON CREATE SET r.role = $role
+    """,
+    "link_memory_to_source": """
+    MATCH (m:Memory), (s:Source)
+    WHERE m.id = $memory_id AND s.id = $source_id
+    MERGE (m)-[r:FROM_SOURCE]->(s)
+    ON CREATE SET r.excerpt = $excerpt
+    """,
+    "link_memory_to_context": """
+    MATCH (m:Memory), (c:Context)
+    WHERE m.id = $memory_id AND c.id = $context_id
+    MERGE (m)-[:IN_CONTEXT]->(c)
+    """,
+    "link_memory_to_decision": """
+    MATCH (m:Memory), (d:Decision)
+    WHERE m.id = $memory_id AND d.id = $decision_id
+    MERGE (m)-[:INFORMED]->(d)
+    """,
+    "link_memory_to_question": """
+    MATCH (m:Memory), (q:Question)
+    WHERE m.id = $memory_id AND q.id = $question_id
+    MERGE (m)-[r:PARTIALLY_ANSWERS]->(q)
+    ON CREATE SET r.completeness = $completeness
+    """,
+    "link_memory_to_goal": """
+    MATCH (m:Memory), (g:Goal)
+    WHERE m.id = $memory_id AND g.id = $goal_id
+    MERGE (m)-[r:SUPPORTS]->(g)
+    ON CREATE SET r.strength = $strength
+    """,
+    "link_memory_to_preference": """
+    MATCH (m:Memory), (p:Preference)
+    WHERE m.id = $memory_id AND p.id = $preference_id
+    MERGE (m)-[:REVEALS]->(p)
+    """,
+    "link_memory_to_temporal": """
+    MATCH (m:Memory), (t:TemporalMarker)
+    WHERE m.id = $memory_id AND t.id = $temporal_id
+    MERGE (m)-[:OCCURRED_DURING]->(t)
+    """,
+    "link_memory_to_concepts_batch": """
+    UNWIND $concept_ids AS cid
+    MATCH (m:Memory {id: $memory_id}), (c:Concept {id: cid})
+    MERGE (m)-[r:HAS_CONCEPT]->(c)
+    ON CREATE SET r.relevance = $relevance
+    """,
+    "link_memory_to_keywords_batch": """
+    UNWIND $keyword_ids AS kid
+    MATCH (m:Memory {id: $memory_id}), (k:Keyword {id: kid})
+    MERGE (m)-[:HAS_KEYWORD]->(k)
+    """,
+    "link_memory_to_topics_batch": """
+    UNWIND $topic_ids AS tid
+    MATCH (m:Memory {id: $memory_id}), (t:Topic {id: tid})
+    MERGE (m)-[r:BELONGS_TO]->(t)
+    ON CREATE SET r.isPrimary = (tid = $primary_id)
+    """,
+    "link_memory_to_entities_batch": """
+    UNWIND $entity_ids AS eid
+    MATCH (m:Memory {id: $memory_id}), (e:Entity {id: eid})
+    MERGE (m)-[r:MENTIONS]->(e)
+    ON CREATE SET r.role = $role
+    """,
+    "link_memories": """
+    MATCH (m1:Memory), (m2:Memory)
+    WHERE m1.id = $id1 AND m2.id = $id2
+    MERGE (m1)-[r:RELATES_TO]->(m2)
+    ON CREATE SET r.strength = $strength, r.relType = $relType, r.permeability = $perm
+    """,
+    "link_memories_batch": """
+    UNWIND $rows AS l
+    MATCH (m1:Memory {id: l.id1}), (m2:Memory {id: l.id2})
+    MERGE (m1)-[r:RELATES_TO]->(m2)
+    ON CREATE SET r.strength = l.strength, r.relType = $relType, r.permeability = $perm
+    """,
+    "link_concepts": """
+    MATCH (c1:Concept), (c2:Concept)
+    WHERE c1.id = $id1 AND c2.id = $id2
+    MERGE (c1)-[r:CONCEPT_RELATED_TO]->(c2)
+    ON CREATE SET r.relType = $relType
+    """,
+    "link_goals": """
+    MATCH (g1:Goal), (g2:Goal)
+    WHERE g1.id = $id1 AND g2.id = $id2
+    MERGE (g1)-[:DEPENDS_ON]->(g2)
+    """,
+    "link_decisions": """
+    MATCH (d1:Decision), (d2:Decision)
+    WHERE d1.id = $id1 AND d2.id = $id2
+    MERGE (d1)-[:LED_TO]->(d2)
+    """,
+    "link_contexts": """
+    MATCH (p:Context), (c:Context)
+    WHERE p.id = $parent_id AND c.id = $child_id
+    MERGE (c)-[:PART_OF]->(p)
+    """,
+    "mark_contradiction": """
+    MATCH (c:Contradiction {id: $cid})
+    UNWIND [$mid1, $mid2] AS mid
+    MATCH (m:Memory {id: mid})
+    MERGE (c)-[:CONFLICTS_WITH]->(m)
+    """,
+    "resolve_contradiction": """
+    MATCH (c:Contradiction {id: $cid})
+    SET c.status = 'resolved', c.resolution = $resolution
+    WITH c
+    MATCH (m:Memory {id: $mid})
+    MERGE (c)-[:SUPERSEDES]->(m)
+    """,
+}
+
+
+# Lookup node label -> (_Q key suffix, properties that identify a node). These
+# labels are find-or-create: creating one whose key exists returns the old ID
+_LOOKUP_LABELS = {
+    "Concept": ("concept", ("name",)),
+    "Keyword": ("keyword", ("term",)),
+    "Topic": ("topic", ("name",)),
+    "Entity": ("entity", ("name", "type")),
+    "Source": ("source", ("reference", "type")),
+    "Context": ("context", ("name", "type")),
+    "Compartment": ("compartment", ("name",)),
+}
+
+
+def _find_or_create_query(label: str, name: str, props: tuple) -> str:
+    """Build the single-statement find-or-create query for a lookup label.
+
+    MERGE cannot match on the lookup key because LadybugDB needs the primary
+    key to create, so the second branch only creates when the first found
+    nothing. Either way row 0 holds the ID.
+    """
+    key = ", ".join(f"{p}: ${p}" for p in props)
+    return f"""
+    MATCH (found:{label} {{{key}}}) RETURN found.id AS id
+    UNION ALL
+    OPTIONAL MATCH (found:{label} {{{key}}}) WITH found WHERE found IS NULL
+    {_Q[f"insert_{name}"].strip()} RETURN n.id AS id
+    """
+
+
+def _find_batch_query(label: str, props: tuple) -> str:
+    """Build the query that looks up many lookup nodes by key in one call."""
+    key = ", ".join(f"{p}: k.{p}" for p in props)
+    columns = ", ".join(f"n.{p} AS k{i}" for i, p in enumerate(props))
+    return f"UNWIND $keys AS k MATCH (n:{label} {{{key}}}) RETURN n.id AS id, {columns}"
+
+
+_Q.update({
+    f"create_{name}": _find_or_create_query(label, name, props)
+    for label, (name, props) in _LOOKUP_LABELS.items()
+})
+_Q.update({
+    f"find_{name}_batch": _find_batch_query(label, props)
+    for label, (name, props) in _LOOKUP_LABELS.items()
+})
+# Every node of a lookup label, for loading it into the lookup cache
+_Q.update({
+    f"index_{name}": "MATCH (n:{}) RETURN n.id AS id, {} LIMIT $limit".format(
+        label, ", ".join(f"n.{p} AS k{i}" for i, p in enumerate(props)))
+    for label, (name, props) in _LOOKUP_LABELS.items()
+})
+# UNWIND form of each insert: $param becomes the row field r.param
+_Q.update({
+    f"insert_{name}_batch": "UNWIND $rows AS r" + re.sub(r"\$(\w+)", r"r.\1", _Q[f"insert_{name}"])
+    for name, _ in _LOOKUP_LABELS.values()
+})
+# Memories linked to one concept, keyword or topic (matched on its ID) or to
+# entities of one name, most recently accessed first
+_Q.update({
+    f"memories_by_{name}": f"""
+    MATCH (m:Memory)-[:{rel}]->(n:{label} {{{key}: $key}})
+    RETURN m.id AS id, m.content AS content, m.summary AS summary,
+           m.created AS created, m.lastAccessed AS lastAccessed,
+           m.accessCount AS accessCount, m.confidence AS confidence
+    ORDER BY m.lastAccessed DESC
+    LIMIT $limit
+    """ for name, rel, label, key in [
+        ("concept", "HAS_CONCEPT", "Concept", "id"),
+        ("keyword", "HAS_KEYWORD", "Keyword", "id"),
+        ("topic", "BELONGS_TO", "Topic", "id"),
+        ("entity", "MENTIONS", "Entity", "name"),
+    ]
+})
+
+# Memories sharing a concept (tier 0), keyword (tier 1) or topic (tier 2) with
+# $id, in one round trip. Each branch is limited separately so a large topic
+# cannot crowd out the closer concept matches.
+_RELATED_MEMORIES_QUERY = " UNION ALL ".join(f"""
+    MATCH (m:Memory {{id: $id}})-[:{rel}]->(:{label})<-[:{rel}]-(related:Memory)
+    WHERE related.id <> $id
+    WITH DISTINCT related
+    RETURN related.id AS id, related.content AS content, related.summary AS summary,
+           related.created AS created, related.lastAccessed AS lastAccessed,
+           related.accessCount AS accessCount, related.confidence AS confidence,
+           {tier} AS tier
+    LIMIT $limit
+    """ for tier, (rel, label) in enumerate([
+        ("HAS_CONCEPT", "Concept"), ("HAS_KEYWORD", "Keyword"), ("BELONGS_TO", "Topic"),
+    ]))
+
+# Node types holding graph data (every node table except the AxonsSchema stamp)
+_NODE_TYPES = (
+    "Memory", "Concept", "Keyword", "Topic", "Entity", "Source",
+    "Decision", "Goal", "Question", "Context", "Preference",
+    "TemporalMarker", "Contradiction", "Compartment",
+)
+
+_NODE_COUNTS_QUERY = " UNION ALL ".join(
+    f"MATCH (n:{nt}) RETURN '{nt}' AS type, count(n) AS cnt" for nt in _NODE_TYPES)
+
+# One multi-label statement, so the AxonsSchema stamp survives
+_DELETE_ALL_QUERY = f"MATCH (n:{':'.join(_NODE_TYPES)}) DETACH DELETE n"
+
+# Properties listed per node type in the directory index.
+_SUMMARY_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "Memory": ("id", "summary", "content", "created"),
+    "Concept": ("id", "name", "description", "created"),
+    "Keyword": ("id", "term", "created"),
+    "Topic": ("id", "name", "description", "created"),
+    "Entity": ("id", "name", "type", "description", "created"),
+    "Source": ("id", "type", "reference", "title", "created"),
+    "Decision": ("id", "description", "rationale", "date"),
+    "Goal": ("id", "description", "status", "priority", "created"),
+    "Question": ("id", "text", "status", "created"),
+    "Context": ("id", "name", "type", "status", "created"),
+    "Preference": ("id", "category", "preference", "strength", "created"),
+    "TemporalMarker": ("id", "type", "description", "created"),
+    "Contradiction": ("id", "description", "status", "created"),
+    "Compartment": ("id", "name", "permeability", "allowExternalConnections", "description", "created"),
+}
+
+
+def _summary_query(node_types: Tuple[str, ...]) -> str:
+    """Summary rows of the given node types in one scan.
+
+    A multi-label MATCH binds n to any of the tables, and properties a
+    table lacks come back as NULL.
+    """
+    return "MATCH (n:{}) RETURN label(n) AS label, {}".format(
+        ":".join(node_types),
+        ", ".join(f"n.{p} AS {p}" for p in dict.fromkeys(
+            p for node_type in node_types for p in _SUMMARY_FIELDS[node_type])))
+
+
+_SUMMARY_QUERY = _summary_query(_NODE_TYPES)
+
+
+def _strength_indicator(strength: Optional[float]) -> str:
+    """Sign of a preference strength as +, - or ~ (neutral or unset)."""
+    strength = strength or 0
+    return "+" if strength > 0 else "-" if strength < 0 else "~"
+
+
+# Sections of the markdown directory, in render order:
+# node type -> (heading, formatter for one summary row)
+_DIRECTORY_SECTIONS = {
+    "Compartment": ("Compartments", lambda i: (
+        f"- `{str(i['id'])[:8]}` **{i['name']}** "
+        f"({i['permeability']}, ext:{'yes' if i['allowExternalConnections'] else 'no'})")),
+    "Concept": ("Concepts", lambda i: f"- `{str(i['id'])[:8]}` **{i['name']}**"),
+    "Topic": ("Topics", lambda i: f"- `{str(i['id'])[:8]}` **{i['name']}**"),
+    "Keyword": ("Keywords", lambda i: f"- `{str(i['id'])[:8]}` {i['term']}"),
+    "Entity": ("Entities", lambda i: f"- `{str(i['id'])[:8]}` **{i['name']}** ({i['type']})"),
+    "Goal": ("Goals", lambda i: f"- `{str(i['id'])[:8]}` [{i['status']}] {str(i['description'])[:50]}"),
+    "Question": ("Questions", lambda i: f"- `{str(i['id'])[:8]}` [{i['status']}] {str(i['text'])[:50]}"),
+    "Context": ("Contexts", lambda i: f"- `{str(i['id'])[:8]}` **{i['name']}** ({i['type']}) [{i['status']}]"),
+    "Preference": ("Preferences", lambda i: (
+        f"- `{str(i['id'])[:8]}` [{i['category']}] "
+        f"{_strength_indicator(i['strength'])} {i['preference']}")),
+}
+
+
+@dataclass(slots=True)
+class _CachedStatement:
+    """A prepared statement, whether it writes, and (once run) its result column names."""
+    prepared: Any
+    columns: Optional[tuple] = None
+    writes: bool = False
+
+
+def _cached_read(copy):
+    """Cache a read method's result per arguments until the client's next write.
+
+    Positional and keyword arguments are bound against the method signature
+    with defaults applied, so f(), f(None) and f(x=None) share one entry;
+    bound values must be hashable. Every call returns copy(cached value), so
+    callers can mutate what they get without corrupting the cache.
+    """
+    def decorator(method):
+        signature = inspect.signature(method)
+
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            key = (method.__name__, *tuple(bound.arguments.values())[1:])
+            cached = self._read_cache.get(key)
+            if cached is None or cached[0] != self._write_version:
+                cached = self._read_cache[key] = (self._write_version, method(self, *args, **kwargs))
+            return copy(cached[1])
+        return wrapper
+    return decorator
+
+
+def _copy_summary(summary: Dict[str, List[Dict]]) -> Dict[str, List[Dict]]:
+    """Copy a get_all_nodes_summary result down to its row dicts."""
+    return {label: [dict(row) for row in rows] for label, rows in summary.items()}
+
 
 class MemoryGraphClient(PermeabilityMixin):
     """Client for interacting with the LadybugDB memory database."""
@@ -45,6 +760,13 @@ class MemoryGraphClient(PermeabilityMixin):
         self.plasticity = plasticity_config or PlasticityConfig.default()
         self._access_cycle = 0  # Track access cycles for decay calculations
         self._active_compartment_id: Optional[str] = None  # Active compartment for new memories
+        self._statements: "OrderedDict[str, _CachedStatement]" = OrderedDict()  # Query text -> statement
+        self._lookup_ids: "OrderedDict[tuple, str]" = OrderedDict()  # (label, key...) -> node ID
+        self._indexed_labels: set = set()  # Lookup labels whose every node is in _lookup_ids
+        self._unindexed_labels: set = set()  # Lookup labels too large to hold in _lookup_ids
+        self._write_version = 0  # Bumped by every write; stamps entries in _read_cache
+        self._in_transaction = False  # Inside a transaction() block
+        self._read_cache: Dict[tuple, tuple] = {}  # (method name, args...) -> (write version, result)
 
     def _check_closed(self):
         """Raise RuntimeError if client has been closed."""
@@ -55,6 +777,9 @@ class MemoryGraphClient(PermeabilityMixin):
         """Close the database connection."""
         self._closed = True
         # LadybugDB connections are automatically managed, but we can clear references
+        self._statements.clear()
+        self._forget_lookups()
+        self._read_cache.clear()
         self.conn = None
         self.db = None
 
@@ -78,36 +803,264 @@ class MemoryGraphClient(PermeabilityMixin):
         """Roll back the current transaction."""
         self._check_closed()
         self.conn.execute("ROLLBACK")
+        self._forget_uncommitted()
+
+    def _forget_uncommitted(self):
+        """Drop client-side state that may describe writes which never committed."""
+        # Nodes created inside the transaction are gone; forget their IDs
+        self._forget_lookups()
+        # Reads cached inside the transaction may have seen those writes
+        self._write_version += 1
+
+    @contextmanager
+    def transaction(self):
+        """Run the enclosed writes as one transaction, committed once on exit.
+
+        Rolls back and re-raises if the block raises. Grouping an ingest's
+        writes this way pays for one commit instead of one per statement.
+        A nested transaction() block joins the enclosing transaction.
+
+        Example:
+            with client.transaction():
+                memory_id = client.create_memory(memory)
+                client.link_memory_to_concepts_batch(memory_id, concept_ids)
+        """
+        if self._in_transaction:
+            yield self
+            return
+        self.begin_transaction()
+        self._in_transaction = True
+        try:
+            yield self
+        except BaseException:
+            self.rollback()
+            raise
+        finally:
+            self._in_transaction = False
+        try:
+            self.commit()
+        except BaseException:
+            # A failed COMMIT may leave the transaction open; nothing from the
+            # block is known to be durable either way
+            try:
+                self.conn.execute("ROLLBACK")
+            except Exception:
+                pass  # Already rolled back by the database
+            self._forget_uncommitted()
+            raise
+
+    def _prepare(self, query: str) -> _CachedStatement:
+        """Return a cached prepared statement for the query text, preparing it on first use.
+
+        Parsing and planning happen once per distinct query; later calls only
+        bind parameters. Statements that fail to prepare are not cached.
+        """
+        cached = self._statements.get(query)
+        if cached is not None:
+            self._statements.move_to_end(query)
+            return cached
+        with warnings.catch_warnings():
+            # LadybugDB marks the separate prepare step deprecated; it is still the
+            # only way to skip re-planning repeated queries
+            warnings.simplefilter("ignore", DeprecationWarning)
+            statement = self.conn.prepare(query)
+        if not statement.is_success():
+            raise RuntimeError(statement.get_error_message())
+        cached = self._statements[query] = _CachedStatement(
+            statement, writes=bool(_WRITE_CLAUSE.search(query)))
+        if len(self._statements) > _STATEMENT_CACHE_SIZE:
+            self._statements.popitem(last=False)
+        return cached
+
+    def _execute(self, query: str, parameters: Optional[Dict[str, Any]]):
+        """Execute a query through the statement cache; return (result, column names).
+
+        Column names belong to the query, so they are read from the first
+        result and reused for every later execution of the same statement.
+        """
+        self._check_closed()
+        cached = self._prepare(query)
+        if cached.writes:
+            self._write_version += 1
+        result = self.conn.execute(cached.prepared, parameters or {})
+        if cached.columns is None:
+            cached.columns = tuple(result.get_column_names())
+        return result, cached.columns
+
+    def _find_or_create(self, label: str, parameters: Dict[str, Any]) -> str:
+        """Return the ID of the lookup node matching parameters, creating it if absent.
+
+        IDs are cached by lookup key. The first miss for a label loads every
+        node of that label into the cache when it fits, after which a miss
+        proves the node is new and it is inserted without a lookup scan
+        (LadybugDB has no secondary indexes on non-key properties).
+        """
+        name, props = _LOOKUP_LABELS[label]
+        lookup_key = (label, *(parameters[p] for p in props))
+        node_id = self._lookup_ids.get(lookup_key)
+        if node_id is None and label not in self._indexed_labels \
+                and label not in self._unindexed_labels:
+            self._index_label(label)
+            node_id = self._lookup_ids.get(lookup_key)
+        if node_id is not None:
+            self._lookup_ids.move_to_end(lookup_key)
+            return node_id
+
+        if label in self._indexed_labels:
+            self._run_write(_Q[f"insert_{name}"], parameters)
+            node_id = parameters["id"]
+        else:
+            node_id = self._run_query(_Q[f"create_{name}"], parameters)[0]["id"]
+        self._remember_lookup(lookup_key, node_id)
+        return node_id
+
+    def _find_or_create_many(self, label: str, rows: List[Dict[str, Any]]) -> List[str]:
+        """Batch form of _find_or_create: one lookup query and one insert at most.
+
+        Returns one ID per input row, in order. Rows sharing a lookup key
+        resolve to the same node.
+        """
+        if not rows:
+            return []
+        name, props = _LOOKUP_LABELS[label]
+        keys = [(label, *(row[p] for p in props)) for row in rows]
+        if label not in self._indexed_labels and label not in self._unindexed_labels:
+            self._index_label(label)
+
+        ids: Dict[tuple, str] = {}
+        missing: Dict[tuple, Dict[str, Any]] = {}
+        for key, row in zip(keys, rows):
+            node_id = self._lookup_ids.get(key)
+            if node_id is not None:
+                self._lookup_ids.move_to_end(key)
+                ids[key] = node_id
+            else:
+                missing.setdefault(key, row)
+
+        if missing and label not in self._indexed_labels:
+            found = self._run_query(_Q[f"find_{name}_batch"], {
+                "keys": [{p: row[p] for p in props} for row in missing.values()]
+            })
+            for r in found:
+                key = (label, *(r[f"k{i}"] for i in range(len(props))))
+                if missing.pop(key, None) is not None:
+                    ids[key] = r["id"]
+                    self._remember_lookup(key, r["id"])
+
+        if missing:
+            self._run_write(_Q[f"insert_{name}_batch"], {"rows": list(missing.values())})
+            for key, row in missing.items():
+                ids[key] = row["id"]
+                self._remember_lookup(key, row["id"])
+
+        return [ids[key] for key in keys]
+
+    def _lookup_id(self, label: str, *key: Any) -> Optional[str]:
+        """Return the ID of the lookup node with the given key values, or None.
+
+        Reads go through the same cache as _find_or_create, so callers can
+        match the node on its primary key instead of scanning its label.
+        """
+        name, props = _LOOKUP_LABELS[label]
+        lookup_key = (label, *key)
+        if label not in self._indexed_labels and label not in self._unindexed_labels:
+            self._index_label(label)
+        node_id = self._lookup_ids.get(lookup_key)
+        if node_id is not None:
+            self._lookup_ids.move_to_end(lookup_key)
+            return node_id
+        if label in self._indexed_labels:
+            return None
+        rows = self._run_query(_Q[f"find_{name}_batch"], {"keys": [dict(zip(props, key))]})
+        if not rows:
+            return None
+        self._remember_lookup(lookup_key, rows[0]["id"])
+        return rows[0]["id"]
+
+    def _index_label(self, label: str):
+        """Load every node of a lookup label into the cache, if the label fits its share."""
+        name, props = _LOOKUP_LABELS[label]
+        budget = _LOOKUP_CACHE_SIZE // len(_LOOKUP_LABELS)
+        rows = self._run_query(_Q[f"index_{name}"], {"limit": budget + 1})
+        if len(rows) > budget:
+            self._unindexed_labels.add(label)
+            return
+        self._indexed_labels.add(label)
+        for row in rows:
+            self._remember_lookup((label, *(row[f"k{i}"] for i in range(len(props)))), row["id"])
+
+    def _remember_lookup(self, lookup_key: tuple, node_id: str):
+        """Cache a lookup node ID, evicting the least recently used entry when full."""
+        self._lookup_ids[lookup_key] = node_id
+        if len(self._lookup_ids) > _LOOKUP_CACHE_SIZE:
+            evicted_label = self._lookup_ids.popitem(last=False)[0][0]
+            # The label's cache is no longer complete; stop trusting misses for it
+            if evicted_label in self._indexed_labels:
+                self._indexed_labels.discard(evicted_label)
+                self._unindexed_labels.add(evicted_label)
+
+    def _forget_lookup(self, label: str, node_id: str):
+        """Drop the cached lookup entry for a deleted node, if it is cached."""
+        for lookup_key, cached_id in self._lookup_ids.items():
+            if cached_id == node_id and lookup_key[0] == label:
+                del self._lookup_ids[lookup_key]
+                return
+
+    def _forget_lookups(self):
+        """Drop all cached lookup node IDs, e.g. after nodes may have been removed."""
+        self._lookup_ids.clear()
+        self._indexed_labels.clear()
+        self._unindexed_labels.clear()
 
     def _run_query(self, query: str, parameters: Dict[str, Any] = None) -> List[Dict]:
         """Execute a Cypher query and return results."""
-        self._check_closed()
-        if parameters:
-            result = self.conn.execute(query, parameters)
-        else:
-            result = self.conn.execute(query)
+        result, col_names = self._execute(query, parameters)
 
+        # Direct loop rather than list(_iter_rows(...)): skips a generator
+        # resume per row on the most common read path
         rows = []
+        append = rows.append
         while result.has_next():
-            row = result.get_next()
-            col_names = result.get_column_names()
-            row_dict = {}
-            for i, name in enumerate(col_names):
-                row_dict[name] = row[i]
-            rows.append(row_dict)
+            append(dict(zip(col_names, result.get_next())))
         return rows
 
+    def _run_query_arrow(self, query: str, parameters: Dict[str, Any] = None):
+        """Execute a Cypher query and return the whole result as a pyarrow.Table.
+
+        Columns are materialized in bulk by the database instead of one dict
+        per row, which pays off for large scans and analytics. Requires the
+        optional pyarrow dependency (pip install axons[arrow]).
+        """
+        result, _ = self._execute(query, parameters)
+        return result.get_as_arrow()
+
+    def _run_query_iter(self, query: str, parameters: Dict[str, Any] = None) -> Iterator[Dict]:
+        """Execute a Cypher query and yield result rows lazily.
+
+        The query runs immediately, so errors surface at the call; only the
+        row conversion is deferred until the caller iterates.
+        """
+        result, col_names = self._execute(query, parameters)
+        return self._iter_rows(result, col_names)
+
+    @staticmethod
+    def _iter_rows(result, col_names: tuple) -> Iterator[Dict]:
+        """Yield each row of a query result as a column-name -> value dict."""
+        while result.has_next():
+            yield dict(zip(col_names, result.get_next()))
+
     def _run_write(self, query: str, parameters: Dict[str, Any] = None) -> None:
         """Execute a data write query. All errors are propagated."""
         self._check_closed()
-        if parameters:
-            self.conn.execute(query, parameters)
-        else:
-            self.conn.execute(query)
+        self._write_version += 1
+        self.conn.execute(self._prepare(query).prepared, parameters or {})
 
     def _run_schema_write(self, query: str) -> None:
         """Execute a schema write query."""
         self._check_closed()
+        # DDL can invalidate the plans of already prepared statements
+        self._statements.clear()
+        self._write_version += 1
         self.conn.execute(query)
 
     # ========================================================================
@@ -119,163 +1072,79 @@ class MemoryGraphClient(PermeabilityMixin):
         if self._schema_initialized:
             return
 
-        # Create node tables
-        node_tables = [
-            """CREATE NODE TABLE IF NOT EXISTS Memory (
-                id STRING PRIMARY KEY,
-                content STRING,
-                summary STRING,
-                created STRING,
-                lastAccessed STRING,
-                accessCount INT64,
-                confidence DOUBLE,
-                permeability STRING
-            )""",
-            """CREATE NODE TABLE IF NOT EXISTS Concept (
-                id STRING PRIMARY KEY,
-                name STRING,
-                description STRING,
-                created STRING
-            )""",
-            """CREATE NODE TABLE IF NOT EXISTS Keyword (
-                id STRING PRIMARY KEY,
-                term STRING,
-                created STRING
-            )""",
-            """CREATE NODE TABLE IF NOT EXISTS Topic (
-                id STRING PRIMARY KEY,
-                name STRING,
-                description STRING,
-                created STRING
-            )""",
-            """CREATE NODE TABLE IF NOT EXISTS Entity (
-                id STRING PRIMARY KEY,
-                name STRING,
-                type STRING,
-                description STRING,
-                aliases STRING[],
-                created STRING
-            )""",
-            """CREATE NODE TABLE IF NOT EXISTS Source (
-                id STRING PRIMARY KEY,
-                type STRING,
-                reference STRING,
-                title STRING,
-                reliability DOUBLE,
-                created STRING
-            )""",
-            """CREATE NODE TABLE IF NOT EXISTS Decision (
-                id STRING PRIMARY KEY,
-                description STRING,
-                rationale STRING,
-                date STRING,
-                outcome STRING,
-                reversible BOOLEAN
-            )""",
-            """CREATE NODE TABLE IF NOT EXISTS Goal (
-                id STRING PRIMARY KEY,
-                description STRING,
-                status STRING,
-                priority INT64,
-                targetDate STRING,
-                created STRING
-            )""",
-            """CREATE NODE TABLE IF NOT EXISTS Question (
-                id STRING PRIMARY KEY,
-                text STRING,
-                status STRING,
-                answeredDate STRING,
-                created STRING
-            )""",
-            """CREATE NODE TABLE IF NOT EXISTS Context (
-                id STRING PRIMARY KEY,
-                name STRING,
-                type STRING,
-                description STRING,
-                status STRING,
-                created STRING
-            )""",
-            """CREATE NODE TABLE IF NOT EXISTS Preference (
-                id STRING PRIMARY KEY,
-                category STRING,
-                preference STRING,
-                strength DOUBLE,
-                observations INT64,
-                created STRING
-            )""",
-            """CREATE NODE TABLE IF NOT EXISTS TemporalMarker (
-                id STRING PRIMARY KEY,
-                type STRING,
-                description STRING,
-                startDate STRING,
-                endDate STRING,
-                created STRING
-            )""",
-            """CREATE NODE TABLE IF NOT EXISTS Contradiction (
-                id STRING PRIMARY KEY,
-                description STRING,
-                resolution STRING,
-                status STRING,
-                created STRING
-            )""",
-            """CREATE NODE TABLE IF NOT EXISTS Compartment (
-                id STRING PRIMARY KEY,
-                name STRING,
-                permeability STRING,
-                allowExternalConnections BOOLEAN,
-                description STRING,
-                created STRING
-            )"""
-        ]
-
-        # Create relationship tables with properties for brain-like plasticity
-        # Edge weights enable Hebbian learning, decay, and relevance-based retrieval
-        rel_tables = [
-            # Memory associations with strength/relevance weights
-            "CREATE REL TABLE IF NOT EXISTS HAS_CONCEPT (FROM Memory TO Concept, relevance DOUBLE)",
-            "CREATE REL TABLE IF NOT EXISTS HAS_KEYWORD (FROM Memory TO Keyword)",
-            "CREATE REL TABLE IF NOT EXISTS BELONGS_TO (FROM Memory TO Topic, isPrimary BOOLEAN)",
-            "CREATE REL TABLE IF NOT EXISTS MENTIONS (FROM Memory TO Entity, role STRING)",
-            "CREATE REL TABLE IF NOT EXISTS FROM_SOURCE (FROM Memory TO Source, excerpt STRING)",
-            "CREATE REL TABLE IF NOT EXISTS IN_CONTEXT (FROM Memory TO Context)",
-            "CREATE REL TABLE IF NOT EXISTS INFORMED (FROM Memory TO Decision)",
-            "CREATE REL TABLE IF NOT EXISTS PARTIALLY_ANSWERS (FROM Memory TO Question, completeness DOUBLE)",
-            "CREATE REL TABLE IF NOT EXISTS SUPPORTS (FROM Memory TO Goal, strength DOUBLE)",
-            "CREATE REL TABLE IF NOT EXISTS REVEALS (FROM Memory TO Preference)",
-            "CREATE REL TABLE IF NOT EXISTS OCCURRED_DURING (FROM Memory TO TemporalMarker)",
-            # Memory-to-memory with synaptic-like strength and permeability for data flow control
-            "CREATE REL TABLE IF NOT EXISTS RELATES_TO (FROM Memory TO Memory, strength DOUBLE, relType STRING, permeability STRING)",
-            # Compartmentalization - memory isolation and data flow control
-            "CREATE REL TABLE IF NOT EXISTS IN_COMPARTMENT (FROM Memory TO Compartment)",
-            # Concept relationships
-            "CREATE REL TABLE IF NOT EXISTS CONCEPT_RELATED_TO (FROM Concept TO Concept, relType STRING)",
-            # Goal/Decision/Context hierarchies
-            "CREATE REL TABLE IF NOT EXISTS DEPENDS_ON (FROM Goal TO Goal)",
-            "CREATE REL TABLE IF NOT EXISTS LED_TO (FROM Decision TO Decision)",
-            "CREATE REL TABLE IF NOT EXISTS PART_OF (FROM Context TO Context)",
-            # Contradiction tracking
-            "CREATE REL TABLE IF NOT EXISTS CONFLICTS_WITH (FROM Contradiction TO Memory)",
-            "CREATE REL TABLE IF NOT EXISTS SUPERSEDES (FROM Contradiction TO Memory)"
-        ]
-
-        # Execute all schema statements
-        for stmt in node_tables + rel_tables:
-            self._run_schema_write(stmt)
+        # Databases already stamped with this schema version skip DDL and migrations
+        stamp = self._read_schema_stamp()
+        if stamp is not None and stamp["version"] == _SCHEMA_VERSION:
+            self._fts_available = False
+            if stamp["search_index"]:
+                try:
+                    self._run_schema_write("LOAD EXTENSION fts")
+                    self._fts_available = True
+                except Exception:
+                    pass
+            self._schema_initialized = True
+            return
+
+        # Send only the missing tables, as one multi-statement script in one
+        # transaction (a single commit instead of one per table)
+        existing = {r["name"] for r in self._run_query_iter("CALL show_tables() RETURN name")}
+        if not existing:
+            ddl = _SCHEMA_DDL
+        else:
+            ddl = ";\n".join(stmt for name, stmt in _SCHEMA_TABLES.items() if name not in existing)
+        if ddl:
+            with self.transaction():
+                self._run_schema_write(ddl)
+
+        # Migrate databases created before Memory.permBits existed: add the
+        # column and backfill it from the permeability string
+        self._run_schema_write("ALTER TABLE Memory ADD IF NOT EXISTS permBits INT8")
+        self._run_write("""
+        MATCH (m:Memory)
+        WHERE m.permBits IS NULL
+        SET m.permBits = CASE m.permeability
+            WHEN 'closed' THEN 0
+            WHEN 'osmotic_inward' THEN 2
+            WHEN 'osmotic_outward' THEN 1
+            ELSE 3
+        END
+        """)
 
         # Set up full-text search index on Memory content and summary
         self._fts_available = False
         try:
             self._run_schema_write("INSTALL fts")
             self._run_schema_write("LOAD EXTENSION fts")
-            self._run_schema_write(
-                'CALL CREATE_FTS_INDEX("Memory", "memory_fts", ["content", "summary"])'
-            )
+            # Re-initializing an older stamped database must keep its existing
+            # index; CREATE_FTS_INDEX fails if the name is already taken
+            indexes = {r["name"] for r in self._run_query_iter(
+                "CALL SHOW_INDEXES() RETURN index_name AS name")}
+            if "memory_fts" not in indexes:
+                self._run_schema_write(
+                    'CALL CREATE_FTS_INDEX("Memory", "memory_fts", ["content", "summary"])'
+                )
             self._fts_available = True
         except Exception:
             pass  # FTS is optional — search_memories falls back to CONTAINS
 
+        self._run_write("""
+        MERGE (s:AxonsSchema {key: 'schema'})
+        SET s.version = $version, s.searchIndex = $search_index
+        """, {"version": _SCHEMA_VERSION, "search_index": self._fts_available})
         self._schema_initialized = True
 
+    def _read_schema_stamp(self) -> Optional[Dict[str, Any]]:
+        """Return the stored schema version and search-index flag, or None if never stamped."""
+        try:
+            rows = self._run_query(
+                "MATCH (s:AxonsSchema {key: 'schema'}) "
+                "RETURN s.version AS version, s.searchIndex AS search_index")
+        except RuntimeError:
+            if self._closed:
+                raise
+            return None  # AxonsSchema table doesn't exist yet
+        return rows[0] if rows else None
+
     # ========================================================================
     # CREATE OPERATIONS
     # ========================================================================
@@ -288,19 +1157,42 @@ class MemoryGraphClient(PermeabilityMixin):
             compartment_id: Optional compartment ID. If None, uses active compartment.
                            Pass empty string "" to create without compartment.
         """
-        query = """
-        CREATE (m:Memory {
-            id: $id,
-            content: $content,
-            summary: $summary,
-            created: $created,
-            lastAccessed: $last_accessed,
-            accessCount: $access_count,
-            confidence: $confidence,
-            permeability: $permeability
-        })
+        self._run_write(_Q["create_memory"], self._memory_params(memory))
+
+        # Add to compartment if specified or active
+        effective_compartment = compartment_id if compartment_id is not None else self._active_compartment_id
+        if effective_compartment:  # Not None and not empty string
+            self.add_memory_to_compartment(memory.id, effective_compartment)
+
+        return memory.id
+
+    def create_memories(self, memories: List[Memory], compartment_id: str = None) -> List[str]:
+        """Create many memory nodes with a single UNWIND query.
+
+        Args:
+            memories: The Memory objects to create
+            compartment_id: Optional compartment ID for all memories. If None, uses
+                           active compartment. Pass empty string "" for no compartment.
+
+        Returns:
+            The created memory IDs, in input order.
         """
-        self._run_write(query, {
+        if not memories:
+            return []
+
+        self._run_write(_Q["create_memories"], {"rows": [self._memory_params(m) for m in memories]})
+
+        memory_ids = [m.id for m in memories]
+        effective_compartment = compartment_id if compartment_id is not None else self._active_compartment_id
+        if effective_compartment:
+            self.add_memory_to_compartment(memory_ids, effective_compartment)
+
+        return memory_ids
+
+    @staticmethod
+    def _memory_params(memory: Memory) -> Dict[str, Any]:
+        """Query parameters for writing a Memory node."""
+        return {
             "id": memory.id,
             "content": memory.content,
             "summary": memory.summary,
@@ -308,150 +1200,126 @@ class MemoryGraphClient(PermeabilityMixin):
             "last_accessed": memory.last_accessed.isoformat(),
             "access_count": memory.access_count,
             "confidence": memory.confidence,
-            "permeability": memory.permeability.value
-        })
-
-        # Add to compartment if specified or active
-        effective_compartment = compartment_id if compartment_id is not None else self._active_compartment_id
-        if effective_compartment:  # Not None and not empty string
-            self.add_memory_to_compartment(memory.id, effective_compartment)
-
-        return memory.id
+            "permeability": memory.permeability.value,
+            "perm_bits": memory.permeability.bits
+        }
 
     def create_concept(self, concept: Concept) -> str:
         """Create a new concept node or return existing."""
-        check_query = "MATCH (c:Concept) WHERE c.name = $name RETURN c.id AS id"
-        result = self._run_query(check_query, {"name": concept.name})
-        if result:
-            return result[0]["id"]
+        return self._find_or_create("Concept", self._concept_params(concept))
 
-        query = """
-        CREATE (c:Concept {
-            id: $id,
-            name: $name,
-            description: $description,
-            created: $created
-        })
+    def create_concepts(self, concepts: List[Concept]) -> List[str]:
+        """Create many concept nodes, reusing existing ones by name.
+
+        Returns:
+            One concept ID per input, in input order.
         """
-        self._run_write(query, {
+        return self._find_or_create_many("Concept", [self._concept_params(c) for c in concepts])
+
+    @staticmethod
+    def _concept_params(concept: Concept) -> Dict[str, Any]:
+        """Query parameters for writing a Concept node."""
+        return {
             "id": concept.id,
             "name": concept.name,
             "description": concept.description,
             "created": concept.created.isoformat()
-        })
-        return concept.id
+        }
 
     def create_keyword(self, keyword: Keyword) -> str:
         """Create a new keyword node or return existing."""
-        check_query = "MATCH (k:Keyword) WHERE k.term = $term RETURN k.id AS id"
-        result = self._run_query(check_query, {"term": keyword.term})
-        if result:
-            return result[0]["id"]
+        return self._find_or_create("Keyword", self._keyword_params(keyword))
 
-        query = """
-        CREATE (k:Keyword {
-            id: $id,
-            term: $term,
-            created: $created
-        })
+    def create_keywords(self, keywords: List[Keyword]) -> List[str]:
+        """Create many keyword nodes, reusing existing ones by term.
+
+        Returns:
+            One keyword ID per input, in input order.
         """
-        self._run_write(query, {
+        return self._find_or_create_many("Keyword", [self._keyword_params(k) for k in keywords])
+
+    @staticmethod
+    def _keyword_params(keyword: Keyword) -> Dict[str, Any]:
+        """Query parameters for writing a Keyword node."""
+        return {
             "id": keyword.id,
             "term": keyword.term,
             "created": keyword.created.isoformat()
-        })
-        return keyword.id
+        }
 
     def create_topic(self, topic: Topic) -> str:
         """Create a new topic node or return existing."""
-        check_query = "MATCH (t:Topic) WHERE t.name = $name RETURN t.id AS id"
-        result = self._run_query(check_query, {"name": topic.name})
-        if result:
-            return result[0]["id"]
+        return self._find_or_create("Topic", self._topic_params(topic))
 
-        query = """
-        CREATE (t:Topic {
-            id: $id,
-            name: $name,
-            description: $description,
-            created: $created
-        })
+    def create_topics(self, topics: List[Topic]) -> List[str]:
+        """Create many topic nodes, reusing existing ones by name.
+
+        Returns:
+            One topic ID per input, in input order.
         """
-        self._run_write(query, {
+        return self._find_or_create_many("Topic", [self._topic_params(t) for t in topics])
+
+    @staticmethod
+    def _topic_params(topic: Topic) -> Dict[str, Any]:
+        """Query parameters for writing a Topic node."""
+        return {
             "id": topic.id,
             "name": topic.name,
             "description": topic.description,
             "created": topic.created.isoformat()
-        })
-        return topic.id
+        }
 
     def create_entity(self, entity: Entity) -> str:
         """Create a new entity node or return existing."""
-        check_query = "MATCH (e:Entity) WHERE e.name = $name AND e.type = $type RETURN e.id AS id"
-        result = self._run_query(check_query, {"name": entity.name, "type": entity.type.value})
-        if result:
-            return result[0]["id"]
+        return self._find_or_create("Entity", self._entity_params(entity))
 
-        query = """
-        CREATE (e:Entity {
-            id: $id,
-            name: $name,
-            type: $type,
-            description: $description,
-            aliases: $aliases,
-            created: $created
-        })
+    def create_entities(self, entities: List[Entity]) -> List[str]:
+        """Create many entity nodes, reusing existing ones by name and type.
+
+        Returns:
+            One entity ID per input, in input order.
         """
-        self._run_write(query, {
+        return self._find_or_create_many("Entity", [self._entity_params(e) for e in entities])
+
+    @staticmethod
+    def _entity_params(entity: Entity) -> Dict[str, Any]:
+        """Query parameters for writing an Entity node."""
+        return {
             "id": entity.id,
             "name": entity.name,
             "type": entity.type.value,
             "description": entity.description,
             "aliases": entity.aliases,
             "created": entity.created.isoformat()
-        })
-        return entity.id
+        }
 
     def create_source(self, source: Source) -> str:
         """Create a new source node or return existing."""
-        check_query = "MATCH (s:Source) WHERE s.reference = $reference AND s.type = $type RETURN s.id AS id"
-        result = self._run_query(check_query, {"reference": source.reference, "type": source.type.value})
-        if result:
-            return result[0]["id"]
+        return self._find_or_create("Source", self._source_params(source))
 
-        query = """
-        CREATE (s:Source {
-            id: $id,
-            type: $type,
-            reference: $reference,
-            title: $title,
-            reliability: $reliability,
-            created: $created
-        })
+    def create_sources(self, sources: List[Source]) -> List[str]:
+        """Create many source nodes, reusing existing ones by reference and type.
+
+        Returns:
+            One source ID per input, in input order.
         """
-        self._run_write(query, {
+        return self._find_or_create_many("Source", [self._source_params(s) for s in sources])
+
+    @staticmethod
+    def _source_params(source: Source) -> Dict[str, Any]:
+        """Query parameters for writing a Source node."""
+        return {
             "id": source.id,
             "type": source.type.value,
             "reference": source.reference,
             "title": source.title,
             "reliability": source.reliability,
             "created": source.created.isoformat()
-        })
-        return source.id
+        }
 
     def create_decision(self, decision: Decision) -> str:
         """Create a new decision node."""
-        query = """
-        CREATE (d:Decision {
-            id: $id,
-            description: $description,
-            rationale: $rationale,
-            date: $date,
-            outcome: $outcome,
-            reversible: $reversible
-        })
-        """
-        self._run_write(query, {
+        self._run_write(_Q["create_decision"], {
             "id": decision.id,
             "description": decision.description,
             "rationale": decision.rationale,
@@ -463,17 +1331,7 @@ class MemoryGraphClient(PermeabilityMixin):
 
     def create_goal(self, goal: Goal) -> str:
         """Create a new goal node."""
-        query = """
-        CREATE (g:Goal {
-            id: $id,
-            description: $description,
-            status: $status,
-            priority: $priority,
-            targetDate: $target_date,
-            created: $created
-        })
-        """
-        self._run_write(query, {
+        self._run_write(_Q["create_goal"], {
             "id": goal.id,
             "description": goal.description,
             "status": goal.status.value,
@@ -485,16 +1343,7 @@ class MemoryGraphClient(PermeabilityMixin):
 
     def create_question(self, question: Question) -> str:
         """Create a new question node."""
-        query = """
-        CREATE (q:Question {
-            id: $id,
-            text: $text,
-            status: $status,
-            answeredDate: $answered_date,
-            created: $created
-        })
-        """
-        self._run_write(query, {
+        self._run_write(_Q["create_question"], {
             "id": question.id,
             "text": question.text,
             "status": question.status.value,
@@ -505,39 +1354,31 @@ class MemoryGraphClient(PermeabilityMixin):
 
     def create_context(self, context: Context) -> str:
         """Create a new context node or return existing."""
-        check_query = "MATCH (c:Context) WHERE c.name = $name AND c.type = $type RETURN c.id AS id"
-        result = self._run_query(check_query, {"name": context.name, "type": context.type.value})
-        if result:
-            return result[0]["id"]
+        return self._find_or_create("Context", self._context_params(context))
 
-        query = """
-        CREATE (c:Context {
-            id: $id,
-            name: $name,
-            type: $type,
-            description: $description,
-            status: $status,
-            created: $created
-        })
+    def create_contexts(self, contexts: List[Context]) -> List[str]:
+        """Create many context nodes, reusing existing ones by name and type.
+
+        Returns:
+            One context ID per input, in input order.
         """
-        self._run_write(query, {
+        return self._find_or_create_many("Context", [self._context_params(c) for c in contexts])
+
+    @staticmethod
+    def _context_params(context: Context) -> Dict[str, Any]:
+        """Query parameters for writing a Context node."""
+        return {
             "id": context.id,
             "name": context.name,
             "type": context.type.value,
             "description": context.description,
             "status": context.status.value,
             "created": context.created.isoformat()
-        })
-        return context.id
+        }
 
     def create_preference(self, preference: Preference) -> str:
         """Create or update a preference node."""
-        check_query = """
-        MATCH (p:Preference)
-        WHERE p.category = $category AND p.preference = $preference
-        RETURN p.id AS id, p.strength AS strength, p.observations AS observations
-        """
-        result = self._run_query(check_query, {
+        result = self._run_query(_Q["create_preference_check"], {
             "category": preference.category,
             "preference": preference.preference
         })
@@ -546,28 +1387,14 @@ class MemoryGraphClient(PermeabilityMixin):
             existing = result[0]
             new_observations = existing["observations"] + 1
             new_strength = (existing["strength"] * existing["observations"] + preference.strength) / new_observations
-            update_query = """
-            MATCH (p:Preference {id: $id})
-            SET p.observations = $observations, p.strength = $strength
-            """
-            self._run_write(update_query, {
+            self._run_write(_Q["create_preference_update"], {
                 "id": existing["id"],
                 "observations": new_observations,
                 "strength": new_strength
             })
             return existing["id"]
 
-        query = """
-        CREATE (p:Preference {
-            id: $id,
-            category: $category,
-            preference: $preference,
-            strength: $strength,
-            observations: $observations,
-            created: $created
-        })
-        """
-        self._run_write(query, {
+        self._run_write(_Q["create_preference"], {
             "id": preference.id,
             "category": preference.category,
             "preference": preference.preference,
@@ -579,17 +1406,7 @@ class MemoryGraphClient(PermeabilityMixin):
 
     def create_temporal_marker(self, marker: TemporalMarker) -> str:
         """Create a new temporal marker node."""
-        query = """
-        CREATE (t:TemporalMarker {
-            id: $id,
-            type: $type,
-            description: $description,
-            startDate: $start_date,
-            endDate: $end_date,
-            created: $created
-        })
-        """
-        self._run_write(query, {
+        self._run_write(_Q["create_temporal_marker"], {
             "id": marker.id,
             "type": marker.type.value,
             "description": marker.description,
@@ -601,16 +1418,7 @@ class MemoryGraphClient(PermeabilityMixin):
 
     def create_contradiction(self, contradiction: Contradiction) -> str:
         """Create a new contradiction node."""
-        query = """
-        CREATE (c:Contradiction {
-            id: $id,
-            description: $description,
-            resolution: $resolution,
-            status: $status,
-            created: $created
-        })
-        """
-        self._run_write(query, {
+        self._run_write(_Q["create_contradiction"], {
             "id": contradiction.id,
             "description": contradiction.description,
             "resolution": contradiction.resolution,
@@ -624,23 +1432,8 @@ class MemoryGraphClient(PermeabilityMixin):
     # ========================================================================
 
     def create_compartment(self, compartment: Compartment) -> str:
-        """Create a new compartment for memory isolation."""
-        check_query = "MATCH (c:Compartment) WHERE c.name = $name RETURN c.id AS id"
-        result = self._run_query(check_query, {"name": compartment.name})
-        if result:
-            return result[0]["id"]
-
-        query = """
-        CREATE (c:Compartment {
-            id: $id,
-            name: $name,
-            permeability: $permeability,
-            allowExternalConnections: $allow_external,
-            description: $description,
-            created: $created
-        })
-        """
-        self._run_write(query, {
+        """Create a new compartment for memory isolation, or return the existing one by name."""
+        return self._find_or_create("Compartment", {
             "id": compartment.id,
             "name": compartment.name,
             "permeability": compartment.permeability.value,
@@ -648,29 +1441,16 @@ class MemoryGraphClient(PermeabilityMixin):
             "description": compartment.description,
             "created": compartment.created.isoformat()
         })
-        return compartment.id
 
     def get_compartment(self, compartment_id: str) -> Optional[Dict]:
         """Get a compartment by ID."""
-        query = """
-        MATCH (c:Compartment {id: $id})
-        RETURN c.id AS id, c.name AS name, c.permeability AS permeability,
-               c.allowExternalConnections AS allowExternalConnections,
-               c.description AS description, c.created AS created
-        """
-        result = self._run_query(query, {"id": compartment_id})
+        result = self._run_query(_Q["get_compartment"], {"id": compartment_id})
         return result[0] if result else None
 
     def get_compartment_by_name(self, name: str) -> Optional[Dict]:
         """Get a compartment by name."""
-        query = """
-        MATCH (c:Compartment {name: $name})
-        RETURN c.id AS id, c.name AS name, c.permeability AS permeability,
-               c.allowExternalConnections AS allowExternalConnections,
-               c.description AS description, c.created AS created
-        """
-        result = self._run_query(query, {"name": name})
-        return result[0] if result else None
+        compartment_id = self._lookup_id("Compartment", name)
+        return self.get_compartment(compartment_id) if compartment_id else None
 
     def update_compartment(self, compartment_id: str, permeability: Permeability = None,
                           allow_external_connections: bool = None, description: str = None):
@@ -701,22 +1481,13 @@ class MemoryGraphClient(PermeabilityMixin):
                               If False, deletion fails if compartment has memories.
         """
         if not reassign_memories:
-            check_query = """
-            MATCH (m:Memory)-[:IN_COMPARTMENT]->(c:Compartment {id: $id})
-            RETURN COUNT(m) AS count
-            """
-            result = self._run_query(check_query, {"id": compartment_id})
+            result = self._run_query(_Q["delete_compartment_check"], {"id": compartment_id})
             if result and result[0]["count"] > 0:
                 raise ValueError(f"Compartment has {result[0]['count']} memories. "
                                "Set reassign_memories=True to remove them from compartment.")
 
-        # Delete relationships first
-        self._run_write(
-            "MATCH (m:Memory)-[r:IN_COMPARTMENT]->(c:Compartment {id: $id}) DELETE r",
-            {"id": compartment_id}
-        )
-        # Delete compartment
-        self._run_write("MATCH (c:Compartment {id: $id}) DELETE c", {"id": compartment_id})
+        self._run_write(_Q["delete_compartment"], {"id": compartment_id})
+        self._forget_lookup("Compartment", compartment_id)
 
     def set_active_compartment(self, compartment_id: Optional[str]):
         """Set the active compartment for new memories.
@@ -743,12 +1514,7 @@ class MemoryGraphClient(PermeabilityMixin):
         if isinstance(memory_ids, str):
             memory_ids = [memory_ids]
 
-        query = """
-        UNWIND $mids AS mid
-        MATCH (m:Memory {id: mid}), (c:Compartment {id: $cid})
-        MERGE (m)-[:IN_COMPARTMENT]->(c)
-        """
-        self._run_write(query, {"mids": memory_ids, "cid": compartment_id})
+        self._run_write(_Q["add_memory_to_compartment"], {"mids": memory_ids, "cid": compartment_id})
 
     def remove_memory_from_compartment(self, memory_ids, compartment_id: str = None):
         """Remove one or more memories from compartment(s).
@@ -760,17 +1526,11 @@ class MemoryGraphClient(PermeabilityMixin):
         if isinstance(memory_ids, str):
             memory_ids = [memory_ids]
 
-        for memory_id in memory_ids:
-            if compartment_id:
-                self._run_write(
-                    "MATCH (m:Memory {id: $mid})-[r:IN_COMPARTMENT]->(c:Compartment {id: $cid}) DELETE r",
-                    {"mid": memory_id, "cid": compartment_id}
-                )
-            else:
-                self._run_write(
-                    "MATCH (m:Memory {id: $mid})-[r:IN_COMPARTMENT]->() DELETE r",
-                    {"mid": memory_id}
-                )
+        if compartment_id:
+            self._run_write(_Q["remove_memory_from_compartment"],
+                            {"mids": memory_ids, "cid": compartment_id})
+        else:
+            self._run_write(_Q["remove_memory_from_all_compartments"], {"mids": memory_ids})
 
     def get_memory_compartments(self, memory_id: str) -> List[Dict]:
         """Get all compartments a memory belongs to.
@@ -778,22 +1538,11 @@ class MemoryGraphClient(PermeabilityMixin):
         Returns:
             List of compartment dicts, empty if memory is global (no compartments).
         """
-        query = """
-        MATCH (m:Memory {id: $mid})-[:IN_COMPARTMENT]->(c:Compartment)
-        RETURN c.id AS id, c.name AS name, c.permeability AS permeability,
-               c.allowExternalConnections AS allowExternalConnections
-        """
-        return self._run_query(query, {"mid": memory_id})
+        return self._run_query(_Q["get_memory_compartments"], {"mid": memory_id})
 
     def get_memories_in_compartment(self, compartment_id: str, limit: int = 100) -> List[Dict]:
         """Get all memories in a compartment."""
-        query = """
-        MATCH (m:Memory)-[:IN_COMPARTMENT]->(c:Compartment {id: $cid})
-        RETURN m.id AS id, m.summary AS summary, m.content AS content,
-               m.created AS created, m.confidence AS confidence
-        LIMIT $limit
-        """
-        return self._run_query(query, {"cid": compartment_id, "limit": limit})
+        return self._run_query(_Q["get_memories_in_compartment"], {"cid": compartment_id, "limit": limit})
 
     # ========================================================================
     # RELATIONSHIP OPERATIONS
@@ -802,110 +1551,91 @@ class MemoryGraphClient(PermeabilityMixin):
     def link_memory_to_concept(self, memory_id: str, concept_id: str, relevance: float = 1.0):
         """Link a memory to a concept with relevance weight (0-1)."""
         _validate_range(relevance, 0.0, 1.0, "relevance")
-        query = """
-        MATCH (m:Memory), (c:Concept)
-        WHERE m.id = $memory_id AND c.id = $concept_id
-        MERGE (m)-[r:HAS_CONCEPT]->(c)
-        ON CREATE SET r.relevance = $relevance
-        """
-        self._run_write(query, {"memory_id": memory_id, "concept_id": concept_id, "relevance": relevance})
+        self._run_write(_Q["link_memory_to_concept"], {"memory_id": memory_id, "concept_id": concept_id, "relevance": relevance})
 
     def link_memory_to_keyword(self, memory_id: str, keyword_id: str):
         """Link a memory to a keyword."""
-        query = """
-        MATCH (m:Memory), (k:Keyword)
-        WHERE m.id = $memory_id AND k.id = $keyword_id
-        MERGE (m)-[:HAS_KEYWORD]->(k)
-        """
-        self._run_write(query, {"memory_id": memory_id, "keyword_id": keyword_id})
+        self._run_write(_Q["link_memory_to_keyword"], {"memory_id": memory_id, "keyword_id": keyword_id})
 
     def link_memory_to_topic(self, memory_id: str, topic_id: str, primary: bool = False):
         """Link a memory to a topic, optionally marking it as the primary topic."""
-        query = """
-        MATCH (m:Memory), (t:Topic)
-        WHERE m.id = $memory_id AND t.id = $topic_id
-        MERGE (m)-[r:BELONGS_TO]->(t)
-        ON CREATE SET r.isPrimary = $is_primary
-        """
-        self._run_write(query, {"memory_id": memory_id, "topic_id": topic_id, "is_primary": primary})
+        self._run_write(_Q["link_memory_to_topic"], {"memory_id": memory_id, "topic_id": topic_id, "is_primary": primary})
 
     def link_memory_to_entity(self, memory_id: str, entity_id: str, role: str = ""):
         """Link a memory to an entity with an optional role description."""
-        query = """
-        MATCH (m:Memory), (e:Entity)
-        WHERE m.id = $memory_id AND e.id = $entity_id
-        MERGE (m)-[r:MENTIONS]->(e)
-        ON CREATE SET r.role = $role
-        """
-        self._run_write(query, {"memory_id": memory_id, "entity_id": entity_id, "role": role})
+        self._run_write(_Q["link_memory_to_entity"], {"memory_id": memory_id, "entity_id": entity_id, "role": role})
 
     def link_memory_to_source(self, memory_id: str, source_id: str, excerpt: str = ""):
         """Link a memory to its source with an optional excerpt."""
-        query = """
-        MATCH (m:Memory), (s:Source)
-        WHERE m.id = $memory_id AND s.id = $source_id
-        MERGE (m)-[r:FROM_SOURCE]->(s)
-        ON CREATE SET r.excerpt = $excerpt
-        """
-        self._run_write(query, {"memory_id": memory_id, "source_id": source_id, "excerpt": excerpt})
+        self._run_write(_Q["link_memory_to_source"], {"memory_id": memory_id, "source_id": source_id, "excerpt": excerpt})
 
     def link_memory_to_context(self, memory_id: str, context_id: str):
         """Link a memory to a context."""
-        query = """
-        MATCH (m:Memory), (c:Context)
-        WHERE m.id = $memory_id AND c.id = $context_id
-        MERGE (m)-[:IN_CONTEXT]->(c)
-        """
-        self._run_write(query, {"memory_id": memory_id, "context_id": context_id})
+        self._run_write(_Q["link_memory_to_context"], {"memory_id": memory_id, "context_id": context_id})
 
     def link_memory_to_decision(self, memory_id: str, decision_id: str):
         """Link a memory that informed a decision."""
-        query = """
-        MATCH (m:Memory), (d:Decision)
-        WHERE m.id = $memory_id AND d.id = $decision_id
-        MERGE (m)-[:INFORMED]->(d)
-        """
-        self._run_write(query, {"memory_id": memory_id, "decision_id": decision_id})
+        self._run_write(_Q["link_memory_to_decision"], {"memory_id": memory_id, "decision_id": decision_id})
 
     def link_memory_to_question(self, memory_id: str, question_id: str, completeness: float = 0.5):
         """Link a memory that partially answers a question."""
         _validate_range(completeness, 0.0, 1.0, "completeness")
-        query = """
-        MATCH (m:Memory), (q:Question)
-        WHERE m.id = $memory_id AND q.id = $question_id
-        MERGE (m)-[r:PARTIALLY_ANSWERS]->(q)
-        ON CREATE SET r.completeness = $completeness
-        """
-        self._run_write(query, {"memory_id": memory_id, "question_id": question_id, "completeness": completeness})
+        self._run_write(_Q["link_memory_to_question"], {"memory_id": memory_id, "question_id": question_id, "completeness": completeness})
 
     def link_memory_to_goal(self, memory_id: str, goal_id: str, strength: float = 0.5):
         """Link a memory that supports a goal."""
         _validate_range(strength, 0.0, 1.0, "strength")
-        query = """
-        MATCH (m:Memory), (g:Goal)
-        WHERE m.id = $memory_id AND g.id = $goal_id
-        MERGE (m)-[r:SUPPORTS]->(g)
-        ON CREATE SET r.strength = $strength
-        """
-        self._run_write(query, {"memory_id": memory_id, "goal_id": goal_id, "strength": strength})
+        self._run_write(_Q["link_memory_to_goal"], {"memory_id": memory_id, "goal_id": goal_id, "strength": strength})
 
     def link_memory_to_preference(self, memory_id: str, preference_id: str):
         """Link a memory that reveals a preference."""
-        query = """
-        MATCH (m:Memory), (p:Preference)
-        WHERE m.id = $memory_id AND p.id = $preference_id
-        MERGE (m)-[:REVEALS]->(p)
-        """
-        self._run_write(query, {"memory_id": memory_id, "preference_id": preference_id})
+        self._run_write(_Q["link_memory_to_preference"], {"memory_id": memory_id, "preference_id": preference_id})
 
     def link_memory_to_temporal(self, memory_id: str, temporal_id: str):
         """Link a memory to a temporal marker."""
-        query = """
-        MATCH (m:Memory), (t:TemporalMarker)
-        WHERE m.id = $memory_id AND t.id = $temporal_id
-        MERGE (m)-[:OCCURRED_DURING]->(t)
+        self._run_write(_Q["link_memory_to_temporal"], {"memory_id": memory_id, "temporal_id": temporal_id})
+
+    def link_memory_to_concepts_batch(self, memory_id: str, concept_ids: List[str],
+                                      relevance: float = 1.0):
+        """Link a memory to many concepts with a single UNWIND query.
+
+        Same semantics as link_memory_to_concept: existing links keep their relevance.
         """
-        self._run_write(query, {"memory_id": memory_id, "temporal_id": temporal_id})
+        _validate_range(relevance, 0.0, 1.0, "relevance")
+        if concept_ids:
+            self._run_write(_Q["link_memory_to_concepts_batch"], {
+                "memory_id": memory_id, "concept_ids": list(dict.fromkeys(concept_ids)),
+                "relevance": relevance
+            })
+
+    def link_memory_to_keywords_batch(self, memory_id: str, keyword_ids: List[str]):
+        """Link a memory to many keywords with a single UNWIND query."""
+        if keyword_ids:
+            self._run_write(_Q["link_memory_to_keywords_batch"], {
+                "memory_id": memory_id, "keyword_ids": list(dict.fromkeys(keyword_ids))
+            })
+
+    def link_memory_to_topics_batch(self, memory_id: str, topic_ids: List[str],
+                                    primary_id: str = None):
+        """Link a memory to many topics with a single UNWIND query.
+
+        Args:
+            memory_id: The memory to link
+            topic_ids: Topic IDs to link
+            primary_id: Optional topic ID to mark as the primary topic
+        """
+        if topic_ids:
+            self._run_write(_Q["link_memory_to_topics_batch"], {
+                "memory_id": memory_id, "topic_ids": list(dict.fromkeys(topic_ids)),
+                "primary_id": primary_id or ""
+            })
+
+    def link_memory_to_entities_batch(self, memory_id: str, entity_ids: List[str], role: str = ""):
+        """Link a memory to many entities with a single UNWIND query."""
+        if entity_ids:
+            self._run_write(_Q["link_memory_to_entities_batch"], {
+                "memory_id": memory_id, "entity_ids": list(dict.fromkeys(entity_ids)), "role": role
+            })
 
     def link_memories(self, memory_id_1: str, memory_id_2: str, strength: float = 0.5,
                       rel_type: str = "", permeability: Permeability = None,
@@ -930,85 +1660,62 @@ class MemoryGraphClient(PermeabilityMixin):
             return False
 
         perm_value = permeability.value if permeability else Permeability.OPEN.value
-        query = """
-        MATCH (m1:Memory), (m2:Memory)
-        WHERE m1.id = $id1 AND m2.id = $id2
-        MERGE (m1)-[r:RELATES_TO]->(m2)
-        ON CREATE SET r.strength = $strength, r.relType = $relType, r.permeability = $perm
-        """
-        self._run_write(query, {
+        self._run_write(_Q["link_memories"], {
             "id1": memory_id_1, "id2": memory_id_2,
             "strength": strength, "relType": rel_type, "perm": perm_value
         })
         return True
 
+    def link_memories_batch(self, links: List[tuple], rel_type: str = "",
+                            permeability: Permeability = None):
+        """Link many memory pairs with a single UNWIND query.
+
+        Same semantics as link_memories without compartment checks: existing
+        connections are left unchanged (MERGE).
+
+        Args:
+            links: List of (memory_id_1, memory_id_2, strength) tuples
+            rel_type: Optional relationship type label for every link
+            permeability: Optional permeability override for every link
+        """
+        if not links:
+            return
+
+        rows = []
+        for id1, id2, strength in links:
+            _validate_range(strength, 0.0, 1.0, "strength")
+            rows.append({"id1": id1, "id2": id2, "strength": float(strength)})
+
+        perm_value = permeability.value if permeability else Permeability.OPEN.value
+        self._run_write(_Q["link_memories_batch"], {"rows": rows, "relType": rel_type, "perm": perm_value})
+
     def link_concepts(self, concept_id_1: str, concept_id_2: str, rel_type: str = ""):
         """Link two related concepts."""
-        query = """
-        MATCH (c1:Concept), (c2:Concept)
-        WHERE c1.id = $id1 AND c2.id = $id2
-        MERGE (c1)-[r:CONCEPT_RELATED_TO]->(c2)
-        ON CREATE SET r.relType = $relType
-        """
-        self._run_write(query, {"id1": concept_id_1, "id2": concept_id_2, "relType": rel_type})
+        self._run_write(_Q["link_concepts"], {"id1": concept_id_1, "id2": concept_id_2, "relType": rel_type})
 
     def link_goals(self, goal_id_1: str, goal_id_2: str):
         """Link a goal that depends on another."""
-        query = """
-        MATCH (g1:Goal), (g2:Goal)
-        WHERE g1.id = $id1 AND g2.id = $id2
-        MERGE (g1)-[:DEPENDS_ON]->(g2)
-        """
-        self._run_write(query, {"id1": goal_id_1, "id2": goal_id_2})
+        self._run_write(_Q["link_goals"], {"id1": goal_id_1, "id2": goal_id_2})
 
     def link_decisions(self, decision_id_1: str, decision_id_2: str):
         """Link a decision that led to another."""
-        query = """
-        MATCH (d1:Decision), (d2:Decision)
-        WHERE d1.id = $id1 AND d2.id = $id2
-        MERGE (d1)-[:LED_TO]->(d2)
-        """
-        self._run_write(query, {"id1": decision_id_1, "id2": decision_id_2})
+        self._run_write(_Q["link_decisions"], {"id1": decision_id_1, "id2": decision_id_2})
 
     def link_contexts(self, parent_id: str, child_id: str):
         """Link a context as part of another (hierarchy)."""
-        query = """
-        MATCH (p:Context), (c:Context)
-        WHERE p.id = $parent_id AND c.id = $child_id
-        MERGE (c)-[:PART_OF]->(p)
-        """
-        self._run_write(query, {"parent_id": parent_id, "child_id": child_id})
+        self._run_write(_Q["link_contexts"], {"parent_id": parent_id, "child_id": child_id})
 
     def mark_contradiction(self, contradiction_id: str, memory_id_1: str, memory_id_2: str):
         """Mark two memories as contradicting each other."""
-        query1 = """
-        MATCH (c:Contradiction), (m1:Memory)
-        WHERE c.id = $cid AND m1.id = $mid1
-        MERGE (c)-[:CONFLICTS_WITH]->(m1)
-        """
-        query2 = """
-        MATCH (c:Contradiction), (m2:Memory)
-        WHERE c.id = $cid AND m2.id = $mid2
-        MERGE (c)-[:CONFLICTS_WITH]->(m2)
-        """
-        self._run_write(query1, {"cid": contradiction_id, "mid1": memory_id_1})
-        self._run_write(query2, {"cid": contradiction_id, "mid2": memory_id_2})
+        self._run_write(_Q["mark_contradiction"], {
+            "cid": contradiction_id, "mid1": memory_id_1, "mid2": memory_id_2
+        })
 
     def resolve_contradiction(self, contradiction_id: str, superseding_memory_id: str, resolution: str):
         """Resolve a contradiction by marking which memory supersedes."""
-        query = """
-        MATCH (c:Contradiction)
-        WHERE c.id = $cid
-        SET c.status = 'resolved', c.resolution = $resolution
-        """
-        self._run_write(query, {"cid": contradiction_id, "resolution": resolution})
-
-        query2 = """
-        MATCH (c:Contradiction), (m:Memory)
-        WHERE c.id = $cid AND m.id = $mid
-        MERGE (c)-[:SUPERSEDES]->(m)
-        """
-        self._run_write(query2, {"cid": contradiction_id, "mid": superseding_memory_id})
+        self._run_write(_Q["resolve_contradiction"], {
+            "cid": contradiction_id, "resolution": resolution, "mid": superseding_memory_id
+        })
 
     # ========================================================================
     # PLASTICITY OPERATIONS (Brain-like learning)
@@ -1016,12 +1723,14 @@ class MemoryGraphClient(PermeabilityMixin):
 
     def strengthen_memory_link(self, memory_id_1: str, memory_id_2: str, amount: float = None):
         """Strengthen the connection between two memories (Hebbian learning)."""
-        current = self.get_memory_link_strength(memory_id_1, memory_id_2) or 0.0
-
-        if amount is None:
+        if amount is not None:
+            effective_amount = amount * self.plasticity.learning_rate
+        elif self.plasticity.learning_rate > 0:
+            # The curve needs the current strength; skip the read when plasticity is off
+            current = self.get_memory_link_strength(memory_id_1, memory_id_2) or 0.0
             effective_amount = self.plasticity.effective_amount('strengthen', current)
         else:
-            effective_amount = amount * self.plasticity.learning_rate
+            return
 
         if effective_amount <= 0:
             return
@@ -1042,12 +1751,14 @@ class MemoryGraphClient(PermeabilityMixin):
 
     def weaken_memory_link(self, memory_id_1: str, memory_id_2: str, amount: float = None):
         """Weaken the connection between two memories."""
-        current = self.get_memory_link_strength(memory_id_1, memory_id_2) or 1.0
-
-        if amount is None:
+        if amount is not None:
+            effective_amount = amount * self.plasticity.learning_rate
+        elif self.plasticity.learning_rate > 0:
+            # The curve needs the current strength; skip the read when plasticity is off
+            current = self.get_memory_link_strength(memory_id_1, memory_id_2) or 1.0
             effective_amount = self.plasticity.effective_amount('weaken', current)
         else:
-            effective_amount = amount * self.plasticity.learning_rate
+            return
 
         if effective_amount <= 0:
             return
@@ -1138,8 +1849,19 @@ class MemoryGraphClient(PermeabilityMixin):
                     if strength_rev is not None:
                         self.strengthen_memory_link(id2, id1, effective)
 
-    def decay_weak_connections(self, threshold: float = None, decay_amount: float = None):
-        """Weaken connections that are below threshold."""
+    def decay_weak_connections(self, threshold: float = None, decay_amount: float = None,
+                               prune: bool = None):
+        """Weaken connections that are below threshold.
+
+        Args:
+            threshold: Only connections below this strength decay (default: config)
+            decay_amount: Amount subtracted per call (default: config)
+            prune: Whether to prune dead connections afterwards
+                   (default: config.auto_prune). Pass False to defer pruning
+                   to a later prune_dead_connections sweep.
+        """
+        if prune is None:
+            prune = self.plasticity.auto_prune
         if threshold is None:
             threshold = self.plasticity.decay_threshold
         if decay_amount is None:
@@ -1149,43 +1871,87 @@ class MemoryGraphClient(PermeabilityMixin):
             return
 
         min_strength = self.plasticity.min_strength
+        decay_all = self.plasticity.decay_all
+        prune_threshold = self.plasticity.prune_threshold
 
-        if self.plasticity.decay_all:
-            query = """
-            MATCH (m1:Memory)-[r:RELATES_TO]->(m2:Memory)
-            SET r.strength = CASE
-                WHEN r.strength - $decay_amount < $min THEN $min
-                ELSE r.strength - $decay_amount
-            END
-            """
-            self._run_write(query, {"decay_amount": decay_amount, "min": min_strength})
-        else:
-            query = """
-            MATCH (m1:Memory)-[r:RELATES_TO]->(m2:Memory)
-            WHERE r.strength < $threshold
-            SET r.strength = CASE
-                WHEN r.strength - $decay_amount < $min THEN $min
-                ELSE r.strength - $decay_amount
-            END
-            """
-            self._run_write(query, {
-                "threshold": threshold, "decay_amount": decay_amount, "min": min_strength
-            })
+        prune_inline = prune and self._prunes_inline(threshold)
 
-        if self.plasticity.auto_prune:
+        query = f"""
+        MATCH (m1:Memory)-[r:RELATES_TO]->(m2:Memory)
+        {"" if decay_all else "WHERE r.strength < $threshold"}
+        SET r.strength = CASE
+            WHEN r.strength - $decay_amount < $min THEN $min
+            ELSE r.strength - $decay_amount
+        END
+        """
+        params = {"decay_amount": decay_amount, "min": min_strength}
+        if not decay_all:
+            params["threshold"] = threshold
+        if prune_inline:
+            query += """
+        WITH r WHERE r.strength <= $prune_threshold
+        DELETE r
+        """
+            params["prune_threshold"] = prune_threshold
+        self._run_write(query, params)
+
+        if prune and not prune_inline:
             self.prune_dead_connections()
 
-    def prune_dead_connections(self, min_strength: float = None):
-        """Remove connections that have decayed to near-zero."""
+    def _prunes_inline(self, threshold: float) -> bool:
+        """Whether decay can prune in its own pass: every prunable edge is also decayed."""
+        return self.plasticity.decay_all or self.plasticity.prune_threshold < threshold
+
+    def prune_dead_connections(self, min_strength: float = None, batch_size: int = None) -> int:
+        """Remove connections that have decayed to near-zero.
+
+        Args:
+            min_strength: Prune connections at or below this strength (default: config)
+            batch_size: If set, delete at most this many connections per statement,
+                        repeating until none remain
+
+        Returns:
+            Number of connections removed
+        """
         if min_strength is None:
             min_strength = self.plasticity.prune_threshold
 
+        if batch_size is None:
+            query = """
+            MATCH (m1:Memory)-[r:RELATES_TO]->(m2:Memory)
+            WHERE r.strength <= $min_strength
+            DELETE r
+            RETURN count(*) AS pruned
+            """
+            return self._run_query(query, {"min_strength": min_strength})[0]["pruned"]
+
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
         query = """
         MATCH (m1:Memory)-[r:RELATES_TO]->(m2:Memory)
         WHERE r.strength <= $min_strength
+        WITH r LIMIT $batch_size
         DELETE r
+        RETURN count(*) AS pruned
+        """
+        params = {"min_strength": min_strength, "batch_size": batch_size}
+        total = 0
+        while True:
+            pruned = self._run_query(query, params)[0]["pruned"]
+            total += pruned
+            if pruned < batch_size:
+                return total
+
+    def count_prunable_connections(self, min_strength: float = None) -> int:
+        """Count connections awaiting the next prune sweep."""
+        if min_strength is None:
+            min_strength = self.plasticity.prune_threshold
+        query = """
+        MATCH (m1:Memory)-[r:RELATES_TO]->(m2:Memory)
+        WHERE r.strength <= $min_strength
+        RETURN count(r) AS pending
         """
-        self._run_write(query, {"min_strength": min_strength})
+        return self._run_query(query, {"min_strength": min_strength})[0]["pending"]
 
     def get_strongest_connections(self, memory_id: str, limit: int = 10,
                                   respect_permeability: bool = True) -> List[Dict]:
@@ -1202,7 +1968,7 @@ class MemoryGraphClient(PermeabilityMixin):
         results = self._run_query(query, {"memory_id": memory_id, "limit": fetch_limit})
 
         if respect_permeability:
-            results = self._filter_by_permeability(memory_id, results)
+            return list(islice(self._iter_permitted(memory_id, results), limit))
 
         return results[:limit]
 
@@ -1221,7 +1987,7 @@ class MemoryGraphClient(PermeabilityMixin):
         results = self._run_query(query, {"memory_id": memory_id, "limit": fetch_limit})
 
         if respect_permeability:
-            results = self._filter_by_permeability(memory_id, results)
+            return list(islice(self._iter_permitted(memory_id, results), limit))
 
         return results[:limit]
 
@@ -1311,15 +2077,26 @@ class MemoryGraphClient(PermeabilityMixin):
 
     # === MAINTENANCE OPERATIONS ===
 
-    def run_maintenance_cycle(self):
-        """Run a full maintenance cycle: decay, prune, update statistics."""
+    def run_maintenance_cycle(self, prune: bool = None):
+        """Run a full maintenance cycle: decay, prune, update statistics.
+
+        Args:
+            prune: Whether to prune this cycle (default: config.auto_prune)
+        """
         self._access_cycle += 1
-        self.decay_weak_connections()
+        self.decay_weak_connections(prune=prune)
 
     def run_aggressive_maintenance(self, cycles: int = 5):
-        """Run multiple maintenance cycles to aggressively prune weak connections."""
+        """Run multiple maintenance cycles to aggressively prune weak connections.
+
+        When decay cannot prune in its own pass, dead connections are swept
+        once after the last cycle instead of after every cycle.
+        """
+        defer = self.plasticity.auto_prune and not self._prunes_inline(self.plasticity.decay_threshold)
         for _ in range(cycles):
-            self.run_maintenance_cycle()
+            self.run_maintenance_cycle(prune=False if defer else None)
+        if defer:
+            self.prune_dead_connections()
 
     def strengthen_goal_connections(self, goal_id: str, amount: float = None):
         """Strengthen all memory connections to a goal."""
@@ -1380,21 +2157,29 @@ class MemoryGraphClient(PermeabilityMixin):
     # QUERY OPERATIONS
     # ========================================================================
 
-    def get_memory(self, memory_id: str, apply_retrieval_effects: bool = True) -> Optional[Dict]:
-        """Get a memory by ID and update access tracking."""
-        update_query = """
-        MATCH (m:Memory {id: $id})
-        SET m.lastAccessed = $now, m.accessCount = m.accessCount + 1
-        """
-        self._run_write(update_query, {"id": memory_id, "now": datetime.now().isoformat()})
+    def get_memory(self, memory_id: str, apply_retrieval_effects: bool = True,
+                   now: Optional[datetime] = None) -> Optional[Dict]:
+        """Get a memory by ID and update access tracking.
 
+        Args:
+            memory_id: The memory to fetch
+            apply_retrieval_effects: If True, strengthen the memory's connections
+            now: Access timestamp to record. Loops reading many memories should
+                 compute it once and pass it to every call; if None, the clock
+                 is read for this call.
+        """
+        if now is None:
+            now = datetime.now()
+        # Access tracking and the read share one statement, so the returned
+        # row already reflects this access
         query = """
         MATCH (m:Memory {id: $id})
+        SET m.lastAccessed = $now, m.accessCount = m.accessCount + 1
         RETURN m.id AS id, m.content AS content, m.summary AS summary,
                m.created AS created, m.lastAccessed AS lastAccessed,
                m.accessCount AS accessCount, m.confidence AS confidence
         """
-        result = self._run_query(query, {"id": memory_id})
+        result = self._run_query(query, {"id": memory_id, "now": now.isoformat()})
 
         if result and apply_retrieval_effects:
             self._apply_retrieval_effects(memory_id)
@@ -1434,63 +2219,37 @@ class MemoryGraphClient(PermeabilityMixin):
                              respect_permeability: bool = True) -> List[Dict]:
         """Get memories related to a given memory through shared concepts/keywords/topics.
 
-        Finds memories that share at least one concept or keyword with the given memory
-        (single-hop traversal through association nodes).
-        """
-        query = """
-        MATCH (m:Memory {id: $id})-[:HAS_CONCEPT]->(c:Concept)<-[:HAS_CONCEPT]-(related:Memory)
-        WHERE related.id <> $id
-        RETURN DISTINCT related.id AS id, related.content AS content, related.summary AS summary,
-               related.created AS created, related.lastAccessed AS lastAccessed,
-               related.accessCount AS accessCount, related.confidence AS confidence
-        LIMIT $limit
+        Finds memories that share at least one concept, keyword or topic with the
+        given memory (single-hop traversal through association nodes). Concept
+        matches rank first, then keyword matches, then topic matches.
         """
         fetch_limit = limit * 3 if respect_permeability else limit
-        results = self._run_query(query, {"id": memory_id, "limit": fetch_limit})
-
-        if len(results) < fetch_limit:
-            query2 = """
-            MATCH (m:Memory {id: $id})-[:HAS_KEYWORD]->(k:Keyword)<-[:HAS_KEYWORD]-(related:Memory)
-            WHERE related.id <> $id
-            RETURN DISTINCT related.id AS id, related.content AS content, related.summary AS summary,
-                   related.created AS created, related.lastAccessed AS lastAccessed,
-                   related.accessCount AS accessCount, related.confidence AS confidence
-            LIMIT $remaining
-            """
-            remaining = fetch_limit - len(results)
-            keyword_results = self._run_query(query2, {"id": memory_id, "remaining": remaining})
-            seen_ids = {r["id"] for r in results}
-            for r in keyword_results:
-                if r["id"] not in seen_ids:
-                    results.append(r)
-                    seen_ids.add(r["id"])
+        rows = self._run_query(_RELATED_MEMORIES_QUERY, {"id": memory_id, "limit": fetch_limit})
+
+        # UNION ALL branch order is not guaranteed; restore the tier priority
+        rows.sort(key=lambda r: r["tier"])
+        results = []
+        seen_ids = set()
+        for r in rows:
+            if r["id"] not in seen_ids:
+                seen_ids.add(r["id"])
+                del r["tier"]
+                results.append(r)
+                if len(results) == fetch_limit:
+                    break
 
         if respect_permeability:
-            results = self._filter_by_permeability(memory_id, results)
+            return list(islice(self._iter_permitted(memory_id, results), limit))
 
         return results[:limit]
 
     def get_memories_by_concept(self, concept_name: str, limit: int = 20,
                                  apply_retrieval_effects: bool = True) -> List[Dict]:
         """Get all memories associated with a concept."""
-        concept_query = """
-        MATCH (c:Concept {name: $name})
-        RETURN c.id AS id
-        """
-        concept_result = self._run_query(concept_query, {"name": concept_name})
-        concept_id = concept_result[0]["id"] if concept_result else None
+        concept_id = self._lookup_id("Concept", concept_name)
+        results = self._memories_by("concept", concept_id, limit)
 
-        query = """
-        MATCH (m:Memory)-[:HAS_CONCEPT]->(c:Concept {name: $name})
-        RETURN m.id AS id, m.content AS content, m.summary AS summary,
-               m.created AS created, m.lastAccessed AS lastAccessed,
-               m.accessCount AS accessCount, m.confidence AS confidence
-        ORDER BY m.lastAccessed DESC
-        LIMIT $limit
-        """
-        results = self._run_query(query, {"name": concept_name, "limit": limit})
-
-        if apply_retrieval_effects and concept_id and self.plasticity.retrieval_strengthens:
+        if apply_retrieval_effects and self.plasticity.retrieval_strengthens:
             for mem in results:
                 self._apply_retrieval_effects(mem["id"], via_concept_id=concept_id)
 
@@ -1498,45 +2257,27 @@ class MemoryGraphClient(PermeabilityMixin):
 
     def get_memories_by_keyword(self, keyword: str, limit: int = 20) -> List[Dict]:
         """Get all memories associated with a keyword."""
-        query = """
-        MATCH (m:Memory)-[:HAS_KEYWORD]->(k:Keyword {term: $term})
-        RETURN m.id AS id, m.content AS content, m.summary AS summary,
-               m.created AS created, m.lastAccessed AS lastAccessed,
-               m.accessCount AS accessCount, m.confidence AS confidence
-        ORDER BY m.lastAccessed DESC
-        LIMIT $limit
-        """
-        return self._run_query(query, {"term": keyword, "limit": limit})
+        return self._memories_by("keyword", self._lookup_id("Keyword", keyword), limit)
 
     def get_memories_by_topic(self, topic_name: str, limit: int = 20) -> List[Dict]:
         """Get all memories belonging to a topic."""
-        query = """
-        MATCH (m:Memory)-[:BELONGS_TO]->(t:Topic {name: $name})
-        RETURN m.id AS id, m.content AS content, m.summary AS summary,
-               m.created AS created, m.lastAccessed AS lastAccessed,
-               m.accessCount AS accessCount, m.confidence AS confidence
-        ORDER BY m.lastAccessed DESC
-        LIMIT $limit
-        """
-        return self._run_query(query, {"name": topic_name, "limit": limit})
+        return self._memories_by("topic", self._lookup_id("Topic", topic_name), limit)
 
     def get_memories_by_entity(self, entity_name: str, limit: int = 20) -> List[Dict]:
         """Get all memories mentioning an entity."""
-        query = """
-        MATCH (m:Memory)-[:MENTIONS]->(e:Entity {name: $name})
-        RETURN m.id AS id, m.content AS content, m.summary AS summary,
-               m.created AS created, m.lastAccessed AS lastAccessed,
-               m.accessCount AS accessCount, m.confidence AS confidence
-        ORDER BY m.lastAccessed DESC
-        LIMIT $limit
-        """
-        return self._run_query(query, {"name": entity_name, "limit": limit})
+        return self._memories_by("entity", entity_name, limit)
+
+    def _memories_by(self, name: str, key: Optional[str], limit: int) -> List[Dict]:
+        """Run the memories_by_<name> query for one node key; no key means no memories."""
+        if key is None:
+            return []
+        return self._run_query(_Q[f"memories_by_{name}"], {"key": key, "limit": limit})
 
     def get_open_questions(self) -> List[Dict]:
         """Get all open questions."""
         query = """
         MATCH (q:Question)
-        WHERE q.status = 'open' OR q.status = 'partial'
+        WHERE q.status IN ['open', 'partial']
         RETURN q.id AS id, q.text AS text, q.status AS status,
                q.answeredDate AS answeredDate, q.created AS created
         ORDER BY q.created DESC
@@ -1557,104 +2298,133 @@ class MemoryGraphClient(PermeabilityMixin):
         """Get all unresolved contradictions with their conflicting memories."""
         query = """
         MATCH (c:Contradiction {status: 'unresolved'})-[:CONFLICTS_WITH]->(m:Memory)
-        RETURN c.id AS contradiction_id, c.description AS description,
-               m.id AS memory_id, m.summary AS memory_summary
+        RETURN c.id AS id, c.description AS description,
+               collect({id: m.id, summary: m.summary}) AS memories
         """
-        results = self._run_query(query)
-
-        contradictions = {}
-        for r in results:
-            cid = r["contradiction_id"]
-            if cid not in contradictions:
-                contradictions[cid] = {
-                    "id": cid,
-                    "description": r["description"],
-                    "memories": []
-                }
-            contradictions[cid]["memories"].append({
-                "id": r["memory_id"],
-                "summary": r["memory_summary"]
-            })
+        return self._run_query(query)
 
-        return list(contradictions.values())
+    def get_preferences_by_category(self, category: str, min_strength: Optional[float] = None) -> List[Dict]:
+        """Get all preferences in a category.
 
-    def get_preferences_by_category(self, category: str) -> List[Dict]:
-        """Get all preferences in a category."""
-        query = """
-        MATCH (p:Preference {category: $category})
+        Args:
+            category: Preference category to match
+            min_strength: If set, only preferences with strength >= this value
+        """
+        return self.get_preferences(category=category, min_strength=min_strength)
+
+    def get_preferences(self, category: Optional[str] = None, min_strength: Optional[float] = None,
+                        limit: Optional[int] = None) -> List[Dict]:
+        """Scan preferences, optionally filtered by category and minimum strength.
+
+        The filters run inside the database, which scans the strength column
+        directly, so only matching rows are materialized in Python.
+
+        Args:
+            category: Only preferences in this category (None = all categories)
+            min_strength: Only preferences with strength >= this value
+            limit: Maximum number of results (None = no limit)
+
+        Returns:
+            Preferences sorted by strength, strongest first
+        """
+        conditions = []
+        params: Dict[str, Any] = {}
+        if category is not None:
+            conditions.append("p.category = $category")
+            params["category"] = category
+        if min_strength is not None:
+            conditions.append("p.strength >= $min_strength")
+            params["min_strength"] = float(min_strength)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        query = f"""
+        MATCH (p:Preference)
+        {where}
         RETURN p.id AS id, p.category AS category, p.preference AS preference,
                p.strength AS strength, p.observations AS observations, p.created AS created
         ORDER BY p.strength DESC
         """
-        return self._run_query(query, {"category": category})
+        if limit is not None:
+            query += "LIMIT $limit"
+            params["limit"] = int(limit)
+        return self._run_query(query, params)
 
     def get_decision_chain(self, decision_id: str) -> List[Dict]:
         """Get decisions related to a given decision."""
-        query1 = """
+        query = """
         MATCH (d1:Decision)-[:LED_TO]->(d2:Decision {id: $id})
         RETURN d1.id AS id, d1.description AS description, d1.rationale AS rationale,
                d1.date AS date, d1.outcome AS outcome, 'predecessor' AS relation
-        """
-        query2 = """
+        UNION ALL
         MATCH (d1:Decision {id: $id})-[:LED_TO]->(d2:Decision)
         RETURN d2.id AS id, d2.description AS description, d2.rationale AS rationale,
                d2.date AS date, d2.outcome AS outcome, 'successor' AS relation
         """
-        results = self._run_query(query1, {"id": decision_id})
-        results.extend(self._run_query(query2, {"id": decision_id}))
-        return results
+        return self._run_query(query, {"id": decision_id})
 
     # ========================================================================
     # DIRECTORY OPERATIONS (for markdown index)
     # ========================================================================
 
-    def get_all_nodes_summary(self) -> Dict[str, List[Dict]]:
-        """Get a summary of all nodes for the directory index."""
-        summary = {}
-
-        node_queries = {
-            "Memory": "MATCH (n:Memory) RETURN n.id AS id, n.summary AS summary, n.content AS content, n.created AS created",
-            "Concept": "MATCH (n:Concept) RETURN n.id AS id, n.name AS name, n.description AS description, n.created AS created",
-            "Keyword": "MATCH (n:Keyword) RETURN n.id AS id, n.term AS term, n.created AS created",
-            "Topic": "MATCH (n:Topic) RETURN n.id AS id, n.name AS name, n.description AS description, n.created AS created",
-            "Entity": "MATCH (n:Entity) RETURN n.id AS id, n.name AS name, n.type AS type, n.description AS description, n.created AS created",
-            "Source": "MATCH (n:Source) RETURN n.id AS id, n.type AS type, n.reference AS reference, n.title AS title, n.created AS created",
-            "Decision": "MATCH (n:Decision) RETURN n.id AS id, n.description AS description, n.rationale AS rationale, n.date AS date",
-            "Goal": "MATCH (n:Goal) RETURN n.id AS id, n.description AS description, n.status AS status, n.priority AS priority, n.created AS created",
-            "Question": "MATCH (n:Question) RETURN n.id AS id, n.text AS text, n.status AS status, n.created AS created",
-            "Context": "MATCH (n:Context) RETURN n.id AS id, n.name AS name, n.type AS type, n.status AS status, n.created AS created",
-            "Preference": "MATCH (n:Preference) RETURN n.id AS id, n.category AS category, n.preference AS preference, n.strength AS strength, n.created AS created",
-            "TemporalMarker": "MATCH (n:TemporalMarker) RETURN n.id AS id, n.type AS type, n.description AS description, n.created AS created",
-            "Contradiction": "MATCH (n:Contradiction) RETURN n.id AS id, n.description AS description, n.status AS status, n.created AS created",
-            "Compartment": "MATCH (n:Compartment) RETURN n.id AS id, n.name AS name, n.permeability AS permeability, n.allowExternalConnections AS allowExternalConnections, n.description AS description, n.created AS created"
-        }
+    def get_all_nodes_summary(self, node_types: Optional[Iterable[str]] = None) -> Dict[str, List[Dict]]:
+        """Get a summary of all nodes for the directory index.
+
+        The result is cached until the next write through this client.
 
-        for node_type, query in node_queries.items():
-            summary[node_type] = self._run_query(query)
+        Args:
+            node_types: Only summarize these node types, in any order and as any
+                        iterable (None = all types). Skipping unneeded types, such
+                        as Memory with its full content, avoids reading their rows
+                        at all.
 
+        Returns:
+            Summary rows per node type, keyed in canonical node type order
+
+        Raises:
+            ValueError: If a node type has no summary fields
+        """
+        if node_types is None:
+            return self._nodes_summary(_NODE_TYPES)
+        requested = set(node_types)
+        unknown = sorted(requested.difference(_SUMMARY_FIELDS))
+        if unknown:
+            raise ValueError(f"Unknown node types: {unknown}")
+        # One canonical, hashable key per set of types, whatever order was passed
+        return self._nodes_summary(tuple(t for t in _NODE_TYPES if t in requested))
+
+    @_cached_read(_copy_summary)
+    def _nodes_summary(self, node_types: Tuple[str, ...]) -> Dict[str, List[Dict]]:
+        """get_all_nodes_summary for a canonical tuple of node types."""
+        if not node_types:
+            return {}
+        query = _SUMMARY_QUERY if node_types == _NODE_TYPES else _summary_query(node_types)
+        if _HAVE_PYARROW:
+            # Split the scan by label in Arrow and build only the output dicts
+            import pyarrow.compute as pc
+            table = self._run_query_arrow(query)
+            return {
+                label: table.filter(pc.equal(table["label"], label))
+                            .select(list(_SUMMARY_FIELDS[label])).to_pylist()
+                for label in node_types
+            }
+        summary: Dict[str, List[Dict]] = {label: [] for label in node_types}
+        for row in self._run_query_iter(query):
+            summary[row["label"]].append({p: row[p] for p in _SUMMARY_FIELDS[row["label"]]})
         return summary
 
+    @_cached_read(dict)
     def get_node_counts(self) -> Dict[str, int]:
-        """Get counts of each node type in a single batched query."""
-        node_types = [
-            "Memory", "Concept", "Keyword", "Topic", "Entity", "Source",
-            "Decision", "Goal", "Question", "Context", "Preference",
-            "TemporalMarker", "Contradiction", "Compartment"
-        ]
-        parts = [
-            f"MATCH (n:{nt}) RETURN '{nt}' AS type, count(n) AS cnt"
-            for nt in node_types
-        ]
-        query = " UNION ALL ".join(parts)
-        results = self._run_query(query)
-        counts = {row["type"]: row["cnt"] for row in results}
-        return {nt: counts.get(nt, 0) for nt in node_types}
+        """Get counts of each node type in a single batched query.
+
+        The result is cached until the next write through this client.
+        """
+        counts = {row["type"]: row["cnt"] for row in self._run_query_iter(_NODE_COUNTS_QUERY)}
+        return {nt: counts.get(nt, 0) for nt in _NODE_TYPES}
 
     def export_directory_markdown(self) -> str:
         """Export the node directory as markdown."""
-        summary = self.get_all_nodes_summary()
-        # Derive counts from summary data instead of running a separate query
-        counts = {k: len(v) for k, v in summary.items()}
+        # Only the rendered types are summarized; counts cover every type
+        summary = self.get_all_nodes_summary(tuple(_DIRECTORY_SECTIONS))
+        counts = self.get_node_counts()
 
         lines = ["# Memory Graph Directory\n"]
         lines.append(f"Last updated: {datetime.now().isoformat()}\n")
@@ -1664,47 +2434,18 @@ class MemoryGraphClient(PermeabilityMixin):
             lines.append(f"- **{node_type}**: {count}")
         lines.append("")
 
-        for node_type in ["Compartment", "Concept", "Topic", "Keyword", "Entity", "Goal", "Question", "Context", "Preference"]:
-            if node_type in summary and summary[node_type]:
-                plural = "ies" if node_type.endswith("y") else "s"
-                label = node_type[:-1] + plural if node_type.endswith("y") else node_type + "s"
-                lines.append(f"\n## {label}\n")
-                for item in summary[node_type]:
-                    node_id = str(item.get('id', 'N/A'))[:8]
-                    if node_type == "Compartment":
-                        perm = item.get('permeability', 'open')
-                        ext = "yes" if item.get('allowExternalConnections', True) else "no"
-                        lines.append(f"- `{node_id}` **{item.get('name', 'N/A')}** ({perm}, ext:{ext})")
-                    elif node_type in ("Concept", "Topic"):
-                        lines.append(f"- `{node_id}` **{item.get('name', 'N/A')}**")
-                    elif node_type == "Keyword":
-                        lines.append(f"- `{node_id}` {item.get('term', 'N/A')}")
-                    elif node_type == "Entity":
-                        lines.append(f"- `{node_id}` **{item.get('name', 'N/A')}** ({item.get('type', 'N/A')})")
-                    elif node_type == "Goal":
-                        desc = str(item.get('description', 'N/A'))[:50]
-                        lines.append(f"- `{node_id}` [{item.get('status', 'N/A')}] {desc}")
-                    elif node_type == "Question":
-                        text = str(item.get('text', 'N/A'))[:50]
-                        lines.append(f"- `{node_id}` [{item.get('status', 'N/A')}] {text}")
-                    elif node_type == "Context":
-                        lines.append(f"- `{node_id}` **{item.get('name', 'N/A')}** ({item.get('type', 'N/A')}) [{item.get('status', 'N/A')}]")
-                    elif node_type == "Preference":
-                        strength = item.get('strength', 0) or 0
-                        indicator = "+" if strength > 0 else "-" if strength < 0 else "~"
-                        lines.append(f"- `{node_id}` [{item.get('category', 'N/A')}] {indicator} {item.get('preference', 'N/A')}")
+        for node_type, (heading, format_item) in _DIRECTORY_SECTIONS.items():
+            items = summary[node_type]
+            if items:
+                lines.append(f"\n## {heading}\n")
+                lines.extend(map(format_item, items))
 
         return "\n".join(lines)
 
     def delete_all_data(self):
         """Delete all data from the database (useful for testing)."""
-        node_types = [
-            "Memory", "Concept", "Keyword", "Topic", "Entity", "Source",
-            "Decision", "Goal", "Question", "Context", "Preference",
-            "TemporalMarker", "Contradiction", "Compartment"
-        ]
-        for node_type in node_types:
-            self._run_write(f"MATCH (n:{node_type}) DETACH DELETE n")
+        self._run_write(_DELETE_ALL_QUERY)
+        self._forget_lookups()
 
 
 # ============================================================================
@@ -1731,38 +2472,56 @@ def quick_store_memory(
 
     Wrapped in a transaction so partial failures roll back cleanly.
     """
-    memory = Memory(content=content, summary=summary, confidence=confidence)
+    memory = Memory.make(content, summary, confidence=confidence)
 
-    client.begin_transaction()
-    try:
+    with client.transaction():
         memory_id = client.create_memory(memory, compartment_id=compartment_id)
 
         if concepts:
-            for concept_name in concepts:
-                concept = Concept(name=concept_name)
-                concept_id = client.create_concept(concept)
-                client.link_memory_to_concept(memory_id, concept_id)
+            concept_ids = client.create_concepts([Concept(name=name) for name in concepts])
+            client.link_memory_to_concepts_batch(memory_id, concept_ids)
 
         if keywords:
-            for term in keywords:
-                keyword = Keyword(term=term)
-                keyword_id = client.create_keyword(keyword)
-                client.link_memory_to_keyword(memory_id, keyword_id)
+            keyword_ids = client.create_keywords([Keyword(term=term) for term in keywords])
+            client.link_memory_to_keywords_batch(memory_id, keyword_ids)
 
         if topics:
-            for i, topic_name in enumerate(topics):
-                topic = Topic(name=topic_name)
-                topic_id = client.create_topic(topic)
-                client.link_memory_to_topic(memory_id, topic_id, primary=(i == 0))
+            topic_ids = client.create_topics([Topic(name=name) for name in topics])
+            client.link_memory_to_topics_batch(memory_id, topic_ids, primary_id=topic_ids[0])
 
         if entities:
-            for name, etype in entities:
-                entity = Entity(name=name, type=EntityType(etype))
-                entity_id = client.create_entity(entity)
-                client.link_memory_to_entity(memory_id, entity_id)
-
-        client.commit()
-        return memory_id
-    except Exception:
-        client.rollback()
-        raise
+            entity_ids = client.create_entities(
+                [Entity(name=name, type=EntityType(etype)) for name, etype in entities])
+            client.link_memory_to_entities_batch(memory_id, entity_ids)
+
+    return memory_id
+
+
+def bulk_store_memories(
+    client: MemoryGraphClient,
+    memories: Iterable[Dict[str, Any]],
+    batch_commit_every: int = 1000
+) -> List[str]:
+    """Store many memories with quick_store_memory, committing once per batch.
+
+    Each item holds quick_store_memory's keyword arguments (content, summary,
+    concepts, ...). Grouping items into one transaction pays for one commit
+    per batch instead of one per memory; a failure rolls back only the
+    batch it occurred in.
+
+    Args:
+        client: Client to store into
+        memories: quick_store_memory keyword arguments, one dict per memory
+        batch_commit_every: Number of memories per transaction
+
+    Returns:
+        The new memory IDs, in input order
+    """
+    if batch_commit_every < 1:
+        raise ValueError(f"batch_commit_every must be at least 1, got {batch_commit_every}")
+    memory_ids = []
+    items = iter(memories)
+    while batch := list(islice(items, batch_commit_every)):
+        with client.transaction():
+            memory_ids.extend(quick_store_memory(client, **item) for item in batch)
+    return memory_ids
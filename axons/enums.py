@@ -2,6 +2,10 @@
 
 from enum import Enum
 
+# Two-bit permeability encoding stored alongside the string value (Memory.permBits)
+_PERM_INWARD_BIT = 0b10
+_PERM_OUTWARD_BIT = 0b01
+
 
 class EntityType(Enum):
     PERSON = "person"
@@ -103,3 +107,16 @@ class Permeability(Enum):
     def allows_outward(self) -> bool:
         """Check if this permeability allows outward data flow."""
         return self in (Permeability.OPEN, Permeability.OSMOTIC_OUTWARD)
+
+    @property
+    def bits(self) -> int:
+        """Two-bit flag encoding: inward bit (2) | outward bit (1)."""
+        return _PERMEABILITY_BITS[self]
+
+
+_PERMEABILITY_BITS = {
+    Permeability.OPEN: _PERM_INWARD_BIT | _PERM_OUTWARD_BIT,
+    Permeability.CLOSED: 0,
+    Permeability.OSMOTIC_INWARD: _PERM_INWARD_BIT,
+    Permeability.OSMOTIC_OUTWARD: _PERM_OUTWARD_BIT,
+}
@@ -24,6 +24,14 @@ from axons import (
 # Global client reference, initialized during lifespan
 _client: Optional[MemoryGraphClient] = None
 
+# Preset names accepted by configure_plasticity
+_PLASTICITY_PRESETS = {
+    "aggressive": PlasticityConfig.aggressive_learning,
+    "conservative": PlasticityConfig.conservative_learning,
+    "no_plasticity": PlasticityConfig.no_plasticity,
+    "high_decay": PlasticityConfig.high_decay,
+}
+
 
 @asynccontextmanager
 async def lifespan(server):
@@ -147,7 +155,7 @@ def search_memories(search_term: str, limit: int = 10) -> list[dict]:
 
 @mcp.tool
 def get_related(memory_id: str, limit: int = 20) -> list[dict]:
-    """Find memories related to a given memory through shared concepts and keywords.
+    """Find memories related to a given memory through shared concepts, keywords and topics.
 
     Args:
         memory_id: UUID of the memory to find relations for.
@@ -403,15 +411,9 @@ def configure_plasticity(preset: str | None = None, learning_rate: float | None
     """
     client = _get_client()
     if preset:
-        presets = {
-            "aggressive": PlasticityConfig.aggressive_learning,
-            "conservative": PlasticityConfig.conservative_learning,
-            "no_plasticity": PlasticityConfig.no_plasticity,
-            "high_decay": PlasticityConfig.high_decay,
-        }
-        factory = presets.get(preset)
+        factory = _PLASTICITY_PRESETS.get(preset)
         if factory is None:
-            return {"error": f"Unknown preset '{preset}'. Options: {list(presets.keys())}"}
+            return {"error": f"Unknown preset '{preset}'. Options: {list(_PLASTICITY_PRESETS)}"}
         client.set_plasticity_config(factory())
     elif learning_rate is not None:
         config = client.get_plasticity_config()
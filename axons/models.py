@@ -1,6 +1,7 @@
 """Data models (dataclasses) for the Axons memory graph system."""
 
-import uuid
+import os
+import sys
 from datetime import datetime
 from typing import Optional, List
 from dataclasses import dataclass, field
@@ -12,6 +13,50 @@ from .enums import (
 )
 
 
+class _IdPool:
+    """Hands out random UUID4 strings generated in blocks.
+
+    One os.urandom call fills a whole block of IDs instead of one call per
+    uuid.uuid4(). IDs stay in the canonical 36-char form so they match the
+    STRING id columns and every ID the system has already stored.
+    """
+
+    __slots__ = ("_ids", "_block")
+
+    def __init__(self, block: int = 1024):
+        self._ids: List[str] = []
+        self._block = block
+
+    def _refill(self) -> None:
+        raw = bytearray(os.urandom(16 * self._block))
+        ids = []
+        for i in range(0, len(raw), 16):
+            raw[i + 6] = (raw[i + 6] & 0x0F) | 0x40  # version 4
+            raw[i + 8] = (raw[i + 8] & 0x3F) | 0x80  # RFC 4122 variant
+            h = raw[i:i + 16].hex()
+            ids.append(f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}")
+        self._ids.extend(ids)
+
+    def next_id(self) -> str:
+        # list.pop is atomic, so concurrent callers never share an ID
+        while True:
+            try:
+                return self._ids.pop()
+            except IndexError:
+                self._refill()
+
+    def clear(self) -> None:
+        self._ids.clear()
+
+
+_id_pool = _IdPool()
+_new_id = _id_pool.next_id
+
+# A forked child must not hand out IDs its parent already buffered
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_id_pool.clear)
+
+
 def _validate_range(value: float, min_val: float, max_val: float, name: str) -> float:
     """Validate a numeric value is within range, raise ValueError if not."""
     if not isinstance(value, (int, float)):
@@ -21,6 +66,11 @@ def _validate_range(value: float, min_val: float, max_val: float, name: str) ->
     return float(value)
 
 
+def _intern(value):
+    """Intern exact str values; sys.intern rejects subclasses and other types."""
+    return sys.intern(value) if type(value) is str else value
+
+
 def _validate_required_str(value: str, name: str) -> str:
     """Validate a required string field is not empty or None."""
     if not value or not isinstance(value, str) or not value.strip():
@@ -28,13 +78,13 @@ def _validate_required_str(value: str, name: str) -> str:
     return value
 
 
-@dataclass
+@dataclass(slots=True)
 class Memory:
     content: str
     summary: str
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     created: datetime = field(default_factory=datetime.now)
-    last_accessed: datetime = field(default_factory=datetime.now)
+    last_accessed: Optional[datetime] = None  # Defaults to created
     access_count: int = 0
     confidence: float = 1.0
     permeability: Permeability = Permeability.OPEN
@@ -42,142 +92,167 @@ class Memory:
     def __post_init__(self):
         _validate_required_str(self.content, "content")
         _validate_required_str(self.summary, "summary")
+        if self.last_accessed is None:
+            self.last_accessed = self.created
         self.confidence = _validate_range(self.confidence, 0.0, 1.0, "confidence")
 
+    @classmethod
+    def make(cls, content: str, summary: str, now: Optional[datetime] = None, **kwargs) -> "Memory":
+        """Create a Memory with an externally supplied timestamp.
+
+        Bulk ingest loops should compute ``now = datetime.now()`` once and pass
+        it to every record, instead of paying a clock read per record via
+        the created default factory.
+
+        Args:
+            content: Full content of the memory
+            summary: Brief one-line summary
+            now: Timestamp used for both created and last_accessed.
+                 If None, the clock is read once for this record.
+            **kwargs: Any other Memory field (confidence, permeability, ...)
+        """
+        if now is None:
+            now = datetime.now()
+        return cls(content=content, summary=summary, created=now, last_accessed=now, **kwargs)
+
 
-@dataclass
+@dataclass(slots=True)
 class Concept:
     name: str
     description: str = ""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     created: datetime = field(default_factory=datetime.now)
 
     def __post_init__(self):
         _validate_required_str(self.name, "name")
 
 
-@dataclass
+@dataclass(slots=True)
 class Keyword:
     term: str
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     created: datetime = field(default_factory=datetime.now)
 
     def __post_init__(self):
         _validate_required_str(self.term, "term")
 
 
-@dataclass
+@dataclass(slots=True)
 class Topic:
     name: str
     description: str = ""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     created: datetime = field(default_factory=datetime.now)
 
     def __post_init__(self):
         _validate_required_str(self.name, "name")
 
 
-@dataclass
+@dataclass(slots=True)
 class Entity:
     name: str
     type: EntityType
     description: str = ""
     aliases: List[str] = field(default_factory=list)
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     created: datetime = field(default_factory=datetime.now)
 
     def __post_init__(self):
         _validate_required_str(self.name, "name")
 
 
-@dataclass
+@dataclass(slots=True)
 class Source:
     type: SourceType
     reference: str
     title: str = ""
     reliability: float = 1.0
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     created: datetime = field(default_factory=datetime.now)
 
     def __post_init__(self):
         _validate_required_str(self.reference, "reference")
+        # Bulk-ingested sources repeat the same few references
+        self.reference = _intern(self.reference)
         self.reliability = _validate_range(self.reliability, 0.0, 1.0, "reliability")
 
 
-@dataclass
+@dataclass(slots=True)
 class Decision:
     description: str
     rationale: str
     date: datetime = field(default_factory=datetime.now)
     outcome: str = ""
     reversible: bool = True
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
 
 
-@dataclass
+@dataclass(slots=True)
 class Goal:
     description: str
     status: GoalStatus = GoalStatus.ACTIVE
     priority: int = 5
     target_date: Optional[datetime] = None
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     created: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True)
 class Question:
     text: str
     status: QuestionStatus = QuestionStatus.OPEN
     answered_date: Optional[datetime] = None
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     created: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True)
 class Context:
     name: str
     type: ContextType
     description: str = ""
     status: ContextStatus = ContextStatus.ACTIVE
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     created: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True)
 class Preference:
     category: str
     preference: str
     strength: float = 0.5  # -1 (dislike) to 1 (strong like)
     observations: int = 1
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     created: datetime = field(default_factory=datetime.now)
 
     def __post_init__(self):
         _validate_required_str(self.category, "category")
+        # Categories are low-cardinality; share one string object per category
+        self.category = _intern(self.category)
         _validate_required_str(self.preference, "preference")
         self.strength = _validate_range(self.strength, -1.0, 1.0, "strength")
 
 
-@dataclass
+@dataclass(slots=True)
 class TemporalMarker:
     type: TemporalType
     description: str
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     created: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True)
 class Contradiction:
     description: str
     resolution: str = ""
     status: ContradictionStatus = ContradictionStatus.UNRESOLVED
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     created: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True)
 class Compartment:
     """
     A compartment for isolating memories and controlling data flow.
@@ -198,5 +273,5 @@ class Compartment:
     permeability: Permeability = Permeability.OPEN
     allow_external_connections: bool = True  # Whether organic connections can form externally
     description: str = ""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     created: datetime = field(default_factory=datetime.now)
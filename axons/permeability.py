@@ -1,13 +1,16 @@
 """Permeability checking and data flow control for compartmentalized memories.
 
 Provides PermeabilityMixin, which is mixed into MemoryGraphClient to add
-permeability-related methods. These methods depend on _run_query, _run_write,
-and get_memory_compartments being available on self (provided by the client).
+permeability-related methods. These methods depend on _run_query, _run_query_iter,
+_run_write, and get_memory_compartments being available on self (provided by the client).
 """
 
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterator
 
-from .enums import Permeability
+from .enums import Permeability, _PERM_INWARD_BIT, _PERM_OUTWARD_BIT
+
+# Value -> member lookup that skips Enum.__call__ dispatch in filter loops
+_PERM = {p.value: p for p in Permeability}
 
 
 class PermeabilityMixin:
@@ -38,12 +41,10 @@ class PermeabilityMixin:
             return True
 
         # Fail-safe: ANY compartment that blocks external connections will block
-        for comp in comps1:
-            if not comp.get("allowExternalConnections", True):
-                return False
-        for comp in comps2:
-            if not comp.get("allowExternalConnections", True):
-                return False
+        if any(not comp.get("allowExternalConnections", True) for comp in comps1):
+            return False
+        if any(not comp.get("allowExternalConnections", True) for comp in comps2):
+            return False
 
         return True
 
@@ -72,12 +73,12 @@ class PermeabilityMixin:
         """
         # Check source memory allows outward flow
         from_mem_perm = self.get_memory_permeability(from_memory_id)
-        if from_mem_perm and not Permeability(from_mem_perm).allows_outward():
+        if from_mem_perm and not _PERM[from_mem_perm].allows_outward():
             return False
 
         # Check destination memory allows inward flow
         to_mem_perm = self.get_memory_permeability(to_memory_id)
-        if to_mem_perm and not Permeability(to_mem_perm).allows_inward():
+        if to_mem_perm and not _PERM[to_mem_perm].allows_inward():
             return False
 
         # Get ALL compartments for both memories
@@ -85,20 +86,16 @@ class PermeabilityMixin:
         to_comps = self.get_memory_compartments(to_memory_id)
 
         # Fail-safe: ALL source compartments must allow outward flow
-        for comp in from_comps:
-            perm = Permeability(comp.get("permeability", "open"))
-            if not perm.allows_outward():
-                return False
+        if any(not _PERM[comp.get("permeability", "open")].allows_outward() for comp in from_comps):
+            return False
 
         # Fail-safe: ALL destination compartments must allow inward flow
-        for comp in to_comps:
-            perm = Permeability(comp.get("permeability", "open"))
-            if not perm.allows_inward():
-                return False
+        if any(not _PERM[comp.get("permeability", "open")].allows_inward() for comp in to_comps):
+            return False
 
         # Check connection permeability (if provided)
         if connection_permeability:
-            conn_perm = Permeability(connection_permeability)
+            conn_perm = _PERM[connection_permeability]
             # Connection permeability is from perspective of the "owner" (first memory in link)
             # For data to flow from->to, we need the connection to allow that direction
             # This depends on which direction the connection was created
@@ -149,13 +146,24 @@ class PermeabilityMixin:
         for memory_id in memory_ids:
             query = """
             MATCH (m:Memory {id: $id})
-            SET m.permeability = $perm
+            SET m.permeability = $perm, m.permBits = $bits
             """
-            self._run_write(query, {"id": memory_id, "perm": permeability.value})
+            self._run_write(query, {"id": memory_id, "perm": permeability.value,
+                                    "bits": permeability.bits})
 
     def _filter_by_permeability(self, requester_memory_id: str, results: List[Dict]) -> List[Dict]:
         """Filter query results based on permeability rules.
 
+        List wrapper around _iter_permitted for callers that need every result.
+        """
+        return list(self._iter_permitted(requester_memory_id, results))
+
+    def _iter_permitted(self, requester_memory_id: str, results: List[Dict]) -> Iterator[Dict]:
+        """Yield the query results whose data may flow to the requester.
+
+        Rows are yielded lazily so top-k callers can stop early with
+        itertools.islice without materializing the full filtered list.
+
         Uses batched queries to fetch all permeability data at once instead of
         per-result queries. Data flows FROM each result TO the requester, so:
         - Source memory must allow OUTWARD flow
@@ -164,60 +172,58 @@ class PermeabilityMixin:
         - Requester memory must allow INWARD flow
         """
         if not results:
-            return results
+            return
 
         all_ids = [r["id"] for r in results] + [requester_memory_id]
 
-        # Batch query 1: get permeability for all involved memories
+        # Batch query 1: get permeability flag bits for all involved memories
         perm_query = """
         UNWIND $ids AS mid
         MATCH (m:Memory {id: mid})
-        RETURN m.id AS id, m.permeability AS permeability
+        RETURN m.id AS id, m.permBits AS bits
         """
-        perm_rows = self._run_query(perm_query, {"ids": all_ids})
-        mem_perms = {row["id"]: row["permeability"] for row in perm_rows}
+        perm_rows = self._run_query_iter(perm_query, {"ids": all_ids})
+        mem_bits = {row["id"]: row["bits"] for row in perm_rows}
 
         # Batch query 2: get compartments for all involved memories
         comp_query = """
         UNWIND $ids AS mid
         MATCH (m:Memory {id: mid})-[:IN_COMPARTMENT]->(c:Compartment)
-        RETURN m.id AS mem_id, c.permeability AS permeability
+        RETURN m.id AS mem_id, c.id AS comp_id, c.permeability AS permeability
         """
-        comp_rows = self._run_query(comp_query, {"ids": all_ids})
+        comp_rows = self._run_query_iter(comp_query, {"ids": all_ids})
         mem_comps: Dict[str, List[str]] = {}
+        comp_perms: Dict[str, str] = {}
         for row in comp_rows:
-            mem_comps.setdefault(row["mem_id"], []).append(row["permeability"])
+            mem_comps.setdefault(row["mem_id"], []).append(row["comp_id"])
+            comp_perms[row["comp_id"]] = row["permeability"]
+
+        # Evaluate each distinct compartment once; results typically share a
+        # handful of compartments, so per-result checks become dict lookups
+        comp_blocks_outward = {
+            cid: not _PERM[perm].allows_outward() for cid, perm in comp_perms.items()
+        }
 
         # Check requester can receive data (inward flow)
-        req_perm = mem_perms.get(requester_memory_id)
-        if req_perm and not Permeability(req_perm).allows_inward():
-            return []  # Requester blocks all inward flow
+        req_bits = mem_bits.get(requester_memory_id)
+        if req_bits is not None and not req_bits & _PERM_INWARD_BIT:
+            return  # Requester blocks all inward flow
 
         req_comps = mem_comps.get(requester_memory_id, [])
-        for cp in req_comps:
-            if not Permeability(cp).allows_inward():
-                return []  # A requester compartment blocks inward flow
+        if any(not _PERM[comp_perms[cid]].allows_inward() for cid in req_comps):
+            return  # A requester compartment blocks inward flow
 
         # Filter results: each source must allow outward flow
-        filtered = []
         for r in results:
             rid = r["id"]
 
             # Check source memory allows outward
-            src_perm = mem_perms.get(rid)
-            if src_perm and not Permeability(src_perm).allows_outward():
+            src_bits = mem_bits.get(rid)
+            if src_bits is not None and not src_bits & _PERM_OUTWARD_BIT:
                 continue
 
             # Check all source compartments allow outward
-            src_comps = mem_comps.get(rid, [])
-            blocked = False
-            for cp in src_comps:
-                if not Permeability(cp).allows_outward():
-                    blocked = True
-                    break
-            if blocked:
+            if any(comp_blocks_outward[cid] for cid in mem_comps.get(rid, ())):
                 continue
 
-            filtered.append(r)
-
-        return filtered
+            yield r
@@ -1,14 +1,120 @@
 """Plasticity configuration for brain-like learning behavior."""
 
-import math
-from typing import Optional, Dict, Any
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Optional, Dict, Any, List, Sequence, Tuple
+from dataclasses import dataclass, field, fields
 from enum import Enum
+from types import MappingProxyType
 
 from .enums import Curve
+from . import _plasticity_kernels as _kernels
 
+_CURVE_CODES = {
+    Curve.LINEAR: _kernels.CURVE_LINEAR,
+    Curve.EXPONENTIAL: _kernels.CURVE_EXPONENTIAL,
+    Curve.LOGARITHMIC: _kernels.CURVE_LOGARITHMIC,
+}
 
-@dataclass
+def _content_key(content: str) -> bytes:
+    """Compact digest used to key cached similarity scores."""
+    return blake2b(content.encode("utf-8"), digest_size=8).digest()
+
+
+def _memoize_similarity(fn, maxsize: int):
+    """Wrap a similarity function in an LRU cache keyed by ordered content digests."""
+    cache: "OrderedDict[tuple, float]" = OrderedDict()
+
+    def cached(content1: str, content2: str) -> float:
+        key = (_content_key(content1), _content_key(content2))
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        similarity = fn(content1, content2)
+        cache[key] = similarity
+        if len(cache) > maxsize:
+            cache.popitem(last=False)
+        return similarity
+
+    cached.__wrapped__ = fn
+    cached.cache_clear = cache.clear
+    return cached
+
+
+def _embedding_similarity(encode, maxsize: int):
+    """Build (pair_fn, batch_fn) scoring cosine similarity of cached embeddings.
+
+    Unit embeddings are kept in an LRU cache keyed by content digest, and
+    each call encodes all of its cache misses in a single encode() call.
+    """
+    cache: "OrderedDict[bytes, Any]" = OrderedDict()
+
+    def embed(contents: List[str]) -> list:
+        keys = [_content_key(c) for c in contents]
+        vectors = {}
+        missing = {}
+        for key, content in zip(keys, contents):
+            if key in cache:
+                cache.move_to_end(key)
+                vectors[key] = cache[key]
+            elif key not in missing:
+                missing[key] = content
+        if missing:
+            for key, vector in zip(missing, encode(list(missing.values()))):
+                vectors[key] = cache[key] = _kernels.unit_vector(vector)
+            while len(cache) > maxsize:
+                cache.popitem(last=False)
+        return [vectors[key] for key in keys]
+
+    def batch_fn(contents1: List[str], contents2: List[str]) -> List[float]:
+        vectors = embed(list(contents1) + list(contents2))
+        return _kernels.cosine_batch(vectors[:len(contents1)], vectors[len(contents1):])
+
+    def pair_fn(content1: str, content2: str) -> float:
+        return batch_fn([content1], [content2])[0]
+
+    pair_fn.cache_clear = batch_fn.cache_clear = cache.clear
+    return pair_fn, batch_fn
+
+
+# Preset overrides, read-only so presets can't drift between calls
+_AGGRESSIVE_LEARNING = MappingProxyType(dict(
+    learning_rate=1.0,
+    strengthen_amount=0.15,
+    hebbian_amount=0.1,
+    retrieval_amount=0.05,
+    decay_threshold=0.3,
+))
+_CONSERVATIVE_LEARNING = MappingProxyType(dict(
+    learning_rate=0.5,
+    curve=Curve.EXPONENTIAL,
+    decay_threshold=0.7,
+    prune_threshold=0.005,
+))
+_NO_PLASTICITY = MappingProxyType(dict(
+    learning_rate=0.0,
+    retrieval_strengthens=False,
+    retrieval_weakens_competitors=False,
+    auto_prune=False,
+))
+_HIGH_DECAY = MappingProxyType(dict(
+    decay_amount=0.1,
+    decay_threshold=0.7,
+    decay_all=True,
+    prune_threshold=0.05,
+    decay_half_life=0.05,
+))
+
+# Fields whose assignment invalidates PlasticityConfig's derived constants
+_CACHE_INPUTS = frozenset({"curve", "curve_steepness", "decay_curve", "decay_half_life"})
+# Fields whose assignment invalidates PlasticityConfig's per-context amount table
+_AMOUNT_INPUTS = frozenset({"learning_rate", "strengthen_amount", "weaken_amount",
+                            "hebbian_amount", "retrieval_amount", "decay_amount"})
+# Plasticity contexts that strengthen (the rest weaken)
+_INCREASE_CONTEXTS = frozenset({"strengthen", "hebbian", "retrieval"})
+
+
+@dataclass(slots=True)
 class PlasticityConfig:
     """
     Configuration for brain-like plasticity behavior.
@@ -51,6 +157,8 @@ class PlasticityConfig:
     # Should be a function(content1: str, content2: str) -> float (0-1)
     # Not serialized - must be set programmatically
     _semantic_similarity_fn: Optional[Any] = field(default=None, repr=False)
+    # Optional batch form: function(contents1: List[str], contents2: List[str]) -> List[float]
+    _semantic_similarity_batch_fn: Optional[Any] = field(default=None, repr=False)
 
     # === STRENGTH BOUNDS ===
     max_strength: float = 1.0         # Connection strength ceiling
@@ -81,6 +189,52 @@ class PlasticityConfig:
     # === HEBBIAN LEARNING ===
     hebbian_creates_connections: bool = True     # Create new links between co-accessed memories
 
+    # === DERIVED CONSTANTS ===
+    # Recomputed whenever curve/steepness/decay settings change (not serialized)
+    _curve_code: int = field(default=0, init=False, repr=False, compare=False)
+    _decay_curve_code: int = field(default=0, init=False, repr=False, compare=False)
+    _steepness: float = field(default=0.5, init=False, repr=False, compare=False)
+    _exponent: float = field(default=2.0, init=False, repr=False, compare=False)
+    _half_life_cycles: int = field(default=10, init=False, repr=False, compare=False)
+    _increase_fn: Any = field(default=None, init=False, repr=False, compare=False)
+    _decrease_fn: Any = field(default=None, init=False, repr=False, compare=False)
+    _decay_fn: Any = field(default=None, init=False, repr=False, compare=False)
+    # context -> (base amount * learning_rate, for_increase)
+    _amount_table: Dict[str, Tuple[float, bool]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._refresh_cache()
+        self._refresh_amounts()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        # Keep derived constants in sync when a curve knob changes after construction
+        if name in _CACHE_INPUTS and hasattr(self, "_half_life_cycles"):
+            self._refresh_cache()
+        elif name in _AMOUNT_INPUTS and hasattr(self, "_amount_table"):
+            self._refresh_amounts()
+
+    def _refresh_cache(self):
+        """Recompute constants derived from the curve and decay settings."""
+        self._curve_code = _CURVE_CODES[self.curve]
+        self._decay_curve_code = _CURVE_CODES[self.decay_curve]
+        self._steepness = _kernels.clamp_steepness(self.curve_steepness)
+        self._exponent = 1.0 / self._steepness
+        self._half_life_cycles = _kernels.half_life_cycles(self.decay_half_life)
+        # Curve functions specialized to the current settings
+        self._increase_fn = _kernels.curve_fn(self._curve_code, self._steepness, self._exponent, True)
+        self._decrease_fn = _kernels.curve_fn(self._curve_code, self._steepness, self._exponent, False)
+        self._decay_fn = _kernels.decay_fn(self._decay_curve_code, self._half_life_cycles)
+
+    def _refresh_amounts(self):
+        """Recompute the learning-rate-scaled base amount for each context."""
+        rate = self.learning_rate
+        self._amount_table = {
+            context: (self._context_amount(context) * rate, context in _INCREASE_CONTEXTS)
+            for context in ('strengthen', 'weaken', 'hebbian', 'retrieval', 'decay')
+        }
+
     def get_initial_strength(self, explicit: bool, content1: str = None, content2: str = None) -> float:
         """Calculate initial strength for a new connection.
 
@@ -95,25 +249,107 @@ class PlasticityConfig:
         base = self.initial_strength_explicit if explicit else self.initial_strength_implicit
 
         # Optionally boost with semantic similarity (can only increase, never decrease)
+        similarity = 0.0
         if self.use_semantic_similarity and self._semantic_similarity_fn and content1 and content2:
             try:
                 similarity = self._semantic_similarity_fn(content1, content2)
-                # Use similarity to scale the headroom between base and max
-                # e.g., base=0.5, max=1.0, similarity=0.8 -> 0.5 + (0.5 * 0.8) = 0.9
-                headroom = self.max_strength - base
-                base = base + (headroom * similarity)
             except Exception:
                 pass  # Fall back to base strength if similarity fails
 
-        return min(self.max_strength, max(self.min_strength, base))
+        return _kernels.boost_and_clamp(base, self.max_strength, self.min_strength, similarity)
+
+    def get_initial_strength_batch(self, explicit: Sequence[bool],
+                                   contents1: Sequence[str] = None,
+                                   contents2: Sequence[str] = None) -> List[float]:
+        """Calculate initial strengths for many new connections at once.
 
-    def set_semantic_similarity_fn(self, fn):
+        Same rules as get_initial_strength. If a batch similarity function is
+        set it is called once for all pairs; otherwise the per-pair function is
+        used. Pairs missing either content get no similarity boost.
+
+        Args:
+            explicit: Per connection, True for explicit and False for implicit
+            contents1: Optional contents of the first memory of each pair
+            contents2: Optional contents of the second memory of each pair
+
+        Returns:
+            Initial strength values (0-1), one per connection (an array if
+            explicit is a NumPy array)
+        """
+        bases = _kernels.initial_bases(explicit, self.initial_strength_explicit,
+                                       self.initial_strength_implicit)
+
+        similarities = [0.0] * len(bases)
+        if self.use_semantic_similarity and contents1 is not None and contents2 is not None:
+            indices = [i for i, (c1, c2) in enumerate(zip(contents1, contents2)) if c1 and c2]
+            scored = self._batch_similarities(
+                [contents1[i] for i in indices], [contents2[i] for i in indices])
+            for i, similarity in zip(indices, scored):
+                similarities[i] = similarity
+
+        return _kernels.boost_and_clamp_batch(bases, self.max_strength, self.min_strength, similarities)
+
+    def _batch_similarities(self, contents1: List[str], contents2: List[str]) -> List[float]:
+        """Similarity per content pair, 0.0 (no boost) where the callback fails."""
+        if not contents1:
+            return []
+        if self._semantic_similarity_batch_fn:
+            try:
+                return list(self._semantic_similarity_batch_fn(contents1, contents2))
+            except Exception:
+                return [0.0] * len(contents1)  # Fall back to base strengths
+        if not self._semantic_similarity_fn:
+            return [0.0] * len(contents1)
+        similarities = []
+        for c1, c2 in zip(contents1, contents2):
+            try:
+                similarities.append(self._semantic_similarity_fn(c1, c2))
+            except Exception:
+                similarities.append(0.0)
+        return similarities
+
+    def set_semantic_similarity_fn(self, fn, cache_size: int = 0):
         """Set the semantic similarity function.
 
+        With a positive cache_size the function is wrapped in an LRU cache
+        keyed by the ordered pair of content digests, so only use it for a
+        deterministic function.
+
         Args:
             fn: A callable(content1: str, content2: str) -> float (0-1)
+            cache_size: Maximum number of cached content pairs (0 disables caching)
         """
-        self._semantic_similarity_fn = fn
+        self._semantic_similarity_fn = _memoize_similarity(fn, cache_size) if fn and cache_size > 0 else fn
+
+    def set_semantic_similarity_batch_fn(self, fn):
+        """Set a batch semantic similarity function for get_initial_strength_batch.
+
+        Args:
+            fn: A callable(contents1: List[str], contents2: List[str]) -> List[float],
+                returning one 0-1 similarity per pair
+        """
+        self._semantic_similarity_batch_fn = fn
+
+    def set_embedding_fn(self, encode, cache_size: int = 10_000):
+        """Score semantic similarity as the cosine of cached content embeddings.
+
+        Replaces both similarity callbacks. Each distinct content is encoded
+        once and its unit vector kept in an LRU cache keyed by content digest;
+        a batch encodes all of its uncached contents in one encode() call.
+        Negative cosines count as 0 (no boost).
+
+        Args:
+            encode: A callable(contents: List[str]) -> sequence of vectors, one
+                per content (lists of floats or NumPy arrays)
+            cache_size: Maximum number of cached embeddings
+        """
+        pair_fn, batch_fn = _embedding_similarity(encode, cache_size)
+        self._semantic_similarity_fn = pair_fn
+        self._semantic_similarity_batch_fn = batch_fn
+
+    # Presets build a fresh instance from module-level overrides on each call.
+    # Configs are mutated at runtime (learning rate, similarity callbacks), so a
+    # shared instance would leak one client's changes into every other client.
 
     @classmethod
     def default(cls) -> "PlasticityConfig":
@@ -123,44 +359,22 @@ class PlasticityConfig:
     @classmethod
     def aggressive_learning(cls) -> "PlasticityConfig":
         """Fast learning with quick adaptation."""
-        return cls(
-            learning_rate=1.0,
-            strengthen_amount=0.15,
-            hebbian_amount=0.1,
-            retrieval_amount=0.05,
-            decay_threshold=0.3,
-        )
+        return cls(**_AGGRESSIVE_LEARNING)
 
     @classmethod
     def conservative_learning(cls) -> "PlasticityConfig":
         """Slow, stable learning with gradual changes."""
-        return cls(
-            learning_rate=0.5,
-            curve=Curve.EXPONENTIAL,
-            decay_threshold=0.7,
-            prune_threshold=0.005,
-        )
+        return cls(**_CONSERVATIVE_LEARNING)
 
     @classmethod
     def no_plasticity(cls) -> "PlasticityConfig":
         """Disable all automatic plasticity (manual operations only)."""
-        return cls(
-            learning_rate=0.0,
-            retrieval_strengthens=False,
-            retrieval_weakens_competitors=False,
-            auto_prune=False,
-        )
+        return cls(**_NO_PLASTICITY)
 
     @classmethod
     def high_decay(cls) -> "PlasticityConfig":
         """Aggressive forgetting for memory pressure scenarios."""
-        return cls(
-            decay_amount=0.1,
-            decay_threshold=0.7,
-            decay_all=True,
-            prune_threshold=0.05,
-            decay_half_life=0.05,
-        )
+        return cls(**_HIGH_DECAY)
 
     def _apply_curve(self, amount: float, current_strength: float, for_increase: bool) -> float:
         """Apply the plasticity curve to an amount.
@@ -173,32 +387,18 @@ class PlasticityConfig:
         Returns:
             Adjusted amount based on curve
         """
-        if self.curve == Curve.LINEAR:
-            return amount
-
-        # Convert 0-1 steepness to effective exponent (0.1 -> 10, 0.5 -> 2, 0.9 -> 1.1)
-        steepness = max(0.1, min(0.9, self.curve_steepness))
-        exponent = 1.0 / steepness
-
-        if self.curve == Curve.EXPONENTIAL:
-            # Exponential: faster changes near the starting point
-            if for_increase:
-                # Harder to strengthen already-strong connections
-                factor = 1.0 - (current_strength ** exponent)
-            else:
-                # Harder to weaken already-weak connections (symmetrical)
-                factor = current_strength ** exponent
-            return amount * max(0.1, factor)
-
-        # self.curve == Curve.LOGARITHMIC
-        # Logarithmic: slower changes near the starting point, faster near limits
-        if for_increase:
-            # Easier to strengthen already-strong connections
-            factor = (1.0 - steepness) + (current_strength * steepness)
-        else:
-            # Easier to weaken already-weak connections (symmetrical)
-            factor = steepness + ((1.0 - current_strength) * (1.0 - steepness))
-        return amount * factor
+        return (self._increase_fn if for_increase else self._decrease_fn)(amount, current_strength)
+
+    def _context_amount(self, context: str) -> float:
+        """Base amount for a plasticity context (0.1 for unknown contexts)."""
+        amounts = {
+            'strengthen': self.strengthen_amount,
+            'weaken': self.weaken_amount,
+            'hebbian': self.hebbian_amount,
+            'retrieval': self.retrieval_amount,
+            'decay': self.decay_amount,
+        }
+        return amounts.get(context, 0.1)
 
     def effective_amount(self, context: str, current_strength: float = 0.5) -> float:
         """Calculate effective plasticity amount for a given context.
@@ -210,18 +410,13 @@ class PlasticityConfig:
         Returns:
             Effective amount to apply (0-1 scale)
         """
-        amounts = {
-            'strengthen': self.strengthen_amount,
-            'weaken': self.weaken_amount,
-            'hebbian': self.hebbian_amount,
-            'retrieval': self.retrieval_amount,
-            'decay': self.decay_amount,
-        }
-        base = amounts.get(context, 0.1) * self.learning_rate
+        entry = self._amount_table.get(context)
+        if entry is None:
+            return self._decrease_fn(0.1 * self.learning_rate, current_strength)
 
         # Apply curve (for_increase=True for strengthen/hebbian/retrieval, False for weaken/decay)
-        for_increase = context in ('strengthen', 'hebbian', 'retrieval')
-        return self._apply_curve(base, current_strength, for_increase)
+        base, for_increase = entry
+        return (self._increase_fn if for_increase else self._decrease_fn)(base, current_strength)
 
     def effective_decay(self, current_strength: float, cycles: int = 1) -> float:
         """Calculate decay amount based on curve and cycles since access.
@@ -237,38 +432,94 @@ class PlasticityConfig:
             return 0.0
 
         base = self.decay_amount * self.learning_rate
+        return self._decay_fn(base, current_strength, cycles)
+
+    def effective_amount_batch(self, context: str, strengths: Sequence[float]) -> List[float]:
+        """Calculate effective plasticity amounts for many connection strengths.
+
+        Equivalent to calling effective_amount once per strength, but the
+        context lookup and curve constants are resolved once for the batch.
+
+        Args:
+            context: One of 'strengthen', 'weaken', 'hebbian', 'retrieval', 'decay'
+            strengths: Current connection strengths
+
+        Returns:
+            Effective amounts, one per input strength (an array if strengths is a NumPy array)
+        """
+        base, for_increase = self._amount_table.get(context) or (0.1 * self.learning_rate, False)
+        return _kernels.apply_curve_batch(self._curve_code, self._steepness, self._exponent,
+                                          base, strengths, for_increase)
+
+    def effective_decay_batch(self, strengths: Sequence[float], cycles: int = 1) -> List[float]:
+        """Calculate decay amounts for many connection strengths.
+
+        Equivalent to calling effective_decay once per strength with the same
+        cycle count; the exponential half-life factor is computed once.
+
+        Args:
+            strengths: Current connection strengths
+            cycles: Number of decay cycles elapsed
+
+        Returns:
+            Amounts to decay, one per input strength (an array if strengths is a NumPy array)
+        """
+        return self.apply_decay_batch(strengths, self.decay_factor(cycles))
+
+    def decay_factor(self, cycles: int = 1) -> float:
+        """Decay constant for one tick of `cycles` cycles.
+
+        Compute this once per tick and pass it to apply_decay_batch for every
+        batch of strengths, keeping the pow/log1p out of per-edge work.
+
+        Args:
+            cycles: Number of decay cycles elapsed
+
+        Returns:
+            Fraction of strength removed (exponential decay) or absolute
+            amount removed (linear/logarithmic decay)
+        """
+        base = self.decay_amount * self.learning_rate
+        return _kernels.decay_factor(self._decay_curve_code, base, self._half_life_cycles, cycles)
+
+    def apply_decay_batch(self, strengths: Sequence[float], factor: float) -> List[float]:
+        """Calculate decay amounts for many strengths from a precomputed decay_factor.
+
+        Args:
+            strengths: Current connection strengths
+            factor: Value returned by decay_factor for this tick
 
-        if self.decay_curve == Curve.LINEAR:
-            return min(1.0, base * cycles)
-        elif self.decay_curve == Curve.EXPONENTIAL:
-            # Convert 0-1 half_life to effective cycles (0.1 = 10 cycles, 0.5 = 50 cycles)
-            effective_half_life = max(1, int(self.decay_half_life * 100))
-            return current_strength * (1.0 - (0.5 ** (cycles / effective_half_life)))
-        else:  # Curve.LOGARITHMIC
-            return min(1.0, base * math.log1p(cycles))
+        Returns:
+            Amounts to decay, one per input strength (an array if strengths is a NumPy array)
+        """
+        return _kernels.apply_decay_factor_batch(
+            self._decay_curve_code, factor, strengths, self.decay_threshold, self.decay_all)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert config to dictionary for serialization."""
-        result = {}
-        for key, value in self.__dict__.items():
-            if key.startswith('_'):
-                continue
-            if isinstance(value, Enum):
-                result[key] = value.value
-            else:
-                result[key] = value
+        result = {name: getattr(self, name) for name in _PUBLIC_FIELDS}
+        for name in _ENUM_FIELDS:
+            result[name] = result[name].value
         return result
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "PlasticityConfig":
-        """Create config from dictionary."""
+        """Create config from dictionary. The input dictionary is not modified."""
+        # Internal fields (leading underscore) are never part of serialized data
+        kwargs = {k: v for k, v in data.items() if not k.startswith('_')}
+
         # Convert enum strings back to enums
-        if "decay_curve" in data and isinstance(data["decay_curve"], str):
-            data["decay_curve"] = Curve(data["decay_curve"])
-        if "curve" in data and isinstance(data["curve"], str):
-            data["curve"] = Curve(data["curve"])
+        for name in _ENUM_FIELDS:
+            value = kwargs.get(name)
+            if isinstance(value, str):
+                # Unknown names fall through to Curve() for its ValueError
+                kwargs[name] = _CURVE_FROM_STR.get(value) or Curve(value)
+
+        return cls(**kwargs)
 
-        # Remove internal fields that shouldn't be in serialized data
-        data.pop('_semantic_similarity_fn', None)
 
-        return cls(**data)
+# Serialized field layout, resolved once instead of on every to_dict call
+_PUBLIC_FIELDS = tuple(f.name for f in fields(PlasticityConfig) if not f.name.startswith('_'))
+_ENUM_FIELDS = tuple(f.name for f in fields(PlasticityConfig)
+                     if f.name in _PUBLIC_FIELDS and isinstance(f.default, Enum))
+_CURVE_FROM_STR = {c.value: c for c in Curve}
@@ -6,6 +6,7 @@ normal user/LLM interactions.
 """
 
 import json
+from datetime import datetime
 import pytest
 
 from axons import (
@@ -16,7 +17,7 @@ from axons import (
     EntityType, SourceType, GoalStatus, QuestionStatus,
     ContextType, ContextStatus, TemporalType, ContradictionStatus,
     PlasticityConfig, Curve, Permeability,
-    quick_store_memory,
+    quick_store_memory, bulk_store_memories,
 )
 
 
@@ -35,6 +36,35 @@ class TestConnectionAndSchema:
         client.initialize_schema()
         assert client._schema_initialized
 
+    def test_schema_creates_missing_tables_only(self, tmp_path):
+        """A partially created schema is completed on the next initialization."""
+        db_path = str(tmp_path / "partial_schema")
+        c = MemoryGraphClient(db_path=db_path)
+        c.conn.execute("CREATE NODE TABLE Concept (id STRING PRIMARY KEY, name STRING, "
+                       "description STRING, created STRING)")
+        c.initialize_schema()
+        tables = {r["name"] for r in c._run_query("CALL show_tables() RETURN name")}
+        assert {"Memory", "Concept", "Compartment", "RELATES_TO", "SUPERSEDES"} <= tables
+        c.close()
+
+    def test_schema_stamp_skips_reinitialization(self, tmp_path, monkeypatch):
+        """A reopened database stamped with the current version skips DDL."""
+        db_path = str(tmp_path / "stamped_db")
+        c = MemoryGraphClient(db_path=db_path)
+        c.initialize_schema()
+        c.close()
+
+        c = MemoryGraphClient(db_path=db_path)
+        executed = []
+        original = c._run_schema_write
+        monkeypatch.setattr(c, "_run_schema_write", lambda q: executed.append(q) or original(q))
+        c.initialize_schema()
+        assert c._schema_initialized
+        assert not any("CREATE" in q or "ALTER" in q for q in executed)
+        mid = c.create_memory(Memory(content="after reopen", summary="reopen"))
+        assert c.get_memory(mid, apply_retrieval_effects=False) is not None
+        c.close()
+
     def test_close_sets_flag(self, tmp_path):
         """close() sets _closed flag and clears connection."""
         c = MemoryGraphClient(db_path=str(tmp_path / "close_test"))
@@ -73,6 +103,49 @@ class TestNodeCRUD:
         assert result["summary"] == "Test summary"
         assert result["confidence"] == 0.9
 
+    def test_memory_make_shares_timestamp(self):
+        """Memory.make uses one injected timestamp for created and last_accessed."""
+        now = datetime(2025, 1, 1, 12, 0, 0)
+        memories = [Memory.make(f"content {i}", f"summary {i}", now=now) for i in range(3)]
+        assert all(m.created == now and m.last_accessed == now for m in memories)
+        m = Memory.make("content", "summary", confidence=0.5)
+        assert m.created == m.last_accessed
+        assert m.confidence == 0.5
+
+    def test_memory_last_accessed_defaults_to_created(self):
+        """A new Memory reads the clock once; last_accessed mirrors created."""
+        m = Memory(content="content", summary="summary")
+        assert m.last_accessed is m.created
+        earlier = datetime(2024, 6, 1)
+        m = Memory(content="content", summary="summary", last_accessed=earlier)
+        assert m.last_accessed == earlier
+
+    def test_low_cardinality_strings_interned(self):
+        """Repeated categories and references share one string object."""
+        cat1, cat2 = "".join(["fo", "od"]), "".join(["f", "ood"])
+        assert cat1 is not cat2
+        p1 = Preference(category=cat1, preference="pizza")
+        p2 = Preference(category=cat2, preference="sushi")
+        assert p1.category is p2.category
+        ref1, ref2 = "".join(["docs/", "a.md"]), "".join(["docs", "/a.md"])
+        s1 = Source(type=SourceType.FILE, reference=ref1)
+        s2 = Source(type=SourceType.FILE, reference=ref2)
+        assert s1.reference is s2.reference
+
+        class Tag(str):
+            pass
+        p3 = Preference(category=Tag("food"), preference="ramen")
+        assert type(p3.category) is Tag  # Subclasses are kept as-is, not interned
+
+    def test_generated_ids_are_unique_uuid4(self):
+        """Pooled ID generation yields distinct, well-formed UUID4 strings."""
+        import uuid
+        ids = [Memory(content="c", summary="s").id for _ in range(2500)]
+        assert len(set(ids)) == len(ids)
+        for i in ids[:50]:
+            assert uuid.UUID(i).version == 4
+            assert str(uuid.UUID(i)) == i
+
     def test_create_concept(self, client):
         c = Concept(name="machine learning", description="ML field")
         cid = client.create_concept(c)
@@ -86,6 +159,33 @@ class TestNodeCRUD:
         id2 = client.create_concept(c2)
         assert id1 == id2
 
+    def test_create_concept_lookup_cache_survives_rollback(self, client):
+        """Cached concept IDs are dropped when the transaction that created them rolls back."""
+        client.begin_transaction()
+        rolled_back = client.create_concept(Concept(name="ephemeral"))
+        client.rollback()
+        c = Concept(name="ephemeral")
+        assert client.create_concept(c) == c.id != rolled_back
+        assert client.create_concept(Concept(name="ephemeral")) == c.id
+        assert client.get_node_counts()["Concept"] == 1
+
+    def test_create_concept_lookup_index_eviction(self, client, monkeypatch):
+        """Once the cached concept index overflows, lookups fall back to the database."""
+        import axons.client as client_module
+        monkeypatch.setattr(client_module, "_LOOKUP_CACHE_SIZE", 12)
+        first = client.create_concept(Concept(name="c0"))
+        assert "Concept" in client._indexed_labels
+        for i in range(1, 14):
+            client.create_concept(Concept(name=f"c{i}"))
+        assert "Concept" not in client._indexed_labels
+        assert client.create_concept(Concept(name="c0")) == first
+        assert client.get_node_counts()["Concept"] == 14
+        mid = client.create_memory(Memory(content="evicted", summary="evicted"))
+        client.link_memory_to_concept(mid, first)
+        client._lookup_ids.clear()
+        assert [m["id"] for m in client.get_memories_by_concept("c0")] == [mid]
+        assert client.get_memories_by_concept("missing") == []
+
     def test_create_keyword(self, client):
         k = Keyword(term="pytest")
         kid = client.create_keyword(k)
@@ -309,6 +409,75 @@ class TestRelationships:
         results = client.get_memories_by_keyword("unique")
         assert len(results) == 1  # Only one memory, not duplicated via double edge
 
+    def test_create_memories_batch(self, client):
+        """create_memories writes every memory in one call and honors compartments."""
+        cid = client.create_compartment(Compartment(name="Bulk"))
+        memories = [Memory(content=f"bulk {i}", summary=f"bulk {i}") for i in range(5)]
+        ids = client.create_memories(memories, compartment_id=cid)
+        assert ids == [m.id for m in memories]
+        assert client.get_node_counts()["Memory"] == 5
+        assert len(client.get_memories_in_compartment(cid)) == 5
+        assert client.create_memories([]) == []
+
+    def test_link_memories_batch(self, client):
+        """link_memories_batch creates each link once with its own strength."""
+        ids = client.create_memories([Memory(content=f"m{i}", summary=f"m{i}") for i in range(3)])
+        links = [(ids[0], ids[1], 0.4), (ids[1], ids[2], 0.7)]
+        client.link_memories_batch(links, rel_type="bulk")
+        client.link_memories_batch(links)  # MERGE: no duplicates
+        assert client.get_memory_link_strength(ids[0], ids[1]) == pytest.approx(0.4)
+        assert client.get_memory_link_strength(ids[1], ids[2]) == pytest.approx(0.7)
+        assert client.get_connection_statistics()["count"] == 2
+        with pytest.raises(ValueError):
+            client.link_memories_batch([(ids[0], ids[2], 1.5)])
+
+    def test_run_query_arrow(self, client):
+        """_run_query_arrow returns the same rows as _run_query, column-wise."""
+        pytest.importorskip("pyarrow")
+        client.create_memories([Memory(content=f"a{i}", summary=f"a{i}") for i in range(3)])
+        query = "MATCH (m:Memory) RETURN m.content AS content ORDER BY m.content"
+        table = client._run_query_arrow(query)
+        assert table.column_names == ["content"]
+        assert table.to_pylist() == client._run_query(query)
+
+    def test_link_memory_to_concepts_batch(self, client):
+        """Batch concept links are created once each, even for repeated IDs."""
+        mid = client.create_memory(Memory(content="batch", summary="batch"))
+        cids = [client.create_concept(Concept(name=name)) for name in ("AI", "ML")]
+        client.link_memory_to_concepts_batch(mid, cids + cids[:1], relevance=0.6)
+        client.link_memory_to_concepts_batch(mid, cids)  # MERGE: no duplicates
+        assert len(client._run_query(
+            "MATCH (m:Memory {id: $id})-[r:HAS_CONCEPT]->() RETURN r.relevance AS relevance",
+            {"id": mid})) == 2
+        assert any(r["id"] == mid for r in client.get_memories_by_concept("ML"))
+        with pytest.raises(ValueError):
+            client.link_memory_to_concepts_batch(mid, cids, relevance=1.5)
+
+    def test_create_concepts_batch(self, client):
+        """Batch creation reuses existing and repeated names, keeping input order."""
+        existing = client.create_concept(Concept(name="AI"))
+        ids = client.create_concepts([Concept(name=n) for n in ("ML", "AI", "ML", "NLP")])
+        assert ids[1] == existing
+        assert ids[0] == ids[2]
+        assert len(set(ids)) == 3
+        assert client.create_concepts([Concept(name="NLP")]) == [ids[3]]
+        assert client.create_concepts([]) == []
+
+    def test_create_sources_and_contexts_batch(self, client):
+        """Sources and contexts dedupe on their compound keys in batch form."""
+        existing = client.create_source(Source(type=SourceType.URL, reference="https://a"))
+        ids = client.create_sources([
+            Source(type=SourceType.URL, reference="https://a"),
+            Source(type=SourceType.FILE, reference="https://a"),
+            Source(type=SourceType.FILE, reference="https://a"),
+        ])
+        assert ids[0] == existing
+        assert ids[1] == ids[2] != existing
+        project = Context(name="Axons", type=ContextType.PROJECT)
+        context_ids = client.create_contexts([project, Context(name="Axons", type=ContextType.PROJECT)])
+        assert context_ids == [project.id, project.id]
+        assert client.create_context(Context(name="Axons", type=ContextType.PROJECT)) == project.id
+
 
 # ============================================================================
 # QUERIES & SEARCH
@@ -332,6 +501,12 @@ class TestQueriesAndSearch:
         result2 = populated_client.get_memory(mid, apply_retrieval_effects=False)
         assert result2["accessCount"] == count1 + 1
 
+    def test_get_memory_records_supplied_timestamp(self, populated_client):
+        mid = populated_client._test_data["memory_ids"][0]
+        now = datetime(2030, 1, 2, 3, 4, 5)
+        result = populated_client.get_memory(mid, apply_retrieval_effects=False, now=now)
+        assert result["lastAccessed"] == now.isoformat()
+
     def test_get_memory_nonexistent(self, client):
         result = client.get_memory("nonexistent-uuid", apply_retrieval_effects=False)
         assert result is None
@@ -366,6 +541,11 @@ class TestQueriesAndSearch:
         questions = populated_client.get_open_questions()
         assert len(questions) >= 1
 
+    def test_get_open_questions_includes_partial(self, client):
+        for status in (QuestionStatus.OPEN, QuestionStatus.PARTIAL, QuestionStatus.ANSWERED):
+            client.create_question(Question(text=status.value, status=status))
+        assert sorted(q["status"] for q in client.get_open_questions()) == ["open", "partial"]
+
     def test_get_decision_chain(self, populated_client):
         """Decision chain returns related decisions."""
         d1 = populated_client.create_decision(Decision(description="Step 1", rationale="R"))
@@ -373,6 +553,11 @@ class TestQueriesAndSearch:
         populated_client.link_decisions(d1, d2)
         chain = populated_client.get_decision_chain(d2)
         assert any(c["relation"] == "predecessor" for c in chain)
+        d3 = populated_client.create_decision(Decision(description="Step 3", rationale="R"))
+        populated_client.link_decisions(d2, d3)
+        chain = populated_client.get_decision_chain(d2)
+        assert sorted((c["id"], c["relation"]) for c in chain) == sorted(
+            [(d1, "predecessor"), (d3, "successor")])
 
     def test_get_unresolved_contradictions(self, populated_client):
         m1 = quick_store_memory(populated_client, "A is true", "Claim A")
@@ -391,6 +576,16 @@ class TestQueriesAndSearch:
         assert len(prefs) == 2
         assert prefs[0]["strength"] > prefs[1]["strength"]  # Sorted by strength DESC
 
+    def test_get_preferences_filters_by_strength(self, client):
+        client.create_preference(Preference(category="coding", preference="Prefer Python", strength=0.9))
+        client.create_preference(Preference(category="coding", preference="Avoid Java", strength=-0.5))
+        client.create_preference(Preference(category="editor", preference="Use Vim", strength=0.75))
+        strong = client.get_preferences(min_strength=0.7)
+        assert [p["preference"] for p in strong] == ["Prefer Python", "Use Vim"]
+        assert len(client.get_preferences(min_strength=0.7, limit=1)) == 1
+        coding = client.get_preferences_by_category("coding", min_strength=0.0)
+        assert [p["preference"] for p in coding] == ["Prefer Python"]
+
     def test_get_node_counts(self, populated_client):
         counts = populated_client.get_node_counts()
         assert counts["Memory"] >= 3
@@ -403,6 +598,81 @@ class TestQueriesAndSearch:
         assert "## Node Counts" in md
         assert "**Memory**" in md
 
+    def test_get_all_nodes_summary(self, populated_client):
+        """The one-scan summary keeps per-type columns and matches the counts."""
+        summary = populated_client.get_all_nodes_summary()
+        counts = populated_client.get_node_counts()
+        assert {k: len(v) for k, v in summary.items()} == counts
+        assert set(summary["Keyword"][0]) == {"id", "term", "created"}
+        assert set(summary["Goal"][0]) == {"id", "description", "status", "priority", "created"}
+        subset = populated_client.get_all_nodes_summary(("Goal", "Keyword"))
+        assert subset == {"Goal": summary["Goal"], "Keyword": summary["Keyword"]}
+        with pytest.raises(ValueError):
+            populated_client.get_all_nodes_summary(("Nope",))
+
+    def test_get_all_nodes_summary_accepts_any_iterable(self, populated_client, monkeypatch):
+        """Lists, keywords and any order resolve to one cached summary."""
+        executed = self._count_executions(populated_client, monkeypatch)
+        subset = populated_client.get_all_nodes_summary(node_types=["Keyword", "Goal"])
+        assert list(subset) == ["Keyword", "Goal"]
+        assert populated_client.get_all_nodes_summary(["Goal", "Keyword", "Goal"]) == subset
+        assert populated_client.get_all_nodes_summary(node_types={"Goal", "Keyword"}) == subset
+        assert len(executed) == 1
+        assert populated_client.get_all_nodes_summary([]) == {}
+
+    def test_get_all_nodes_summary_arrow_matches_rows(self, populated_client, monkeypatch):
+        """The Arrow and row-by-row summary paths return identical results."""
+        pytest.importorskip("pyarrow")
+        import axons.client as client_module
+        populated_client.create_compartment(Compartment(name="arrow", allow_external_connections=False))
+        monkeypatch.setattr(client_module, "_HAVE_PYARROW", True)
+        columnar = populated_client.get_all_nodes_summary()
+        populated_client._read_cache.clear()
+        monkeypatch.setattr(client_module, "_HAVE_PYARROW", False)
+        assert populated_client.get_all_nodes_summary() == columnar
+
+    @staticmethod
+    def _count_executions(client, monkeypatch):
+        executed = []
+        original = client._execute
+        monkeypatch.setattr(client, "_execute",
+                            lambda q, p: executed.append(q) or original(q, p))
+        return executed
+
+    def test_node_counts_cached_until_write(self, client, monkeypatch):
+        """Counts are served from cache until any write, including rollbacks."""
+        client.create_memory(Memory(content="one", summary="one"))
+        executed = self._count_executions(client, monkeypatch)
+        assert client.get_node_counts() == client.get_node_counts()
+        assert len(executed) == 1
+        client.create_concept(Concept(name="fresh"))
+        assert client.get_node_counts()["Concept"] == 1
+        client._run_query("MATCH (c:Concept) SET c.description = 'raw'")
+        del executed[:]
+        client.get_node_counts()
+        assert len(executed) == 1
+        client.begin_transaction()
+        client.create_memory(Memory(content="two", summary="two"))
+        assert client.get_node_counts()["Memory"] == 2
+        client.rollback()
+        assert client.get_node_counts()["Memory"] == 1
+
+    def test_cached_reads_bind_keywords_and_return_copies(self, client, monkeypatch):
+        """Keyword and default calls share a cache entry; mutating a result leaves the cache intact."""
+        client.create_memory(Memory(content="one", summary="one"))
+        executed = self._count_executions(client, monkeypatch)
+        summary = client.get_all_nodes_summary()
+        assert client.get_all_nodes_summary(None) == summary
+        assert client.get_all_nodes_summary(node_types=None) == summary
+        assert len(executed) == 1
+        summary["Memory"][0]["summary"] = "changed"
+        summary["Memory"].clear()
+        assert client.get_all_nodes_summary()["Memory"][0]["summary"] == "one"
+        counts = client.get_node_counts()
+        counts["Memory"] = 999
+        assert client.get_node_counts()["Memory"] == 1
+        assert len(executed) == 2
+
 
 # ============================================================================
 # RETRIEVAL EFFECTS
@@ -463,6 +733,22 @@ class TestPlasticity:
         client.weaken_memory_link(m1, m2)
         assert client.get_memory_link_strength(m1, m2) < 0.5
 
+    def test_link_plasticity_skips_strength_read_when_unused(self, client, monkeypatch):
+        """Explicit amounts and disabled plasticity never read the current strength."""
+        m1 = quick_store_memory(client, "A", "A")
+        m2 = quick_store_memory(client, "B", "B")
+        client.link_memories(m1, m2, strength=0.5)
+        reads = []
+        original = client.get_memory_link_strength
+        monkeypatch.setattr(client, "get_memory_link_strength",
+                            lambda *ids: reads.append(ids) or original(*ids))
+        client.strengthen_memory_link(m1, m2, amount=0.1)
+        client.set_plasticity_config(PlasticityConfig.no_plasticity())
+        client.strengthen_memory_link(m1, m2)
+        client.weaken_memory_link(m1, m2)
+        assert reads == []
+        assert original(m1, m2) == pytest.approx(0.6)
+
     def test_strength_bounds_enforced(self, client):
         """Strength should never exceed max or go below min."""
         config = PlasticityConfig(max_strength=0.9, min_strength=0.1)
@@ -502,6 +788,20 @@ class TestPlasticity:
         client.decay_weak_connections(threshold=0.5, decay_amount=0.1)
         assert client.get_memory_link_strength(m1, m2) == pytest.approx(0.1)
 
+    def test_decay_prunes_in_same_pass(self, client):
+        """Edges decayed to the prune threshold are removed; others survive."""
+        m1 = quick_store_memory(client, "A", "A")
+        m2 = quick_store_memory(client, "B", "B")
+        m3 = quick_store_memory(client, "C", "C")
+        m4 = quick_store_memory(client, "D", "D")
+        client.link_memories(m1, m2, strength=0.05)
+        client.link_memories(m1, m3, strength=0.3)
+        client.link_memories(m1, m4, strength=0.9)
+        client.decay_weak_connections(threshold=0.5, decay_amount=0.1)
+        assert client.get_memory_link_strength(m1, m2) is None
+        assert client.get_memory_link_strength(m1, m3) == pytest.approx(0.2)
+        assert client.get_memory_link_strength(m1, m4) == pytest.approx(0.9)
+
     def test_prune_dead_connections(self, client):
         m1 = quick_store_memory(client, "A", "A")
         m2 = quick_store_memory(client, "B", "B")
@@ -509,6 +809,18 @@ class TestPlasticity:
         client.prune_dead_connections(min_strength=0.05)
         assert client.get_memory_link_strength(m1, m2) is None
 
+    def test_deferred_prune_sweeps_in_batches(self, client):
+        """Decay can skip pruning; a later batched sweep removes every dead edge."""
+        hub = quick_store_memory(client, "hub", "hub")
+        for i in range(5):
+            client.link_memories(hub, quick_store_memory(client, f"m{i}", f"m{i}"), strength=0.05)
+        client.decay_weak_connections(threshold=0.5, decay_amount=0.1, prune=False)
+        assert client.count_prunable_connections() == 5
+        assert client.prune_dead_connections(batch_size=2) == 5
+        assert client.count_prunable_connections() == 0
+        with pytest.raises(ValueError):
+            client.prune_dead_connections(batch_size=0)
+
     def test_maintenance_cycle(self, client):
         """run_maintenance_cycle increments cycle counter and decays."""
         m1 = quick_store_memory(client, "A", "A")
@@ -529,6 +841,107 @@ class TestPlasticity:
         assert amt_lin == pytest.approx(0.1)
         assert amt_exp != amt_lin  # Different from linear
 
+    def test_boost_and_clamp_kernels(self):
+        """Similarity boost kernels match the documented headroom formula."""
+        from axons import _plasticity_kernels as kernels
+        assert kernels.boost_and_clamp(0.5, 1.0, 0.0, 0.8) == pytest.approx(0.9)
+        assert kernels.boost_and_clamp(0.5, 0.7, 0.0, 1.0) == pytest.approx(0.7)
+        assert kernels.boost_and_clamp(0.05, 1.0, 0.1, 0.0) == pytest.approx(0.1)
+        assert kernels.boost_and_clamp_batch([0.5, 0.3], 1.0, 0.0, [0.8, 0.0]) == \
+            pytest.approx([0.9, 0.3])
+
+    def test_plasticity_kernels_match_config_methods(self):
+        """Primitive kernels agree with the PlasticityConfig wrappers."""
+        from axons import _plasticity_kernels as kernels
+        from axons.plasticity import _CURVE_CODES
+        for curve in Curve:
+            cfg = PlasticityConfig(curve=curve, decay_curve=curve, decay_all=True)
+            code = _CURVE_CODES[curve]
+            assert cfg._apply_curve(0.1, 0.7, True) == kernels.apply_curve(
+                code, 0.5, 2.0, 0.1, 0.7, True)
+            assert cfg.effective_decay(0.4, cycles=3) == kernels.effective_decay(
+                code, cfg.decay_amount, 10, 0.4, 3)
+
+    def test_specialized_curve_functions_follow_config_changes(self):
+        """The per-config curve functions are rebuilt when a curve input changes."""
+        from axons import _plasticity_kernels as kernels
+        from axons.plasticity import _CURVE_CODES
+        cfg = PlasticityConfig(decay_all=True)
+        for curve in Curve:
+            cfg.curve = curve
+            cfg.decay_curve = curve
+            cfg.curve_steepness = 0.3
+            code = _CURVE_CODES[curve]
+            for strength in (0.0, 0.25, 0.9, 1.0):
+                for for_increase in (True, False):
+                    assert cfg._apply_curve(0.1, strength, for_increase) == pytest.approx(
+                        kernels.apply_curve(code, 0.3, cfg._exponent, 0.1, strength, for_increase))
+                assert cfg.effective_decay(strength, cycles=4) == pytest.approx(
+                    kernels.effective_decay(code, cfg.decay_amount, cfg._half_life_cycles, strength, 4))
+
+    def test_effective_amount_follows_amount_changes(self):
+        """The per-context amount table is rebuilt when an amount or the rate changes."""
+        cfg = PlasticityConfig(curve=Curve.LINEAR)
+        assert cfg.effective_amount("hebbian") == pytest.approx(cfg.hebbian_amount)
+        cfg.hebbian_amount = 0.3
+        cfg.learning_rate = 0.5
+        assert cfg.effective_amount("hebbian") == pytest.approx(0.15)
+        assert cfg.effective_amount("unknown") == pytest.approx(0.05)
+        assert cfg.effective_amount_batch("hebbian", [0.2]) == pytest.approx([0.15])
+
+    def test_batch_plasticity_accepts_numpy_arrays(self):
+        """NumPy strengths take the vectorized path and match the list results."""
+        np = pytest.importorskip("numpy")
+        strengths = [0.0, 0.2, 0.45, 0.7, 1.0]
+        for curve in Curve:
+            for decay_all in (False, True):
+                cfg = PlasticityConfig(curve=curve, decay_curve=curve, decay_threshold=0.5,
+                                       decay_all=decay_all)
+                for context in ("strengthen", "weaken"):
+                    amounts = cfg.effective_amount_batch(context, np.array(strengths))
+                    assert isinstance(amounts, np.ndarray)
+                    assert amounts.tolist() == pytest.approx(cfg.effective_amount_batch(context, strengths))
+                decays = cfg.effective_decay_batch(np.array(strengths), cycles=4)
+                assert isinstance(decays, np.ndarray)
+                assert decays.tolist() == pytest.approx(cfg.effective_decay_batch(strengths, cycles=4))
+
+    def test_initial_strength_batch_accepts_numpy_flags(self):
+        """A NumPy array of explicit flags gives an array matching the list path."""
+        np = pytest.importorskip("numpy")
+        cfg = PlasticityConfig(use_semantic_similarity=True, max_strength=0.9)
+        cfg.set_semantic_similarity_batch_fn(lambda left, right: [0.5] * len(left))
+        flags = [True, False, True]
+        contents1, contents2 = ["a", "b", None], ["c", "d", None]
+        strengths = cfg.get_initial_strength_batch(np.array(flags), contents1, contents2)
+        assert isinstance(strengths, np.ndarray)
+        assert strengths.tolist() == pytest.approx(
+            cfg.get_initial_strength_batch(flags, contents1, contents2))
+
+    def test_derived_constants_follow_mutation(self):
+        """Changing curve settings after construction refreshes cached constants."""
+        cfg = PlasticityConfig(curve=Curve.LINEAR)
+        assert cfg.effective_amount("strengthen", 0.9) == pytest.approx(0.1)
+        cfg.curve = Curve.EXPONENTIAL
+        cfg.curve_steepness = 0.25
+        assert cfg.effective_amount("strengthen", 0.9) == pytest.approx(0.1 * (1 - 0.9 ** 4))
+        cfg.decay_half_life = 0.5
+        assert cfg.effective_decay(0.4, cycles=50) == pytest.approx(0.2)
+        assert "_exponent" not in cfg.to_dict()
+
+    def test_batch_plasticity_matches_scalar(self):
+        """Batch amount/decay methods agree with per-strength calls."""
+        strengths = [0.0, 0.2, 0.45, 0.7, 1.0]
+        for curve in Curve:
+            cfg = PlasticityConfig(curve=curve, decay_curve=curve, decay_threshold=0.5)
+            for context in ("strengthen", "weaken"):
+                assert cfg.effective_amount_batch(context, strengths) == pytest.approx(
+                    [cfg.effective_amount(context, s) for s in strengths])
+            assert cfg.effective_decay_batch(strengths, cycles=4) == pytest.approx(
+                [cfg.effective_decay(s, cycles=4) for s in strengths])
+            factor = cfg.decay_factor(cycles=4)
+            assert cfg.apply_decay_batch(strengths, factor) == pytest.approx(
+                [cfg.effective_decay(s, cycles=4) for s in strengths])
+
     def test_learning_rate_zero_disables(self, client):
         """learning_rate=0 should disable all plasticity operations."""
         config = PlasticityConfig(learning_rate=0.0)
@@ -545,6 +958,16 @@ class TestPlasticity:
         assert PlasticityConfig.no_plasticity().learning_rate == 0.0
         assert PlasticityConfig.high_decay().decay_all is True
 
+    def test_presets_are_independent_instances(self):
+        """Mutating a preset config does not affect later preset calls."""
+        first = PlasticityConfig.conservative_learning()
+        first.learning_rate = 0.1
+        first.curve = Curve.LINEAR
+        second = PlasticityConfig.conservative_learning()
+        assert second.learning_rate == 0.5
+        assert second.curve == Curve.EXPONENTIAL
+        assert second._curve_code == 1
+
     def test_connection_statistics(self, client):
         m1 = quick_store_memory(client, "A", "A")
         m2 = quick_store_memory(client, "B", "B")
@@ -595,6 +1018,18 @@ class TestCompartments:
         client.add_memory_to_compartment(mid, cid)
         client.delete_compartment(cid, reassign_memories=True)
         assert client.get_compartment(cid) is None
+        assert client.get_memory(mid, apply_retrieval_effects=False) is not None
+        assert client.get_memory_compartments(mid) == []
+
+    def test_compartment_name_cache_follows_deletes(self, client):
+        """Names resolve from the lookup cache and are freed when the compartment is deleted."""
+        cid = client.create_compartment(Compartment(name="Reused"))
+        assert client.create_compartment(Compartment(name="Reused")) == cid
+        client.delete_compartment(cid)
+        assert client.get_compartment_by_name("Reused") is None
+        replacement = Compartment(name="Reused")
+        assert client.create_compartment(replacement) == replacement.id != cid
+        assert client.get_compartment_by_name("Reused")["id"] == replacement.id
 
     def test_delete_compartment_fails_with_memories(self, client):
         comp = Compartment(name="Protected")
@@ -692,6 +1127,34 @@ class TestPermeability:
         assert client.get_memory_permeability(m1) == "closed"
         assert not client.can_data_flow(m1, m2)
 
+    def test_memory_permeability_bits(self, client):
+        """permBits mirrors the permeability string on create and update."""
+        assert [p.bits for p in Permeability] == [3, 0, 2, 1]
+        m = Memory(content="bits", summary="bits", permeability=Permeability.OSMOTIC_OUTWARD)
+        mid = client.create_memory(m)
+        row = client._run_query("MATCH (m:Memory {id: $id}) RETURN m.permBits AS bits", {"id": mid})
+        assert row[0]["bits"] == 1
+        client.set_memory_permeability(mid, Permeability.OSMOTIC_INWARD)
+        row = client._run_query("MATCH (m:Memory {id: $id}) RETURN m.permBits AS bits", {"id": mid})
+        assert row[0]["bits"] == 2
+
+    def test_permeability_bits_backfilled_on_schema_init(self, tmp_path):
+        """Memories missing permBits are backfilled from the permeability string."""
+        db_path = str(tmp_path / "backfill_db")
+        c = MemoryGraphClient(db_path=db_path)
+        c.initialize_schema()
+        mid = c.create_memory(Memory(content="old", summary="old", permeability=Permeability.CLOSED))
+        c._run_write("MATCH (m:Memory {id: $id}) SET m.permBits = NULL", {"id": mid})
+        # Databases from before permBits also predate the schema stamp
+        c._run_write("MATCH (s:AxonsSchema) DELETE s")
+        c.close()
+
+        c = MemoryGraphClient(db_path=db_path)
+        c.initialize_schema()
+        row = c._run_query("MATCH (m:Memory {id: $id}) RETURN m.permBits AS bits", {"id": mid})
+        assert row[0]["bits"] == 0
+        c.close()
+
     def test_connection_permeability(self, client):
         m1 = quick_store_memory(client, "A", "A")
         m2 = quick_store_memory(client, "B", "B")
@@ -806,6 +1269,7 @@ class TestDelete:
         counts = client.get_node_counts()
         assert counts["Memory"] == 0
         assert counts["Concept"] == 0
+        assert client._read_schema_stamp() is not None
 
 
 # ============================================================================
@@ -828,12 +1292,29 @@ class TestSerialization:
         assert restored.curve == Curve.EXPONENTIAL
         assert restored.decay_all is True
 
+    def test_plasticity_config_dict_covers_all_fields(self):
+        config = PlasticityConfig(decay_curve=Curve.LOGARITHMIC)
+        d = config.to_dict()
+        assert d["decay_curve"] == "logarithmic"
+        assert d["curve"] == config.curve.value
+        assert PlasticityConfig.from_dict(d).to_dict() == d
+        assert d["curve"] == config.curve.value  # input left untouched
+        with pytest.raises(ValueError):
+            PlasticityConfig.from_dict({"curve": "not-a-curve"})
+
     def test_plasticity_config_excludes_private_fields(self):
         config = PlasticityConfig()
         config.set_semantic_similarity_fn(lambda a, b: 0.5)
         d = config.to_dict()
         assert "_semantic_similarity_fn" not in d
 
+    def test_slotted_dataclasses(self):
+        """Config and node dataclasses use __slots__ and reject unknown attributes."""
+        for obj in (PlasticityConfig(), Memory(content="c", summary="s"), Concept(name="n")):
+            assert not hasattr(obj, "__dict__")
+            with pytest.raises(AttributeError):
+                obj.not_a_field = 1
+
     def test_save_load_plasticity_config(self, client, tmp_path):
         config = PlasticityConfig(learning_rate=0.42, decay_all=True)
         client.set_plasticity_config(config)
@@ -864,6 +1345,60 @@ class TestTransactions:
         assert client.get_memory(mid, apply_retrieval_effects=False) is not None
         assert len(client.get_memories_by_keyword("atomic")) == 1
 
+    def test_transaction_context_manager(self, client):
+        """transaction() commits on success and rolls back when the block raises."""
+        kept = Memory(content="kept", summary="kept")
+        with client.transaction():
+            client.create_memory(kept)
+        dropped = Memory(content="dropped", summary="dropped")
+        with pytest.raises(RuntimeError, match="abort"):
+            with client.transaction():
+                client.create_memory(dropped)
+                raise RuntimeError("abort")
+        assert client.get_memory(kept.id, apply_retrieval_effects=False) is not None
+        assert client.get_memory(dropped.id, apply_retrieval_effects=False) is None
+
+    def test_transaction_failed_commit_discards_state(self, client, monkeypatch):
+        """A failing COMMIT rolls back and forgets lookup IDs and cached reads from the block."""
+        def failing_commit():
+            raise RuntimeError("commit failed")
+        monkeypatch.setattr(client, "commit", failing_commit)
+        with pytest.raises(RuntimeError, match="commit failed"):
+            with client.transaction():
+                ghost = client.create_concept(Concept(name="ghost"))
+                assert client.get_node_counts()["Concept"] == 1
+        assert client.get_node_counts()["Concept"] == 0
+        assert ("Concept", "ghost") not in client._lookup_ids
+        replacement = Concept(name="ghost")
+        assert client.create_concept(replacement) == replacement.id != ghost
+        assert client.get_node_counts()["Concept"] == 1
+
+    def test_nested_transaction_joins_outer(self, client):
+        """quick_store_memory inside transaction() rolls back with the outer block."""
+        with pytest.raises(RuntimeError, match="abort"):
+            with client.transaction():
+                quick_store_memory(client, "nested", "nested", concepts=["inner"])
+                raise RuntimeError("abort")
+        assert client.get_node_counts()["Memory"] == 0
+        assert client.create_concept(Concept(name="inner"))  # Lookup cache was reset
+
+    def test_bulk_store_memories(self, client):
+        """Bulk store keeps input order and commits each batch separately."""
+        items = [{"content": f"bulk {i}", "summary": f"bulk {i}", "concepts": ["bulk"]}
+                 for i in range(5)]
+        ids = bulk_store_memories(client, items, batch_commit_every=2)
+        assert [client.get_memory(i, apply_retrieval_effects=False)["summary"] for i in ids] == \
+            [f"bulk {i}" for i in range(5)]
+        assert client.get_node_counts()["Concept"] == 1
+        with pytest.raises(ValueError):
+            bulk_store_memories(client, [{"content": "ok", "summary": "ok"},
+                                         {"content": "ok2", "summary": "ok2"},
+                                         {"content": "bad", "summary": "bad", "confidence": 2.0}],
+                                batch_commit_every=2)
+        assert client.get_node_counts()["Memory"] == 7  # First batch committed
+        with pytest.raises(ValueError):
+            bulk_store_memories(client, items, batch_commit_every=0)
+
 
 # ============================================================================
 # LLM-SPECIFIC MEMORY SCENARIOS
@@ -1142,6 +1677,28 @@ class TestCoverageGaps:
         filtered = client._filter_by_permeability(m2, [{"id": m1}])
         assert filtered == []
 
+    def test_filter_permeability_shared_compartments(self, client):
+        """Results sharing compartments are filtered per compartment, not per result."""
+        open_cid = client.create_compartment(Compartment(name="SharedOpen"))
+        closed_cid = client.create_compartment(
+            Compartment(name="SharedClosed", permeability=Permeability.CLOSED))
+        open_ids = [quick_store_memory(client, f"open {i}", f"open {i}") for i in range(3)]
+        closed_ids = [quick_store_memory(client, f"closed {i}", f"closed {i}") for i in range(3)]
+        client.add_memory_to_compartment(open_ids + closed_ids, open_cid)
+        client.add_memory_to_compartment(closed_ids, closed_cid)
+        req = quick_store_memory(client, "req", "req")
+        filtered = client._filter_by_permeability(req, [{"id": i} for i in open_ids + closed_ids])
+        assert [r["id"] for r in filtered] == open_ids
+
+    def test_iter_permitted_streams_results(self, client):
+        """_iter_permitted yields permitted rows lazily for top-k callers."""
+        from itertools import islice
+        ids = [quick_store_memory(client, f"row {i}", f"row {i}") for i in range(4)]
+        client.set_memory_permeability(ids[1], Permeability.CLOSED)
+        req = quick_store_memory(client, "req", "req")
+        rows = client._iter_permitted(req, [{"id": i} for i in ids])
+        assert [r["id"] for r in islice(rows, 2)] == [ids[0], ids[2]]
+
     def test_filter_empty_results(self, client):
         """_filter_by_permeability with empty list returns empty list."""
         result = client._filter_by_permeability("any_id", [])
@@ -1336,6 +1893,15 @@ class TestCoverageGaps:
         related = client.get_related_memories(m1, respect_permeability=False)
         assert any(r["id"] == m2 for r in related)
 
+    def test_related_memories_ranks_topic_results_last(self, client):
+        """Topic-only matches are included after concept matches."""
+        m1 = quick_store_memory(client, "A", "A", concepts=["shared"], topics=["broad"])
+        m2 = quick_store_memory(client, "B", "B", topics=["broad"])
+        m3 = quick_store_memory(client, "C", "C", concepts=["shared"], topics=["broad"])
+        related = client.get_related_memories(m1, respect_permeability=False)
+        assert [r["id"] for r in related] == [m3, m2]
+        assert "tier" not in related[0]
+
     def test_hebbian_blocked_by_compartment(self, client):
         """Hebbian learning skips connections blocked by compartment rules."""
         comp = Compartment(name="HebBlock", allow_external_connections=False)
@@ -1389,6 +1955,27 @@ class TestCoverageGaps:
         assert not c._fts_available
         c.close()
 
+    def test_schema_init_reuses_existing_fts_index(self, tmp_path, monkeypatch):
+        """Re-initialization keeps an existing FTS index instead of recreating it."""
+        c = MemoryGraphClient(db_path=str(tmp_path / "fts_reinit_db"))
+        original_write, original_iter = c._run_schema_write, c._run_query_iter
+        fts_calls = []
+        def fake_schema_write(query):
+            if "fts" in query.lower():
+                fts_calls.append(query)
+                return None
+            return original_write(query)
+        def fake_query_iter(query, parameters=None):
+            if "SHOW_INDEXES" in query:
+                return iter([{"name": "memory_fts"}])
+            return original_iter(query, parameters)
+        monkeypatch.setattr(c, "_run_schema_write", fake_schema_write)
+        monkeypatch.setattr(c, "_run_query_iter", fake_query_iter)
+        c.initialize_schema()
+        assert c._fts_available
+        assert not any("CREATE_FTS_INDEX" in q for q in fts_calls)
+        c.close()
+
     # --- Related memories keyword deduplication ---
 
     def test_related_memories_keyword_dedup(self, client):
@@ -1428,6 +2015,60 @@ class TestCoverageGaps:
         strength = config.get_initial_strength(True, "content A", "content B")
         assert strength > 0.5  # Boosted by similarity
 
+    def test_semantic_similarity_memoized(self):
+        """Similarity callback is memoized per ordered content pair only when asked."""
+        calls = []
+        def similarity(a, b):
+            calls.append((a, b))
+            return 0.8
+        config = PlasticityConfig(use_semantic_similarity=True)
+        config.set_semantic_similarity_fn(similarity)
+        config.get_initial_strength(True, "x", "y")
+        config.get_initial_strength(True, "x", "y")
+        assert len(calls) == 2  # Not cached by default
+
+        calls.clear()
+        config.set_semantic_similarity_fn(similarity, cache_size=10)
+        for c1, c2 in [("x", "y"), ("y", "x"), ("x", "y"), ("x", "z")]:
+            assert config.get_initial_strength(True, c1, c2) == pytest.approx(0.9)
+        assert calls == [("x", "y"), ("y", "x"), ("x", "z")]
+
+    def test_initial_strength_batch(self):
+        """Batch initial strengths match the scalar path and use the batch callback once."""
+        config = PlasticityConfig(use_semantic_similarity=True)
+        config.set_semantic_similarity_fn(lambda a, b: 0.8)
+        expected = [config.get_initial_strength(True, "a", "b"),
+                    config.get_initial_strength(False, "a", "b"),
+                    config.get_initial_strength(False)]
+        assert config.get_initial_strength_batch(
+            [True, False, False], ["a", "a", None], ["b", "b", None]) == pytest.approx(expected)
+
+        calls = []
+        def batch_fn(c1, c2):
+            calls.append(len(c1))
+            return [0.8] * len(c1)
+        config.set_semantic_similarity_batch_fn(batch_fn)
+        assert config.get_initial_strength_batch(
+            [True, False, False], ["a", "a", None], ["b", "b", None]) == pytest.approx(expected)
+        assert calls == [2]
+
+    def test_embedding_similarity_encodes_each_content_once(self):
+        """Embeddings are cached per content and cache misses encoded in one call."""
+        vectors = {"a": [1.0, 0.0], "b": [3.0, 4.0], "c": [-1.0, 0.0]}
+        calls = []
+        def encode(contents):
+            calls.append(list(contents))
+            return [vectors[c] for c in contents]
+        config = PlasticityConfig(use_semantic_similarity=True, initial_strength_explicit=0.5)
+        config.set_embedding_fn(encode)
+        strengths = config.get_initial_strength_batch(
+            [True, True, True], ["a", "a", "a"], ["b", "a", "c"])
+        # cos(a, b) = 0.6; cos(a, a) = 1; cos(a, c) = -1 -> no boost
+        assert strengths == pytest.approx([0.8, 1.0, 0.5])
+        assert calls == [["a", "b", "c"]]
+        assert config.get_initial_strength(True, "b", "a") == pytest.approx(0.8)
+        assert len(calls) == 1
+
     def test_semantic_similarity_exception_fallback(self):
         """Semantic similarity function error falls back to base strength."""
         config = PlasticityConfig(use_semantic_similarity=True)
@@ -1501,6 +2142,17 @@ class TestCoverageGaps:
         client.remove_memory_from_compartment(mid)  # No compartment_id = remove from all
         assert len(client.get_memory_compartments(mid)) == 0
 
+    def test_remove_memories_from_one_compartment(self, client):
+        c1 = client.create_compartment(Compartment(name="X"))
+        c2 = client.create_compartment(Compartment(name="Y"))
+        m1 = quick_store_memory(client, "A", "A")
+        m2 = quick_store_memory(client, "B", "B")
+        client.add_memory_to_compartment([m1, m2], c1)
+        client.add_memory_to_compartment([m1, m2], c2)
+        client.remove_memory_from_compartment([m1, m2], c1)
+        assert client.get_memories_in_compartment(c1) == []
+        assert len(client.get_memories_in_compartment(c2)) == 2
+
     def test_get_memories_in_compartment(self, client):
         cid = client.create_compartment(Compartment(name="Group"))
         m1 = quick_store_memory(client, "A", "A")